@@ -0,0 +1,167 @@
+"""Measure the throughput of Entities.update on synthetic games of growing size
+
+Run from the root of the project, after installing it:
+
+    python benchmarks/entities_update.py --output after.json --compare before.json
+"""
+import json
+import platform
+import random
+import time
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+from typing import Dict, Any, List, Optional
+
+from tower_defense.block import Block
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.monster.monsters import monster_factory
+from tower_defense.core.tower.default import TOWER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.path import extract_path
+
+# The monsters never die, so that the size of the game stays the same
+_MONSTER_STATS = [
+    MonsterStats(name=f"Benchmark{speed}", max_health=10**9, value=1, speed=speed)
+    for speed in (0.5, 1.0, 2.0)
+]
+_PATH_LENGTH = 2000
+_TIMESTEP = 50
+
+
+def build_entities(
+    monster_count: int, monster_engine: str = "objects", seed: int = 0
+) -> Entities:
+    """Build a game with monsters spread along a straight path, between towers
+
+    There is one tower for every 100 monsters, and about one projectile in flight
+    for every 10 monsters, each shot at a monster next to its tower.
+    """
+    rng = random.Random(seed)
+    path = extract_path(Grid([[Block(is_walkable=True)] * _PATH_LENGTH]))
+    factories = [monster_factory(stats) for stats in _MONSTER_STATS]
+    entities: Entities
+    if monster_engine == "arrays":
+        from tower_defense.core.array_entities import ArrayEntities
+
+        entities = ArrayEntities(_path=path, _monster_stats=_MONSTER_STATS)
+    else:
+        entities = Entities(_path=path, _monster_factories=factories)
+    # Leave the monsters enough room to never reach the end of the path
+    for _ in range(monster_count):
+        entities.spawn_monster(rng.randrange(len(factories)))
+    for monster in entities.monsters:
+        monster.distance_travelled_ = rng.uniform(0.0, _PATH_LENGTH / 2)
+        monster.update_position(path, 0)
+    entities.player.money = 10**12
+    tower_factories = list(TOWER_MAPPING.values())
+    tower_count = max(monster_count // 100, 1)
+    for index in range(tower_count):
+        x, y = path[int(index * (_PATH_LENGTH / 2) / tower_count)]
+        tower_factory = tower_factories[index % len(tower_factories)]
+        # On either side of the path, which is the column x = 0
+        entities.try_build_tower(tower_factory, (x + 1 if index % 2 else x - 1, y))
+    monsters = list(entities.monsters)
+    towers = list(entities.towers.values())
+    projectile_count = monster_count // 10
+    for index, target in enumerate(rng.sample(monsters, projectile_count)):
+        if len(entities.projectiles) >= projectile_count:
+            # Some towers shoot several projectiles at once
+            break
+        tower = towers[index % len(towers)]
+        # Moved within the range of the tower, so that the tower can shoot it
+        _, y = tower.get_position()
+        target.distance_travelled_ = max(y + rng.uniform(-1.0, 1.0), 0.0)
+        target.update_position(path, 0)
+        tower.set_target(target)
+        tower.reload()
+        entities.projectiles.update(tower.shoot())
+        # Left as built: loaded, without a target
+        tower.set_target(None)
+        tower.reload()
+    return entities
+
+
+def run_benchmark(entities: Entities, ticks: int) -> Dict[str, Any]:
+    # The first tick fills the caches, like the range intervals of the towers
+    entities.update(_TIMESTEP)
+    phases_ns: Dict[str, int] = {name: 0 for name, _ in entities.get_phases()}
+    phase_start = start = time.perf_counter_ns()
+
+    def record_phase(name: str) -> None:
+        nonlocal phase_start
+        phase_end = time.perf_counter_ns()
+        phases_ns[name] += phase_end - phase_start
+        phase_start = phase_end
+
+    for _ in range(ticks):
+        phase_start = time.perf_counter_ns()
+        entities.update(_TIMESTEP, record_phase)
+    elapsed_s = (time.perf_counter_ns() - start) / 1e9
+    return {
+        "ticks": ticks,
+        "ticks_per_second": ticks / elapsed_s,
+        "phases_us": {name: ns / ticks / 1000 for name, ns in phases_ns.items()},
+    }
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]]) -> None:
+    by_size = {result["monsters"]: result for result in baseline}
+    for result in results:
+        reference = by_size.get(result["monsters"])
+        if reference is None:
+            continue
+        ratio = result["ticks_per_second"] / reference["ticks_per_second"]
+        print(f"{result['monsters']:>7} monsters: {ratio:.2f}x ticks/s vs baseline")
+        for name, us in result["phases_us"].items():
+            reference_us = reference["phases_us"].get(name)
+            if reference_us:
+                print(f"    {name:<22}{us:>12.1f} us ({us / reference_us:.2f}x)")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
+    parser.add_argument(
+        "--sizes",
+        help="Numbers of monsters to benchmark",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1_000, 10_000, 100_000],
+    )
+    parser.add_argument("--ticks", help="Ticks per size", type=int, default=20)
+    parser.add_argument(
+        "--monster-engine", choices=["objects", "arrays"], default="objects"
+    )
+    parser.add_argument("-o", "--output", help="JSON file receiving the results")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare to")
+    args = parser.parse_args(argv)
+    results = []
+    for size in args.sizes:
+        entities = build_entities(size, args.monster_engine)
+        result = {
+            "monsters": size,
+            "towers": len(entities.towers),
+            "projectiles": len(entities.projectiles),
+            **run_benchmark(entities, args.ticks),
+        }
+        results.append(result)
+        print(
+            f"{size:>7} monsters: {result['ticks_per_second']:>10.1f} ticks/s",
+            flush=True,
+        )
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "monster_engine": args.monster_engine,
+        "timestep": _TIMESTEP,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            compare(results, json.load(baseline_file)["results"])
+
+
+if __name__ == "__main__":
+    main()
@@ -9,11 +9,13 @@ setup(
         "tower_defense.views": "tkinter_view = tower_defense.view.view_launcher[tk]",
         "console_scripts": [
             "TowerDefense=tower_defense.scripts.game:main",
+            "TowerDefenseBatch=tower_defense.scripts.batch:main",
         ],
     },
     install_requires=[],
     extras_require={
         "tk": ["tk", "Pillow"],
+        "numpy": ["numpy"],
         "dev": [
             "pytest",
             "black",
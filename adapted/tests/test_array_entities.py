@@ -0,0 +1,117 @@
+import random
+from typing import List, Tuple
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from tower_defense.block import Block
+from tower_defense.core.array_entities import ArrayEntities
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.monster.monsters import monster_factory
+from tower_defense.core.spatial_hash import SpatialHash
+from tower_defense.core.tower.targeting_index import (
+    LaneTargetingIndex,
+    PathTargetingIndex,
+)
+from tower_defense.grid import Grid
+from tower_defense.interfaces.targeting_strategies import (
+    TargetingStrategy,
+    SortingParam,
+)
+from tower_defense.path import extract_lanes
+
+_MONSTER_STATS = [
+    MonsterStats(name="Fast", max_health=30, value=5, speed=10),
+    MonsterStats(name="Slow", max_health=50, value=10, speed=3.33, damage=2),
+]
+
+
+_W, _C = Block(is_walkable=True), Block()
+_LINE = Grid([[_W] * 8])
+# Two lanes around a ring
+_FORK = Grid([[_C, _W, _W, _W, _C], [_W, _W, _C, _W, _W], [_C, _W, _W, _W, _C]])
+
+
+def _build_entities(grid: Grid = _LINE) -> Tuple[Entities, ArrayEntities]:
+    lanes = extract_lanes(grid)
+    factories = [monster_factory(stats) for stats in _MONSTER_STATS]
+    return (
+        Entities(_monster_factories=factories, rng=random.Random(0), _lanes=lanes),
+        ArrayEntities(
+            _monster_stats=_MONSTER_STATS,
+            rng=random.Random(0),
+            _lanes=lanes,
+        ),
+    )
+
+
+def _state(entities: Entities) -> List[Tuple[str, int, float, Tuple[float, float]]]:
+    return sorted(
+        (m.get_model_name(), m.health_, m.distance_travelled_, m.get_position())
+        for m in entities.monsters
+    )
+
+
+@pytest.mark.parametrize("grid", [_LINE, _FORK])
+def test_array_entities_evolve_like_entities(grid: Grid) -> None:
+    entities, array_entities = _build_entities(grid)
+    for tick in range(40):
+        for current in (entities, array_entities):
+            if tick % 3 == 0:
+                current.spawn_monster(tick % 2)
+            for monster in current.monsters:
+                if monster.distance_travelled_ > 2:
+                    monster.slow_down(3.0, 0.1)
+                if monster.distance_travelled_ > 4:
+                    monster.inflict_damage(7)
+            current.update(30)
+        assert _state(array_entities) == _state(entities)
+        assert array_entities.player == entities.player
+
+
+@pytest.mark.parametrize("grid", [_LINE, _FORK])
+def test_indexes_rebuilt_from_the_arrays_match_the_ones_built_from_monsters(
+    grid: Grid,
+) -> None:
+    _, array_entities = _build_entities(grid)
+    for tick in range(12):
+        array_entities.spawn_monster(tick % 2)
+        array_entities.update(100)
+    monsters = array_entities.monsters
+    lanes = array_entities.get_lanes()
+    reference_index = (
+        PathTargetingIndex(lanes[0]) if len(lanes) == 1 else LaneTargetingIndex(lanes)
+    )
+    reference_index.rebuild(monsters)
+    reference_hash: SpatialHash = SpatialHash()
+    reference_hash.rebuild(monsters)
+
+    array_entities._rebuild_targeting_index()
+    array_entities._rebuild_monster_hash()
+
+    index, monster_hash = array_entities._targeting_index, array_entities._monster_hash
+    for key in SortingParam:
+        for reverse in (False, True):
+            strategy = TargetingStrategy(key, reverse)
+            for center in [(0.0, 0.0), (1.0, 2.0), (2.0, 3.5)]:
+                assert list(index.query(center, 1.5, strategy)) == list(
+                    reference_index.query(center, 1.5, strategy)
+                )
+    for center in [(0.0, 0.0), (1.0, 2.0), (2.0, 3.5)]:
+        assert list(monster_hash.query(center, 0.5)) == list(
+            reference_hash.query(center, 0.5)
+        )
+
+
+def test_removed_array_monster_keeps_its_last_state() -> None:
+    _, array_entities = _build_entities()
+    array_entities.spawn_monster(0)
+    (monster,) = array_entities.monsters
+    monster.inflict_damage(100)
+    array_entities.update(50)
+    assert len(array_entities.monsters) == 0
+    array_entities.spawn_monster(1)
+    assert monster.is_dead()
+    assert monster.get_model_name() == "Fast"
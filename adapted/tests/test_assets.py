@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip("PIL")
+
+from tower_defense.view.assets import AssetRegistry, build_manifest
+
+
+def test_build_manifest_lists_the_sprites_of_every_kind() -> None:
+    manifest = build_manifest()
+
+    assert "images/blockImages/PathBlock.png" in manifest
+    assert "images/monsterImages/Monster1.png" in manifest
+    assert "images/towerImages/TackTower/1.png" in manifest
+    assert "images/projectileImages/arrow.png" in manifest
+    assert all(path.endswith(".png") for path in manifest)
+
+
+def test_preload_given_a_manifest_decodes_each_image_once() -> None:
+    manifest = build_manifest()
+    registry = AssetRegistry()
+
+    registry.preload(manifest, max_workers=4)
+
+    assert len(registry) == len(manifest)
+    image = registry.get_image(manifest[0])
+    assert image.size != (0, 0)
+    assert registry.get_image(manifest[0]) is image
+
+
+def test_get_image_given_a_path_out_of_the_manifest_decodes_it() -> None:
+    registry = AssetRegistry()
+
+    image = registry.get_image("images/mouseImages/Pressed.png")
+
+    assert registry.get_image("images/mouseImages/Pressed.png") is image
+    assert len(registry) == 1
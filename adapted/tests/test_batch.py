@@ -0,0 +1,103 @@
+from pathlib import Path
+from typing import Dict, Any
+
+import pytest
+
+from tower_defense.batch import (
+    BatchJob,
+    BatchResult,
+    aggregate,
+    generate_layout,
+    run_batch,
+    run_job,
+)
+from tower_defense.block import Block
+from tower_defense.grid import Grid
+
+
+# The maps and the scenarios are loaded relative to the root of the project
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def in_project_root(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(_PROJECT_ROOT)
+
+
+def _job(seed: int) -> BatchJob:
+    return BatchJob(
+        map_name="LeoMap",
+        scenario="WaveGenerator",
+        layout_index=0,
+        tower_count=3,
+        seed=seed,
+        timestep=50,
+        max_ticks=40,
+    )
+
+
+def _outcome(result: BatchResult) -> Dict[str, Any]:
+    # Everything but the wall time, which changes from one run to the next
+    outcome = result.to_dict()
+    del outcome["wall_time_s"]
+    return outcome
+
+
+def _result(layout_index: int, seed: int, player_health: int) -> BatchResult:
+    return BatchResult(
+        map_name="map",
+        scenario="scenario",
+        layout_index=layout_index,
+        seed=seed,
+        towers_built=2,
+        ticks=100,
+        wall_time_s=0.5,
+        waves_finished=True,
+        player_health=player_health,
+        player_money=10,
+    )
+
+
+def test_generate_layout_given_the_same_layout_index_returns_the_same_towers() -> None:
+    w, c = Block(is_walkable=True), Block(is_constructible=True)
+    grid = Grid([[w, c, c], [c, w, c], [c, c, w]])
+
+    layout = generate_layout(grid, layout_index=3, tower_count=4)
+
+    assert layout == generate_layout(grid, layout_index=3, tower_count=4)
+    assert len({position for _, position in layout}) == 4
+    assert all(grid.get_block(position).is_constructible for _, position in layout)
+
+
+def test_aggregate_given_several_seeds_summarizes_each_layout() -> None:
+    results = [_result(1, 0, 50), _result(0, 0, 0), _result(0, 1, 20)]
+
+    rows = aggregate(results)
+
+    assert [row["layout_index"] for row in rows] == [0, 1]
+    assert rows[0]["runs"] == 2
+    assert rows[0]["survival_rate"] == 0.5
+    assert rows[0]["mean_player_health"] == 10
+
+
+@pytest.mark.usefixtures("in_project_root")
+def test_run_job_given_a_bundled_map_plays_the_same_game_for_the_same_seed() -> None:
+    result = run_job(_job(seed=1))
+
+    assert result.map_name == "LeoMap"
+    assert result.seed == 1
+    assert 0 < result.towers_built <= 3
+    assert result.ticks == 40
+    assert result.waves_finished is False
+    assert _outcome(run_job(_job(seed=1))) == _outcome(result)
+
+
+@pytest.mark.usefixtures("in_project_root")
+def test_run_batch_given_one_worker_returns_the_result_of_every_job() -> None:
+    jobs = [_job(seed=0), _job(seed=1)]
+
+    results = list(run_batch(jobs, max_workers=1))
+
+    assert sorted(map(_outcome, results), key=lambda outcome: outcome["seed"]) == [
+        _outcome(run_job(job)) for job in jobs
+    ]
@@ -0,0 +1,172 @@
+import random
+from typing import List
+
+import pytest
+
+from tower_defense.block import Block
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.monster.monsters import Monster, monster_factory
+from tower_defense.core.tower.default import TOWER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.path import extract_path, extract_lanes
+from tower_defense.player import Player
+
+_STILL_MONSTER = MonsterStats(name="Still", max_health=10**6, value=0, speed=0)
+
+
+def _build_entities() -> Entities:
+    w = Block(is_walkable=True)
+    return Entities(
+        _path=extract_path(Grid([[w] * 4])),
+        _monster_factories=[monster_factory(_STILL_MONSTER)],
+        player=Player(money=10**6),
+    )
+
+
+def test_update_given_a_tower_in_range_shoots_once_per_reload_time() -> None:
+    entities = _build_entities()
+    entities.spawn_monster(0)
+    entities.try_build_tower(TOWER_MAPPING["Bullet Shooter"], (1, 0))
+    tower = entities.towers[(1, 0)]
+    shot_times: List[int] = []
+    shoot = tower.shoot
+
+    def spy_shoot():
+        projectiles = list(shoot())
+        if projectiles:
+            shot_times.append(entities.time)
+        return projectiles
+
+    tower.shoot = spy_shoot  # type: ignore[assignment]
+
+    for _ in range(11):
+        entities.update(50)
+
+    assert tower.get_reload_time() == 250
+    assert shot_times == [0, 250, 500]
+
+
+def test_update_given_a_reloading_tower_drops_its_dead_target() -> None:
+    entities = _build_entities()
+    monster = entities.spawn_monster(0)
+    entities.try_build_tower(TOWER_MAPPING["Bullet Shooter"], (1, 0))
+    tower = entities.towers[(1, 0)]
+    entities.update(50)
+    assert not tower.is_loaded() and tower.get_target() is monster
+
+    monster.inflict_damage(monster.health_)
+    entities.update(50)
+
+    assert not tower.is_loaded() and tower.get_target() is None
+
+
+def test_sell_tower_given_a_reloading_tower_cancels_its_reload() -> None:
+    entities = _build_entities()
+    entities.spawn_monster(0)
+    entities.try_build_tower(TOWER_MAPPING["Bullet Shooter"], (1, 0))
+    entities.update(50)
+    assert len(entities.tower_reloads) == 1
+
+    entities.sell_tower((1, 0))
+
+    assert len(entities.tower_reloads) == 0
+
+
+def test_update_given_an_expired_slow_effect_restores_the_monster_speed() -> None:
+    entities = _build_entities()
+    monster = Monster(MonsterStats(name="Walker", max_health=10, value=0, speed=1))
+    entities.monsters.add(monster)
+    monster.slow_down(2, 0.1)
+    entities.slow_expiries.schedule(monster.pop_slow_duration(), monster)
+
+    distances = []
+    for _ in range(3):
+        entities.update(50)
+        distances.append(monster.distance_travelled_)
+
+    assert distances == [0.025, 0.05, 0.1]
+
+
+def _play_respawns(seed: int) -> List[float]:
+    w = Block(is_walkable=True)
+    child = MonsterStats(name="Child", max_health=10, value=0, speed=1)
+    parent = MonsterStats(
+        name="Parent", max_health=10, value=0, speed=1, respawn_indices=[1, 1, 1]
+    )
+    entities = Entities(
+        _path=extract_path(Grid([[w] * 4])),
+        _monster_factories=[monster_factory(parent), monster_factory(child)],
+        rng=random.Random(seed),
+    )
+    for _ in range(3):
+        entities.spawn_monster(0).inflict_damage(10)
+    entities.update(50)
+    return [monster.distance_travelled_ for monster in entities.monsters]
+
+
+def test_update_given_the_same_seed_respawns_the_children_identically() -> None:
+    distances = _play_respawns(seed=7)
+
+    assert len(distances) == 9
+    assert _play_respawns(seed=7) == distances
+    assert _play_respawns(seed=8) != distances
+
+
+def test_update_given_two_lanes_moves_each_monster_along_its_lane() -> None:
+    w, c = Block(is_walkable=True), Block()
+    lanes = extract_lanes(Grid([[c, w, w, w, c], [w, w, c, w, w], [c, w, w, w, c]]))
+    walker = MonsterStats(name="Walker", max_health=10, value=0, speed=1)
+    entities = Entities(_monster_factories=[monster_factory(walker)], _lanes=lanes)
+    left, right = entities.spawn_monster(0, lane=0), entities.spawn_monster(0, lane=1)
+
+    for _ in range(60):
+        entities.update(50)
+
+    assert left.get_position() == pytest.approx((0.0, 2.0))
+    assert right.get_position() == pytest.approx((2.0, 2.0))
+
+
+def _build_entities_with_a_monster_at(distance: float) -> Entities:
+    path = extract_path(Grid([[Block(is_walkable=True)] * 16]))
+    entities = Entities(
+        _path=path,
+        _monster_factories=[monster_factory(_STILL_MONSTER)],
+        player=Player(money=10**6),
+    )
+    monster = entities.spawn_monster(0)
+    monster.distance_travelled_ = distance
+    monster.update_position(path, 0)
+    return entities
+
+
+def test_upgrade_tower_given_a_longer_range_targets_the_monsters_it_now_reaches() -> (
+    None
+):
+    # Out of the range of an Arrow Shooter, but within the range of its upgrade
+    entities = _build_entities_with_a_monster_at(11.0)
+    entities.try_build_tower(TOWER_MAPPING["Arrow Shooter"], (1, 0))
+    tower = entities.towers[(1, 0)]
+    entities.update(50)
+    assert tower.get_target() is None
+
+    entities.upgrade_tower((1, 0))
+    entities.update(50)
+
+    assert tower.get_target() in entities.monsters
+
+
+def test_sell_tower_given_an_upgraded_tower_its_replacement_targets_in_its_range() -> (
+    None
+):
+    entities = _build_entities_with_a_monster_at(11.0)
+    entities.try_build_tower(TOWER_MAPPING["Arrow Shooter"], (1, 0))
+    entities.upgrade_tower((1, 0))
+    entities.update(50)
+    assert entities.towers[(1, 0)].get_target() in entities.monsters
+
+    entities.sell_tower((1, 0))
+    entities.try_build_tower(TOWER_MAPPING["Arrow Shooter"], (1, 0))
+    entities.update(50)
+
+    assert entities.towers[(1, 0)].get_target() is None
@@ -0,0 +1,33 @@
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+
+def _load_benchmark() -> ModuleType:
+    # The benchmarks are scripts, outside of the package
+    path = Path(__file__).resolve().parent.parent / "benchmarks" / "entities_update.py"
+    spec = importlib.util.spec_from_file_location("entities_update", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("monster_engine", ["objects", "arrays"])
+def test_run_benchmark_given_a_small_game_measures_each_phase(
+    monster_engine: str,
+) -> None:
+    if monster_engine == "arrays":
+        pytest.importorskip("numpy")
+    benchmark = _load_benchmark()
+    entities = benchmark.build_entities(10, monster_engine)
+    assert len(entities.monsters) == 10
+    assert len(entities.towers) == 1
+    assert len(entities.projectiles) == 1
+
+    result = benchmark.run_benchmark(entities, ticks=1)
+
+    assert result["ticks"] == 1
+    assert set(result["phases_us"]) == {name for name, _ in entities.get_phases()}
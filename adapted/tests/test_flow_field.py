@@ -0,0 +1,48 @@
+import random
+
+from tower_defense.block import Block
+from tower_defense.flow_field import FlowField, FlowFieldTrack
+from tower_defense.grid import Grid
+
+_W, _C = Block(is_walkable=True), Block(is_constructible=True)
+
+
+def test_block_given_changes_in_a_row_matches_a_field_computed_from_scratch() -> None:
+    rng = random.Random(0)
+    blocks = [_W, _C, Block()]
+    grid = Grid([[rng.choice(blocks) for _ in range(10)] for _ in range(10)])
+    exit_ = (0, 0)
+    flow_field = FlowField(grid, exit_)
+    blocked = set()
+    for _ in range(100):
+        block = (rng.randrange(1, 10), rng.randrange(1, 10))
+        if block in blocked:
+            flow_field.unblock(block)
+            blocked.discard(block)
+        else:
+            flow_field.block(block)
+            blocked.add(block)
+
+        assert flow_field.distances == FlowField(grid, exit_, blocked).distances
+
+
+def test_to_path_given_a_blocked_block_goes_around_it() -> None:
+    grid = Grid([[_W] * 4, [_C] * 4])
+    flow_field = FlowField(grid, (0, 3))
+    track = FlowFieldTrack(flow_field, [(0, 0)])
+
+    flow_field.block((0, 1))
+
+    assert track.to_path() == [(0, 0), (1, 0), (1, 1), (1, 2), (0, 2), (0, 3)]
+
+
+def test_compute_position_given_a_new_block_keeps_the_current_heading() -> None:
+    grid = Grid([[_W] * 4, [_C] * 4])
+    flow_field = FlowField(grid, (0, 3))
+    track = FlowFieldTrack(flow_field, [(0, 0)])
+    assert track.compute_position(0.5) == (0.0, 0.5)
+
+    flow_field.block((0, 2))
+
+    assert track.compute_position(1.5) == (0.5, 1.0)
+    assert track.get_heading() == [(0, 1), (1, 1)]
@@ -0,0 +1,53 @@
+from typing import List
+
+from tower_defense.game_loop import GameLoop
+
+
+class _FakeTime:
+    def __init__(self) -> None:
+        self.now_ns = 0
+
+    def clock(self) -> int:
+        return self.now_ns
+
+    def sleep(self, duration: float) -> None:
+        self.now_ns += round(duration * 1e9)
+
+
+class _Controller:
+    def __init__(self, fake_time: _FakeTime, update_duration_ms: int) -> None:
+        self._fake_time = fake_time
+        self._update_duration_ns = update_duration_ms * 1_000_000
+        self.timesteps: List[int] = []
+
+    def update(self, timestep: int) -> None:
+        self.timesteps.append(timestep)
+        self._fake_time.now_ns += self._update_duration_ns
+
+
+def test_run_given_fast_updates_runs_one_step_per_timestep() -> None:
+    fake_time = _FakeTime()
+    controller = _Controller(fake_time, update_duration_ms=10)
+    loop = GameLoop(50, clock=fake_time.clock, sleep=fake_time.sleep)
+
+    loop.run(controller, max_frames=21)
+
+    assert controller.timesteps == [50] * 20
+    assert loop.stats.overruns == 0
+
+
+def test_run_given_slow_updates_caps_the_catch_up_and_drops_the_backlog() -> None:
+    fake_time = _FakeTime()
+    controller = _Controller(fake_time, update_duration_ms=80)
+    loop = GameLoop(
+        50, max_steps_per_frame=2, clock=fake_time.clock, sleep=fake_time.sleep
+    )
+
+    loop.run(controller, max_frames=10)
+
+    assert set(controller.timesteps) == {50}
+    assert loop.stats.overruns > 0
+    assert loop.stats.dropped_ms > 0
+    # The simulation never runs ahead of the wall clock
+    simulated_ms = 50 * loop.stats.steps + loop.stats.dropped_ms
+    assert simulated_ms * 1_000_000 <= fake_time.now_ns
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from tower_defense.block import Block
@@ -6,6 +8,7 @@ from tower_defense.grid import (
     SpawnNotFoundError,
     GridNotSquareError,
     GridNotRectangularError,
+    GridFormatError,
 )
 
 
@@ -80,3 +83,54 @@ def test_iter_yields_x_y_coordinates() -> None:
     ):
         assert position == expected_position
         assert block == expected_block
+
+
+def test_fill_grid_given_rows_of_values_returns_x_y_blocks() -> None:
+    grid = Grid._fill_grid([0, 1, 2, 1])
+    assert grid.get_block((1, 0)) == Block(is_walkable=True)
+    assert grid.get_block((0, 1)) == Block()
+    assert grid.get_block((1, 1)) == Block(is_walkable=True)
+
+
+def test_get_block_given_a_row_out_of_the_grid_raises_index_error() -> None:
+    grid = Grid([[Block()], [Block()]])
+    with pytest.raises(IndexError):
+        grid.get_block((0, 1))
+
+
+def test_load_binary_given_a_saved_grid_returns_the_same_grid(tmp_path) -> None:
+    w, c = Block(is_walkable=True), Block(is_constructible=True)
+    grid = Grid([[w, c, c], [w, w, w]])
+    path = str(tmp_path / "map.grid")
+    grid.save_binary(path)
+
+    loaded = Grid.load_binary(path)
+
+    assert loaded == grid
+    assert loaded.find_spawn() == grid.find_spawn()
+    assert loaded.get_neighbors((1, 1)) == grid.get_neighbors((1, 1))
+
+
+def test_load_binary_given_a_text_map_raises_grid_format_error(tmp_path) -> None:
+    path = tmp_path / "map.grid"
+    path.write_text("0 1 1 0 0 1 1 0 0")
+    with pytest.raises(GridFormatError):
+        Grid.load_binary(str(path))
+
+
+def test_load_given_a_text_map_newer_than_its_binary_map_reads_the_text(
+    tmp_path, monkeypatch
+) -> None:
+    map_directory = tmp_path / "texts" / "mapTexts"
+    map_directory.mkdir(parents=True)
+    Grid._fill_grid([1] * 4).save_binary(str(map_directory / "map.grid"))
+    text_path = map_directory / "map.txt"
+    text_path.write_text("0 0 0 0")
+    binary_mtime = os.path.getmtime(map_directory / "map.grid")
+    os.utime(text_path, (binary_mtime + 1, binary_mtime + 1))
+    monkeypatch.chdir(tmp_path)
+
+    assert Grid.load("map") == Grid._fill_grid([0] * 4)
+
+    os.utime(text_path, (binary_mtime - 1, binary_mtime - 1))
+    assert Grid.load("map") == Grid._fill_grid([1] * 4)
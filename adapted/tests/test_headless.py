@@ -0,0 +1,31 @@
+from tower_defense.block import Block
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.default import MONSTER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.headless import run_headless
+from tower_defense.path import extract_path
+from tower_defense.tower_defense_controller import TowerDefenseController
+from tower_defense.wave_generator import WaveGenerator, Wave
+
+
+def _build_controller(waves) -> TowerDefenseController:
+    w = Block(is_walkable=True)
+    grid = Grid([[w, w, w]])
+    entities = Entities(_path=extract_path(grid), _monster_factories=MONSTER_MAPPING)
+    return TowerDefenseController(grid, WaveGenerator(waves), entities)
+
+
+def test_run_headless_runs_until_all_waves_are_over() -> None:
+    controller = _build_controller([Wave(1, [0]), Wave(1, [0, 0])])
+    report = run_headless(controller, timestep=50)
+    assert report.waves_finished is True
+    assert report.player_health == 97
+    assert report.peak_monsters >= 1
+    assert report.simulated_ms == report.ticks * 50
+
+
+def test_run_headless_stops_after_max_ticks() -> None:
+    controller = _build_controller([Wave(1, [0])])
+    report = run_headless(controller, timestep=50, max_ticks=2)
+    assert report.ticks == 2
+    assert report.waves_finished is False
@@ -0,0 +1,58 @@
+import math
+from pathlib import Path
+from typing import List
+
+import pytest
+
+pytest.importorskip("PIL.ImageTk")
+
+from PIL import Image
+
+from tower_defense.view.image_cache import ImageCache
+
+
+class _FakeTkImage:
+    def __init__(self, image: Image.Image):
+        self.image = image
+
+
+@pytest.fixture
+def sprite_paths(tmp_path: Path) -> List[str]:
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"sprite{index}.png"
+        Image.new("RGBA", (10, 10)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def test_get_tk_image_given_close_angles_reuses_the_same_image(
+    sprite_paths: List[str],
+) -> None:
+    cache = ImageCache(angle_step=2.0, tk_image_factory=_FakeTkImage)
+    path = sprite_paths[0]
+
+    unrotated = cache.get_tk_image(path)
+    rotated = cache.get_tk_image(path, math.radians(45))
+
+    assert cache.get_tk_image(path, math.radians(0.5)) is unrotated
+    assert cache.get_tk_image(path, math.radians(359.5)) is unrotated
+    assert cache.get_tk_image(path, math.radians(44.5)) is rotated
+    assert rotated is not unrotated
+
+
+def test_get_tk_image_given_a_full_budget_evicts_the_least_recently_used(
+    sprite_paths: List[str],
+) -> None:
+    # 10 x 10 pixels, 4 bytes each: room for two images
+    cache = ImageCache(max_bytes=800, tk_image_factory=_FakeTkImage)
+    first, second, third = sprite_paths
+    first_image = cache.get_tk_image(first)
+    second_image = cache.get_tk_image(second)
+    assert cache.get_tk_image(first) is first_image
+
+    cache.get_tk_image(third)
+
+    assert cache.tk_images_bytes == 800
+    assert cache.get_tk_image(first) is first_image
+    assert cache.get_tk_image(second) is not second_image
@@ -0,0 +1,167 @@
+import io
+import random
+from typing import Optional, Tuple, Any
+
+import pytest
+
+from tower_defense.block import Block
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.default import MONSTER_MAPPING
+from tower_defense.core.tower.default import TOWER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.headless import run_headless, ReplayPilot
+from tower_defense.input_log import (
+    InputRecorder,
+    InputLogError,
+    read_input_log,
+)
+from tower_defense.interfaces.targeting_strategies import (
+    TargetingStrategy,
+    SortingParam,
+)
+from tower_defense.path import extract_path
+from tower_defense.tower_defense_controller import TowerDefenseController
+from tower_defense.wave_generator import WaveGenerator, Wave
+
+_WAVES = [Wave(4, [0, 4, 5, 0, 5, 4, 0]), Wave(2, [3, 3, 1])]
+
+
+def _build_controller(
+    input_recorder: Optional[InputRecorder] = None,
+    queue_commands: bool = False,
+) -> TowerDefenseController:
+    w, c = Block(is_walkable=True), Block(is_constructible=True)
+    grid = Grid([[w] * 12, [c] * 12])
+    entities = Entities(
+        _path=extract_path(grid),
+        _monster_factories=MONSTER_MAPPING,
+        rng=random.Random(3),
+    )
+    return TowerDefenseController(
+        grid,
+        WaveGenerator(_WAVES),
+        entities,
+        input_recorder=input_recorder,
+        queue_commands=queue_commands,
+    )
+
+
+def _state(controller: TowerDefenseController) -> Tuple[Any, ...]:
+    entities = controller.entities
+    return (
+        entities.player,
+        vars(controller.wave_generator),
+        [(m.health_, m.distance_travelled_) for m in entities.monsters],
+        [
+            (p, t.get_level(), t.targeting_strategy, t.sticky_target)
+            for p, t in entities.towers.items()
+        ],
+    )
+
+
+def _play_session(controller: TowerDefenseController) -> None:
+    for tick in range(200):
+        if tick == 3:
+            for index, tower_name in enumerate(TOWER_MAPPING):
+                controller.try_build_tower(tower_name, (1.5, 2 * index + 3.5))
+        if tick == 10:
+            controller.set_targeting_strategy(
+                (1, 3), TargetingStrategy(SortingParam.HEALTH, True)
+            )
+            controller.set_sticky_target((1, 5), True)
+        if tick == 40:
+            controller.upgrade_tower((1, 3))
+            controller.sell_tower((1, 7))
+        if tick % 20 == 0 and controller.can_start_spawning_monsters():
+            controller.start_spawning_monsters()
+        controller.update(50)
+
+
+def test_replay_pilot_given_a_recorded_session_plays_the_same_game() -> None:
+    stream = io.StringIO()
+    recorded = _build_controller(InputRecorder(stream, {"map": "Test"}))
+    _play_session(recorded)
+
+    header, commands = read_input_log(io.StringIO(stream.getvalue()))
+    replayed = _build_controller()
+    run_headless(replayed, 50, max_ticks=200, pilot=ReplayPilot(commands))
+
+    assert header["map"] == "Test"
+    assert {command.name for command in commands} == {
+        "try_build_tower",
+        "set_targeting_strategy",
+        "set_sticky_target",
+        "upgrade_tower",
+        "sell_tower",
+        "start_spawning_monsters",
+    }
+    # The replay stops as soon as the game is idle after the last command
+    assert replayed.entities.time <= recorded.entities.time
+    assert _state(replayed) == _state(recorded)
+
+
+def test_replay_pilot_given_no_commands_left_stops_when_the_wave_is_over() -> None:
+    stream = io.StringIO()
+    recorded = _build_controller(InputRecorder(stream, {}))
+    recorded.start_spawning_monsters()
+
+    _, commands = read_input_log(io.StringIO(stream.getvalue()))
+    replayed = _build_controller()
+    report = run_headless(replayed, 50, pilot=ReplayPilot(commands))
+
+    assert replayed.wave_generator.current_wave_index == 1
+    assert len(replayed.entities.monsters) == 0
+    assert report.waves_finished is False
+
+
+def test_read_input_log_given_a_log_without_header_raises() -> None:
+    with pytest.raises(InputLogError):
+        read_input_log(['{"time": 0, "command": "sell_tower", "args": [[0, 0]]}'])
+
+
+def test_replay_pilot_given_a_session_with_queued_commands_plays_the_same_game() -> (
+    None
+):
+    stream = io.StringIO()
+    recorded = _build_controller(InputRecorder(stream, {}), queue_commands=True)
+    _play_session(recorded)
+
+    _, commands = read_input_log(io.StringIO(stream.getvalue()))
+    replayed = _build_controller()
+    run_headless(replayed, 50, max_ticks=200, pilot=ReplayPilot(commands))
+
+    assert len(commands) > 0
+    assert _state(replayed) == _state(recorded)
+
+
+def test_try_build_tower_given_queued_commands_applies_it_on_the_next_update() -> None:
+    stream = io.StringIO()
+    controller = _build_controller(InputRecorder(stream, {}), queue_commands=True)
+    controller.update(50)
+
+    assert not controller.try_build_tower(next(iter(TOWER_MAPPING)), (1.5, 3.5))
+    assert len(controller.entities.towers) == 0
+    controller.update(50)
+
+    assert len(controller.entities.towers) == 1
+    _, commands = read_input_log(io.StringIO(stream.getvalue()))
+    assert [(command.time, command.name) for command in commands] == [
+        (50, "try_build_tower")
+    ]
+
+
+def test_read_input_log_given_appended_sessions_returns_the_last_one() -> None:
+    stream = io.StringIO()
+    _build_controller(InputRecorder(stream, {"map": "First"})).try_build_tower(
+        next(iter(TOWER_MAPPING)), (1.5, 3.5)
+    )
+    _build_controller(
+        InputRecorder(stream, {"map": "Second"})
+    ).start_spawning_monsters()
+
+    header, commands = read_input_log(io.StringIO(stream.getvalue()))
+
+    assert header["map"] == "Second"
+    assert [(command.name, command.args) for command in commands] == [
+        ("start_spawning_monsters", ())
+    ]
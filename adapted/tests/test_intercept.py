@@ -0,0 +1,66 @@
+import math
+
+import pytest
+
+from tower_defense.block import Block
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.monster.monsters import monster_factory
+from tower_defense.core.projectile.intercept import Flight, solve_intercept
+from tower_defense.core.tower.default import TOWER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.path import Path, extract_path
+from tower_defense.player import Player
+
+_STRAIGHT_PATH = Path([(0, 0), (1, 0), (2, 0), (3, 0), (4, 0)])
+
+
+def test_solve_intercept_given_a_still_target_flies_straight_to_it() -> None:
+    seconds, position = solve_intercept(_STRAIGHT_PATH, (3.0, 4.0), 2.0, 1.0, 1.5, 0.0)
+
+    assert position == (1.5, 0.0)
+    assert seconds == pytest.approx((math.dist((3.0, 4.0), (1.5, 0.0)) - 1.0) / 2.0)
+
+
+def test_solve_intercept_given_a_moving_target_meets_it_at_the_hitbox_border() -> None:
+    origin, speed, hitbox_radius = (2.0, 3.0), 4.0, 0.25
+
+    seconds, position = solve_intercept(
+        _STRAIGHT_PATH, origin, speed, hitbox_radius, 0.5, 1.0
+    )
+
+    assert position == pytest.approx((0.5 + seconds, 0.0))
+    assert math.dist(origin, position) == pytest.approx(speed * seconds + hitbox_radius)
+
+
+def test_solve_intercept_given_an_unreachable_target_meets_it_at_the_exit() -> None:
+    seconds, position = solve_intercept(_STRAIGHT_PATH, (4.0, 30.0), 1.0, 0.0, 0.0, 5.0)
+
+    assert position == (4.0, 0.0)
+    assert seconds == pytest.approx(30.0)
+
+
+def test_update_given_analytic_projectiles_resolves_hits_without_moving_them() -> None:
+    w = Block(is_walkable=True)
+    entities = Entities(
+        _path=extract_path(Grid([[w] * 4])),
+        _monster_factories=[
+            monster_factory(
+                MonsterStats(name="Still", max_health=100, value=0, speed=0)
+            )
+        ],
+        player=Player(money=10**6),
+        analytic_projectiles=True,
+    )
+    entities.spawn_monster(0)
+    monster = next(iter(entities.monsters))
+    entities.try_build_tower(TOWER_MAPPING["Bullet Shooter"], (3, 0))
+
+    entities.update(50)
+    (flight,) = entities.iter_projectiles()
+    for _ in range(5):
+        entities.update(50)
+
+    assert isinstance(flight, Flight)
+    assert not entities.projectiles
+    assert monster.health_ < 100
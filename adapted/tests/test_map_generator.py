@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from tower_defense.block import Block
+from tower_defense.core.entities import Entities
+from tower_defense.grid import Grid
+from tower_defense.tower_defense_controller import TowerDefenseController
+from tower_defense.view.map_generator import MapGenerator
+from tower_defense.wave_generator import WaveGenerator
+
+
+def _build_controller(grid: Grid) -> TowerDefenseController:
+    return TowerDefenseController(grid, WaveGenerator([]), Entities())
+
+
+def _build_grid(block: Block) -> Grid:
+    w = Block(is_walkable=True)
+    return Grid([[w, block], [block, w]])
+
+
+def test_get_background_given_a_cached_background_loads_the_same_image(
+    tmp_path: Path,
+) -> None:
+    grid = _build_grid(Block(is_constructible=True))
+    painted = MapGenerator(_build_controller(grid), tmp_path).get_background()
+
+    loaded = MapGenerator(_build_controller(grid), tmp_path).get_background()
+
+    assert len(list(tmp_path.glob("*.png"))) == 1
+    assert loaded.mode == painted.mode
+    assert loaded.tobytes() == painted.tobytes()
+
+
+def test_get_background_given_another_grid_paints_it_again(tmp_path: Path) -> None:
+    first = _build_grid(Block(is_constructible=True))
+    second = _build_grid(Block())
+    MapGenerator(_build_controller(first), tmp_path).get_background()
+
+    background = MapGenerator(_build_controller(second), tmp_path).get_background()
+
+    assert len(list(tmp_path.glob("*.png"))) == 2
+    assert (
+        background.tobytes()
+        == MapGenerator(_build_controller(second)).get_background().tobytes()
+    )
+
+
+def test_get_background_given_a_corrupted_cache_paints_it_again(
+    tmp_path: Path,
+) -> None:
+    grid = _build_grid(Block(is_constructible=True))
+    painted = MapGenerator(_build_controller(grid), tmp_path).get_background()
+    (cache_path,) = tmp_path.glob("*.png")
+    cache_path.write_bytes(b"not an image")
+
+    background = MapGenerator(_build_controller(grid), tmp_path).get_background()
+
+    assert background.tobytes() == painted.tobytes()
+    assert cache_path.read_bytes() != b"not an image"
@@ -0,0 +1,55 @@
+import pytest
+
+from tower_defense.block import Block
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.monster.monsters import monster_factory
+from tower_defense.core.open_field_entities import OpenFieldEntities
+from tower_defense.core.tower.default import TOWER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.path import extract_lanes
+from tower_defense.player import Player
+from tower_defense.save import save_game, SaveFormatError
+from tower_defense.wave_generator import WaveGenerator
+
+_WALKER = MonsterStats(name="Walker", max_health=10**6, value=0, speed=5)
+
+
+def _build_entities() -> OpenFieldEntities:
+    w, c = Block(is_walkable=True), Block(is_constructible=True)
+    grid = Grid([[w] * 4, [c] * 4])
+    return OpenFieldEntities(
+        _monster_factories=[monster_factory(_WALKER)],
+        player=Player(money=10**6),
+        _lanes=extract_lanes(grid),
+        _grid=grid,
+    )
+
+
+def test_try_build_tower_given_a_tower_closing_the_way_refuses_it() -> None:
+    entities = _build_entities()
+    tower_factory = TOWER_MAPPING["Arrow Shooter"]
+    assert entities.try_build_tower(tower_factory, (1, 1))
+
+    assert not entities.try_build_tower(tower_factory, (0, 1))
+
+    entities.sell_tower((1, 1))
+    assert entities.try_build_tower(tower_factory, (0, 1))
+
+
+def test_update_given_a_tower_on_the_way_walks_around_it_to_the_exit() -> None:
+    entities = _build_entities()
+    entities.try_build_tower(TOWER_MAPPING["Arrow Shooter"], (0, 1))
+    monster = entities.spawn_monster(0)
+    positions = set()
+
+    while entities.monsters:
+        entities.update(50)
+        positions.add(monster.get_position())
+
+    assert (1.0, 1.0) in positions
+    assert entities.player.health == 100 - _WALKER.damage
+
+
+def test_save_game_given_open_field_entities_raises() -> None:
+    with pytest.raises(SaveFormatError):
+        save_game(_build_entities(), WaveGenerator([]))
@@ -1,10 +1,107 @@
 import pytest
 
+from tower_defense.block import Block
 from tower_defense.grid import Grid, SpawnNotFoundError
-from tower_defense.path import extract_path
+from tower_defense.path import Path, extract_path, extract_lanes
 
 
 def test_extract_path_raises_spawn_not_found_error_when_input_grid_is_empty() -> None:
     grid = Grid([])
     with pytest.raises(SpawnNotFoundError):
         extract_path(grid)
+
+
+def _build_path() -> Path:
+    w = Block(is_walkable=True)
+    return extract_path(Grid([[w, w], [Block(), w]]))
+
+
+def test_extract_path_returns_a_list_of_blocks() -> None:
+    assert _build_path() == [(0, 0), (0, 1), (1, 1)]
+
+
+def test_compute_position_interpolates_between_blocks() -> None:
+    path = _build_path()
+    assert path.compute_position(0.5) == (0.0, 0.5)
+    assert path.compute_position(1.25) == (0.25, 1.0)
+
+
+def test_compute_position_clips_to_the_ends_of_the_path() -> None:
+    path = _build_path()
+    assert path.compute_position(-0.5) == (0.0, 0.0)
+    assert path.compute_position(7.5) == (1.0, 1.0)
+
+
+def test_compute_positions_matches_compute_position() -> None:
+    path = _build_path()
+    distances = [-1.0, 0.0, 0.3, 1.0, 1.7, 2.0, 3.2]
+    assert path.compute_positions(distances) == [
+        path.compute_position(distance) for distance in distances
+    ]
+
+
+def test_has_arrived_once_the_last_block_is_reached() -> None:
+    path = _build_path()
+    assert path.has_arrived(1.99) is False
+    assert path.has_arrived(2.0) is True
+
+
+def test_extract_lanes_given_a_fork_returns_a_lane_per_branch() -> None:
+    w, c = Block(is_walkable=True), Block()
+    # Both sides of a ring lead from the spawn at (1, 0) to the exit at (1, 4)
+    grid = Grid([[c, w, w, w, c], [w, w, c, w, w], [c, w, w, w, c]])
+
+    lanes = extract_lanes(grid)
+
+    assert lanes == [
+        [(1, 0), (1, 1), (0, 1), (0, 2), (0, 3), (1, 3), (1, 4)],
+        [(1, 0), (1, 1), (2, 1), (2, 2), (2, 3), (1, 3), (1, 4)],
+    ]
+    assert lanes.distance_field[(1, 0)] == 6
+    assert lanes.distance_field[(2, 2)] == 3
+
+
+def test_extract_lanes_given_a_dead_end_inside_the_grid_spawns_from_it() -> None:
+    w, c = Block(is_walkable=True), Block()
+    # The spawn of the grid is at (1, 0), the exit at (2, 3), and a spawn at (3, 1)
+    grid = Grid([[c, c, c, c], [w, w, w, c], [c, c, w, w], [c, w, w, c], [c, c, c, c]])
+
+    lanes = extract_lanes(grid)
+
+    assert lanes.spawns == [(1, 0), (3, 1)]
+    assert lanes.exits == [(2, 3)]
+    assert lanes == [
+        [(1, 0), (1, 1), (1, 2), (2, 2), (2, 3)],
+        [(3, 1), (3, 2), (2, 2), (2, 3)],
+    ]
+
+
+def test_extract_lanes_given_a_longer_branch_keeps_the_exit_on_the_edge() -> None:
+    w, c = Block(is_walkable=True), Block()
+    # The spawn column forks at (0, 1) into a corridor ending inside the grid
+    grid = Grid([[w, w, w, w]] + [[c, w, c, c]] * 7 + [[c, c, c, c]])
+
+    lanes = extract_lanes(grid)
+
+    assert lanes.exits == [(0, 3)]
+    assert lanes[0] == [(0, 0), (0, 1), (0, 2), (0, 3)]
+    assert lanes[1][0] == (7, 1) and lanes[1][-1] == (0, 3)
+
+
+def test_extract_lanes_given_no_dead_end_on_the_edge_raises_value_error() -> None:
+    w = Block(is_walkable=True)
+    with pytest.raises(ValueError):
+        extract_lanes(Grid([[w] * 6, [w] * 6]))
+
+
+def test_extract_lanes_given_a_wide_area_draws_distinct_shortest_lanes() -> None:
+    w, c = Block(is_walkable=True), Block()
+    # Countless shortest routes between the corners, whose neighbors are blocked
+    columns = [[w] * 50 for _ in range(50)]
+    columns[1][0] = columns[48][49] = c
+
+    lanes = extract_lanes(Grid(columns), max_lanes=16)
+
+    assert len(lanes) == 16
+    assert len(set(map(tuple, lanes))) == 16
+    assert all(lane[0] == (0, 0) and len(lane) == 99 for lane in lanes)
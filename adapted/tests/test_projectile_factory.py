@@ -0,0 +1,51 @@
+from tower_defense.core.effects import DamageEffect
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.monster.monsters import Monster
+from tower_defense.core.projectile.projectile_factory import ProjectileFactory
+from tower_defense.core.projectile.projectile_strategies import (
+    tracking_movement_strategy,
+    tracking_hit_strategy,
+)
+from tower_defense.core.projectile.stats import ProjectileStats
+from tower_defense.core.upgradable import Up, UpgradableList
+
+
+def _build_factory() -> ProjectileFactory:
+    return ProjectileFactory(
+        projectile_name="bullet",
+        projectile_stats=ProjectileStats(
+            speed=Up(10.0),
+            range=Up(5.0, 6.0),
+            hitbox_radius=Up(0.5),
+            range_sensitive=Up(False),
+            effects=UpgradableList([DamageEffect(damage=Up(5, 10))]),
+        ),
+        movement_strategy=tracking_movement_strategy,
+        hit_strategy=tracking_hit_strategy,
+    )
+
+
+def _build_monster() -> Monster:
+    return Monster(MonsterStats(name="Monster", max_health=100, speed=1.0, value=1))
+
+
+def test_create_projectile_shares_stats_between_projectiles_of_a_level() -> None:
+    factory = _build_factory()
+    target = _build_monster()
+    projectile_a = factory.create_projectile(0.0, 0.0, 0.0, target)
+    projectile_b = factory.create_projectile(0.0, 0.0, 0.0, target)
+    assert projectile_a.stats is projectile_b.stats
+
+
+def test_upgrade_does_not_affect_projectiles_already_created() -> None:
+    factory = _build_factory()
+    old_projectile = factory.create_projectile(0.0, 0.0, 0.0, _build_monster())
+    factory.upgrade()
+    new_projectile = factory.create_projectile(0.0, 0.0, 0.0, _build_monster())
+    assert old_projectile.stats is not new_projectile.stats
+    assert new_projectile.stats.range == 6.0
+    monster = _build_monster()
+    old_projectile.apply_effects(monster)
+    assert monster.health_ == 95
+    new_projectile.apply_effects(monster)
+    assert monster.health_ == 85
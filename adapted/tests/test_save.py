@@ -0,0 +1,114 @@
+from typing import Tuple, Any
+
+import pytest
+
+from tower_defense.block import Block
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.default import MONSTER_MAPPING
+from tower_defense.core.tower.default import TOWER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.path import extract_path
+from tower_defense.save import save_game, load_game, SaveFormatError
+from tower_defense.tower_defense_controller import TowerDefenseController
+from tower_defense.wave_generator import WaveGenerator, Wave
+
+_WAVES = [Wave(4, [0, 4, 5, 0, 5, 4, 0])]
+
+
+def _build_controller(analytic_projectiles: bool = False) -> TowerDefenseController:
+    w, c = Block(is_walkable=True), Block(is_constructible=True)
+    grid = Grid([[w] * 12, [c] * 12])
+    entities = Entities(
+        _path=extract_path(grid),
+        _monster_factories=MONSTER_MAPPING,
+        analytic_projectiles=analytic_projectiles,
+    )
+    return TowerDefenseController(grid, WaveGenerator(_WAVES), entities)
+
+
+def _state(controller: TowerDefenseController) -> Tuple[Any, ...]:
+    entities = controller.entities
+    monsters = sorted(
+        (
+            m.get_model_name(),
+            m.health_,
+            m.distance_travelled_,
+            m.get_speed(),
+            m.get_position(),
+        )
+        for m in entities.monsters
+    )
+    towers = sorted(
+        (position, t.get_level(), t.is_loaded(), t.sticky_target)
+        for position, t in entities.towers.items()
+    )
+    projectiles = sorted(
+        (p.get_model_name(), p.get_position()) for p in entities.iter_projectiles()
+    )
+    wave_generator = controller.wave_generator
+    return (
+        entities.time,
+        entities.player,
+        vars(wave_generator),
+        monsters,
+        towers,
+        projectiles,
+        sorted(due for due, _ in entities.tower_reloads),
+        sorted(due for due, _ in entities.slow_expiries),
+    )
+
+
+def _play(controller: TowerDefenseController, ticks: int) -> None:
+    for _ in range(ticks):
+        if controller.can_start_spawning_monsters():
+            controller.start_spawning_monsters()
+        controller.update(50)
+
+
+def _saved_game(analytic_projectiles: bool = False) -> TowerDefenseController:
+    controller = _build_controller(analytic_projectiles)
+    for index, tower_name in enumerate(TOWER_MAPPING):
+        controller.try_build_tower(tower_name, (1.5, 2 * index + 3.5))
+    controller.upgrade_tower((1, 3))
+    controller.entities.towers[(1, 5)].sticky_target = True
+    _play(controller, 38)
+    return controller
+
+
+@pytest.mark.parametrize("analytic_projectiles", [False, True])
+def test_load_game_given_a_saved_game_restores_its_state(
+    analytic_projectiles: bool,
+) -> None:
+    controller = _saved_game(analytic_projectiles)
+    restored = _build_controller(analytic_projectiles)
+    assert len(controller.entities.slow_expiries) > 0
+
+    load_game(
+        save_game(controller.entities, controller.wave_generator),
+        restored.entities,
+        restored.wave_generator,
+        TOWER_MAPPING,
+    )
+
+    assert _state(restored) == _state(controller)
+
+
+def test_load_game_given_a_restored_game_plays_like_the_saved_one() -> None:
+    controller = _saved_game()
+    restored = _build_controller()
+    data = save_game(controller.entities, controller.wave_generator)
+    load_game(data, restored.entities, restored.wave_generator, TOWER_MAPPING)
+
+    _play(controller, 40)
+    _play(restored, 40)
+
+    assert _state(restored) == _state(controller)
+
+
+def test_load_game_given_bytes_from_another_format_raises() -> None:
+    controller = _build_controller()
+
+    with pytest.raises(SaveFormatError):
+        load_game(
+            b"GIF89a", controller.entities, controller.wave_generator, TOWER_MAPPING
+        )
@@ -0,0 +1,30 @@
+from tower_defense.core.scheduler import Scheduler
+
+
+def test_pop_due_given_items_due_later_keeps_them_scheduled() -> None:
+    scheduler: Scheduler[str] = Scheduler()
+    scheduler.schedule(100, "late")
+    scheduler.schedule(50, "early")
+
+    assert list(scheduler.pop_due(50)) == ["early"]
+    assert scheduler.next_due_time() == 100
+    assert len(scheduler) == 1
+
+
+def test_pop_due_given_simultaneous_items_keeps_insertion_order() -> None:
+    scheduler: Scheduler[str] = Scheduler()
+    for item in ["b", "a", "c"]:
+        scheduler.schedule(10, item)
+
+    assert list(scheduler.pop_due(10)) == ["b", "a", "c"]
+    assert scheduler.next_due_time() is None
+
+
+def test_cancel_given_a_scheduled_item_removes_it_only() -> None:
+    scheduler: Scheduler[str] = Scheduler()
+    for due_time, item in [(30, "c"), (10, "a"), (20, "b")]:
+        scheduler.schedule(due_time, item)
+
+    scheduler.cancel("a")
+
+    assert list(scheduler.pop_due(30)) == ["b", "c"]
@@ -0,0 +1,149 @@
+import math
+
+import pytest
+
+from tower_defense.block import Block
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.default import MONSTER_MAPPING
+from tower_defense.core.tower.default import TOWER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.path import extract_path
+from tower_defense.interfaces.snapshot import WorldSnapshot, EntitySnapshot
+from tower_defense.snapshot import (
+    SnapshotBuilder,
+    SnapshotInterpolator,
+    interpolate_snapshots,
+)
+from tower_defense.tower_defense_controller import TowerDefenseController
+from tower_defense.wave_generator import WaveGenerator, Wave
+
+
+def _build_controller(publish_snapshots: bool) -> TowerDefenseController:
+    w, c = Block(is_walkable=True), Block(is_constructible=True)
+    grid = Grid([[w] * 8, [c] * 8])
+    entities = Entities(_path=extract_path(grid), _monster_factories=MONSTER_MAPPING)
+    return TowerDefenseController(
+        grid,
+        WaveGenerator([Wave(2, [0, 0, 0])]),
+        entities,
+        publish_snapshots=publish_snapshots,
+    )
+
+
+def test_build_given_entities_kept_between_ticks_keeps_their_ids() -> None:
+    entities = Entities(_monster_factories=MONSTER_MAPPING)
+    builder = SnapshotBuilder()
+    first_monster = entities.spawn_monster(0)
+    first = builder.build(entities)
+    entities.spawn_monster(1)
+    second = builder.build(entities)
+    entities.monsters.discard(first_monster)
+    third = builder.build(entities)
+
+    assert [m.entity_id for m in first.monsters] == [0]
+    assert sorted(m.entity_id for m in second.monsters) == [0, 1]
+    assert [m.entity_id for m in third.monsters] == [1]
+
+
+def test_build_given_a_new_entity_never_reuses_an_id() -> None:
+    entities = Entities(_monster_factories=MONSTER_MAPPING)
+    builder = SnapshotBuilder()
+    ids = []
+    for _ in range(3):
+        monster = entities.spawn_monster(0)
+        (snapshot_monster,) = builder.build(entities).monsters
+        ids.append(snapshot_monster.entity_id)
+        entities.monsters.discard(monster)
+
+    assert ids == [0, 1, 2]
+
+
+def test_get_snapshot_given_published_snapshots_is_left_untouched_by_updates() -> None:
+    controller = _build_controller(publish_snapshots=True)
+    controller.try_build_tower("Bullet Shooter", (1.5, 3.5))
+    controller.start_spawning_monsters()
+    for _ in range(20):
+        controller.update(50)
+    snapshot = controller.get_snapshot()
+    projectile_positions = [p.position for p in snapshot.projectiles]
+
+    controller.update(50)
+
+    assert snapshot.time == 1000
+    assert len(snapshot.towers) == 1
+    assert projectile_positions
+    assert [p.position for p in snapshot.projectiles] == projectile_positions
+    assert controller.get_snapshot().time == 1050
+    assert controller.get_snapshot().projectiles != snapshot.projectiles
+
+
+def test_get_snapshot_given_no_published_snapshots_copies_the_current_state() -> None:
+    controller = _build_controller(publish_snapshots=False)
+    assert controller.get_snapshot().towers == ()
+
+    controller.try_build_tower(next(iter(TOWER_MAPPING)), (1.5, 3.5))
+
+    (tower,) = controller.get_snapshot().towers
+    assert tower.position == (1, 3)
+    assert tower.level == 1
+
+
+def _projectiles_snapshot(time: int, *projectiles: EntitySnapshot) -> WorldSnapshot:
+    return WorldSnapshot(time, (), (), projectiles)
+
+
+def test_interpolate_snapshots_given_a_moved_entity_blends_its_state() -> None:
+    previous = _projectiles_snapshot(
+        0,
+        EntitySnapshot(0, "arrow", (0.0, 0.0), 3.0),
+        EntitySnapshot(1, "a", (0, 0), 0),
+    )
+    current = _projectiles_snapshot(
+        50,
+        EntitySnapshot(0, "arrow", (1.0, 2.0), -3.0),
+        EntitySnapshot(2, "b", (5, 5), 1),
+    )
+
+    snapshot = interpolate_snapshots(previous, current, 0.25)
+
+    moved, new = snapshot.projectiles
+    assert snapshot.time == 12
+    assert moved.position == (0.25, 0.5)
+    # Turning the shortest way, across the half turn
+    assert moved.orientation == pytest.approx(3.0 + 0.25 * (2 * math.pi - 6.0))
+    assert new == current.projectiles[1]
+
+
+def test_snapshot_interpolator_given_two_snapshots_moves_over_the_tick() -> None:
+    now = [0.0]
+    interpolator = SnapshotInterpolator(clock=lambda: now[0])
+    first = _projectiles_snapshot(0, EntitySnapshot(0, "arrow", (0.0, 0.0), 0.0))
+    second = _projectiles_snapshot(100, EntitySnapshot(0, "arrow", (1.0, 0.0), 0.0))
+
+    assert interpolator.get_render_snapshot(first) is first
+    now[0] = 0.1
+    xs = []
+    for _ in range(3):
+        (projectile,) = interpolator.get_render_snapshot(second).projectiles
+        xs.append(projectile.position[0])
+        now[0] += 0.05
+
+    assert xs == pytest.approx([0.0, 0.5, 1.0])
+
+
+def test_get_tower_given_a_built_tower_finds_its_state_by_block_position() -> None:
+    controller = _build_controller(publish_snapshots=False)
+    controller.try_build_tower(next(iter(TOWER_MAPPING)), (1.5, 3.5))
+    controller.set_sticky_target((1, 3), True)
+    built = controller.entities.towers[(1, 3)]
+
+    snapshot = controller.get_snapshot()
+    tower = snapshot.get_tower((1, 3))
+
+    assert snapshot.get_tower((1, 4)) is None
+    assert tower is not None
+    assert tower.name == built.get_name()
+    assert tower.range == built.get_range()
+    assert tower.upgrade_cost == built.get_upgrade_cost()
+    assert tower.targeting_strategy == built.targeting_strategy
+    assert tower.sticky_target is True
@@ -0,0 +1,56 @@
+import math
+import random
+from typing import Tuple
+
+from tower_defense.core.spatial_hash import SpatialHash
+from tower_defense.interfaces.entity import IEntity
+
+
+class _Point(IEntity):
+    def __init__(self, x: float, y: float):
+        self.x = x
+        self.y = y
+
+    def get_position(self) -> Tuple[float, float]:
+        return self.x, self.y
+
+    def get_orientation(self) -> float:
+        return 0.0
+
+    def get_model_name(self) -> str:
+        return "point"
+
+
+def test_query_given_empty_hash_yields_nothing() -> None:
+    assert list(SpatialHash().query((0.0, 0.0), 1.0)) == []
+
+
+def test_query_matches_brute_force_scan() -> None:
+    rng = random.Random(0)
+    points = [_Point(rng.uniform(-5, 35), rng.uniform(-5, 35)) for _ in range(500)]
+    spatial_hash: SpatialHash[_Point] = SpatialHash()
+    spatial_hash.rebuild(points)
+    for _ in range(200):
+        center = rng.uniform(0, 30), rng.uniform(0, 30)
+        radius = rng.choice([0.25, 0.5, 1.0, 3.0])
+        expected = {p for p in points if math.dist(center, p.get_position()) <= radius}
+        found = {
+            p
+            for p in spatial_hash.query(center, radius)
+            if math.dist(center, p.get_position()) <= radius
+        }
+        assert found == expected
+
+
+def test_query_includes_points_exactly_on_the_circle() -> None:
+    point = _Point(2.0, 1.0)
+    spatial_hash: SpatialHash[_Point] = SpatialHash()
+    spatial_hash.rebuild([point])
+    assert point in set(spatial_hash.query((1.0, 1.0), 1.0))
+
+
+def test_query_given_infinite_radius_yields_every_point() -> None:
+    points = [_Point(0.0, 0.0), _Point(100.0, -100.0)]
+    spatial_hash: SpatialHash[_Point] = SpatialHash()
+    spatial_hash.rebuild(points)
+    assert set(spatial_hash.query((0.0, 0.0), float("inf"))) == set(points)
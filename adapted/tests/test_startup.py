@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from tower_defense.startup import StartupTimer
+
+
+def test_report_when_measured_given_all_the_phases_reports_them_once() -> None:
+    reports = []
+    timer = StartupTimer(clock=iter([1.0, 1.5]).__next__)
+    timer.add("import", 0.25)
+    timer.report_when_measured(["import", "map_load"], reports.append)
+    assert reports == []
+
+    with timer.measure("map_load"):
+        pass
+    timer.add("import", 0.25)
+
+    assert reports == [{"import": 250.0, "map_load": 500.0}]
+
+
+def test_main_given_headless_imports_neither_tkinter_nor_pil() -> None:
+    code = (
+        "import sys\n"
+        "from tower_defense import snapshot\n"
+        "from tower_defense.scripts import game\n"
+        "sys.argv = ['game', '--headless', '--ticks', '10', '--startup-report']\n"
+        "game.main()\n"
+        "heavy = [m for m in sys.modules if m.split('.')[0] in ('tkinter', 'PIL')]\n"
+        "assert not heavy, heavy\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parents[1],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert '"path_extraction"' in result.stderr
@@ -0,0 +1,107 @@
+import math
+import random
+from typing import List
+
+import pytest
+
+from tower_defense.core.monster.monster import IMonster
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.monster.monsters import Monster
+from tower_defense.core.tower.targeting_index import (
+    PathTargetingIndex,
+    SortedTargetingIndex,
+)
+from tower_defense.core.tower.targeting_strategies import SORTING_FUNCTIONS
+from tower_defense.grid import Grid
+from tower_defense.interfaces.targeting_strategies import (
+    TargetingStrategy,
+    SortingParam,
+)
+from tower_defense.path import Path, extract_path, compute_range_intervals
+
+# A serpentine path: the walkable blocks are marked with a 1
+_MAP = [
+    "1000000",
+    "1111110",
+    "0000010",
+    "0111110",
+    "0100000",
+    "0111111",
+]
+
+
+def _build_path() -> Path:
+    values = [int(value) for row in _MAP for value in row]
+    width, height = len(_MAP[0]), len(_MAP)
+    grid = Grid._fill_grid(
+        [values[width * y + x] for y in range(height) for x in range(width)]
+        + [2] * (width * width - width * height)
+    )
+    return extract_path(grid)
+
+
+def _build_monsters(path: Path, count: int, seed: int) -> List[IMonster]:
+    rng = random.Random(seed)
+    monsters = []
+    for _ in range(count):
+        stats = MonsterStats(
+            name="Monster", max_health=rng.randint(1, 5), speed=1.0, value=1
+        )
+        monster = Monster(stats, distance=rng.uniform(0, len(path) - 1))
+        monster.update_position(path, 0)
+        monsters.append(monster)
+    return monsters
+
+
+def _in_range(monster: IMonster, center, radius: float) -> bool:
+    return math.dist(monster.get_position(), center) <= radius
+
+
+def test_compute_range_intervals_given_empty_path_returns_no_interval() -> None:
+    assert compute_range_intervals([], (0.0, 0.0), 1.0) == []
+
+
+def test_compute_range_intervals_covers_whole_path_when_range_is_infinite() -> None:
+    path = _build_path()
+    assert compute_range_intervals(path, (0.0, 0.0), math.inf) == [
+        (-math.inf, math.inf)
+    ]
+
+
+@pytest.mark.parametrize(
+    "targeting_strategy",
+    [
+        TargetingStrategy(SortingParam.HEALTH, reverse=True),
+        TargetingStrategy(SortingParam.HEALTH, reverse=False),
+        TargetingStrategy(SortingParam.DISTANCE, reverse=True),
+        TargetingStrategy(SortingParam.DISTANCE, reverse=False),
+    ],
+)
+def test_path_targeting_index_selects_like_sorted_targeting_index(
+    targeting_strategy: TargetingStrategy,
+) -> None:
+    path = _build_path()
+    monsters = _build_monsters(path, 100, seed=0)
+    path_index = PathTargetingIndex(path)
+    path_index.rebuild(monsters)
+    sorted_index = SortedTargetingIndex()
+    sorted_index.rebuild(monsters)
+    sorting_function = SORTING_FUNCTIONS[targeting_strategy.key]
+    for x in range(-1, 8):
+        for y in range(-1, 7):
+            for radius in (0.5, 1.0, 2.5):
+                center = (float(x), float(y))
+                expected = [
+                    m
+                    for m in sorted_index.query(center, radius, targeting_strategy)
+                    if _in_range(m, center, radius)
+                ]
+                found = [
+                    m
+                    for m in path_index.query(center, radius, targeting_strategy)
+                    if _in_range(m, center, radius)
+                ]
+                assert set(found) == set(expected)
+                assert list(map(sorting_function, found)) == list(
+                    map(sorting_function, expected)
+                )
@@ -0,0 +1,14 @@
+from tower_defense.tick_stats import RingBuffer, TickStats
+
+
+def test_percentiles_given_a_full_buffer_only_considers_the_last_values() -> None:
+    buffer = RingBuffer(capacity=100)
+    for value in range(1000):
+        buffer.append(value)
+
+    assert len(buffer) == 100
+    assert buffer.percentiles() == {"p50": 949, "p95": 994, "p99": 998}
+
+
+def test_summarize_given_no_measure_is_empty() -> None:
+    assert TickStats().summarize() == {}
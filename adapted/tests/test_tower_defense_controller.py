@@ -1,9 +1,13 @@
+from typing import Optional, Callable
+
 import pytest
 
 from tower_defense.block import Block
 from tower_defense.core.entities import Entities
+from tower_defense.game_loop import LoopStats
 from tower_defense.grid import Grid
 from tower_defense.path import extract_path
+from tower_defense.tick_stats import TickStats
 from tower_defense.tower_defense_controller import TowerDefenseController
 from tower_defense.wave_generator import WaveGenerator
 
@@ -66,3 +70,65 @@ def test_try_build_tower_returns_false_when_trying_to_build_on_an_invalid_positi
             minimal_controller.try_build_tower(valid_tower_view_name, invalid_position)
             is False
         )
+
+
+def test_get_tick_stats_given_no_tick_stats_is_empty(
+    minimal_controller: TowerDefenseController,
+) -> None:
+    minimal_controller.update(50)
+
+    assert minimal_controller.get_tick_stats() == {}
+
+
+def test_get_tick_stats_given_tick_stats_measures_each_phase(
+    minimal_controller: TowerDefenseController,
+) -> None:
+    minimal_controller.tick_stats = TickStats(capacity=10)
+    for _ in range(3):
+        minimal_controller.update(50)
+
+    tick_stats = minimal_controller.get_tick_stats()
+
+    assert tick_stats["monsters"] == {"p50": 0, "p95": 0, "p99": 0}
+    for name, _ in minimal_controller.entities.get_phases():
+        assert tick_stats[f"{name}_ms"]["p99"] >= 0.0
+    assert minimal_controller.entities.time == 150
+
+
+def test_get_tick_stats_given_loop_stats_adds_the_loop_counters(
+    minimal_controller: TowerDefenseController,
+) -> None:
+    minimal_controller.tick_stats = TickStats(capacity=10)
+    minimal_controller.loop_stats = LoopStats(frames=4, steps=3, overruns=1)
+    minimal_controller.update(50)
+
+    tick_stats = minimal_controller.get_tick_stats()
+
+    assert tick_stats["game_loop"] == {
+        "frames": 4,
+        "steps": 3,
+        "overruns": 1,
+        "dropped_ms": 0.0,
+    }
+
+
+def test_update_given_tick_stats_runs_the_update_of_the_entities() -> None:
+    class CountingEntities(Entities):
+        updates = 0
+
+        def update(
+            self, timestep: int, on_phase_end: Optional[Callable[[str], None]] = None
+        ) -> None:
+            self.updates += 1
+            super().update(timestep, on_phase_end)
+
+    grid = Grid([[Block(is_walkable=True)]])
+    entities = CountingEntities(_path=extract_path(grid))
+    controller = TowerDefenseController(
+        grid, WaveGenerator([]), entities, tick_stats=TickStats(capacity=10)
+    )
+
+    controller.update(50)
+
+    assert entities.updates == 1
+    assert controller.get_tick_stats()["update_monsters_ms"]["p99"] >= 0.0
@@ -0,0 +1,129 @@
+import random
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from statistics import mean
+from typing import List, Tuple, Dict, Any, Optional, Iterable, Iterator, Sequence
+
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.default import MONSTER_MAPPING
+from tower_defense.core.tower.default import TOWER_MAPPING
+from tower_defense.grid import Grid
+from tower_defense.headless import run_headless
+from tower_defense.path import extract_lanes
+from tower_defense.tower_defense_controller import TowerDefenseController
+from tower_defense.wave_generator import WaveGenerator
+
+Layout = List[Tuple[str, Tuple[int, int]]]
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    map_name: str
+    scenario: str
+    layout_index: int
+    tower_count: int
+    seed: int
+    timestep: int
+    max_ticks: Optional[int] = None
+
+
+@dataclass
+class BatchResult:
+    map_name: str
+    scenario: str
+    layout_index: int
+    seed: int
+    towers_built: int
+    ticks: int
+    wall_time_s: float
+    waves_finished: bool
+    player_health: int
+    player_money: int
+
+    @property
+    def survived(self) -> bool:
+        return self.waves_finished and self.player_health > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def generate_layout(grid: Grid, layout_index: int, tower_count: int) -> Layout:
+    """Pick random towers on random constructible blocks
+
+    The layout only depends on the map and on `layout_index`, so that the same layout
+    is played against every scenario and every seed.
+    """
+    rng = random.Random(layout_index)
+    positions = [position for position, block in grid if block.is_constructible]
+    tower_names = sorted(TOWER_MAPPING)
+    return [
+        (rng.choice(tower_names), position)
+        for position in rng.sample(positions, min(tower_count, len(positions)))
+    ]
+
+
+def run_job(job: BatchJob) -> BatchResult:
+    """Play one headless game, built from scratch so that it can run in any process"""
+    grid = Grid.load(job.map_name)
+    entities = Entities(
+        _monster_factories=MONSTER_MAPPING,
+        rng=random.Random(job.seed),
+        _lanes=extract_lanes(grid),
+    )
+    controller = TowerDefenseController(
+        grid, WaveGenerator.load(job.scenario), entities
+    )
+    towers_built = 0
+    for tower_name, (x, y) in generate_layout(grid, job.layout_index, job.tower_count):
+        # Towers are bought in order, as long as the player can afford them
+        if controller.try_build_tower(tower_name, (x + 0.5, y + 0.5)):
+            towers_built += 1
+    report = run_headless(controller, job.timestep, job.max_ticks)
+    return BatchResult(
+        map_name=job.map_name,
+        scenario=job.scenario,
+        layout_index=job.layout_index,
+        seed=job.seed,
+        towers_built=towers_built,
+        ticks=report.ticks,
+        wall_time_s=report.wall_time_s,
+        waves_finished=report.waves_finished,
+        player_health=report.player_health,
+        player_money=report.player_money,
+    )
+
+
+def run_batch(
+    jobs: Iterable[BatchJob], max_workers: Optional[int] = None
+) -> Iterator[BatchResult]:
+    """Run the jobs in a pool of processes, yielding the results as they finish"""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def aggregate(results: Sequence[BatchResult]) -> List[Dict[str, Any]]:
+    """Summarize the results over the seeds, per map, scenario and layout"""
+    groups: Dict[Tuple[str, str, int], List[BatchResult]] = defaultdict(list)
+    for result in results:
+        groups[(result.map_name, result.scenario, result.layout_index)].append(result)
+    rows = []
+    for (map_name, scenario, layout_index), group in sorted(groups.items()):
+        rows.append(
+            {
+                "map_name": map_name,
+                "scenario": scenario,
+                "layout_index": layout_index,
+                "runs": len(group),
+                "survival_rate": mean(result.survived for result in group),
+                "mean_towers_built": mean(result.towers_built for result in group),
+                "mean_player_health": mean(result.player_health for result in group),
+                "mean_player_money": mean(result.player_money for result in group),
+                "mean_ticks": mean(result.ticks for result in group),
+                "mean_wall_time_s": mean(result.wall_time_s for result in group),
+            }
+        )
+    return rows
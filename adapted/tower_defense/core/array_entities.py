@@ -0,0 +1,91 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional
+
+import numpy as np
+
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.monster import IMonster, MonsterFactory
+from tower_defense.core.monster.array_monsters import MonsterArrays
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.monster.monsters import monster_factory
+
+
+@dataclass
+class ArrayEntities(Entities):
+    """Entities whose monsters are stored in NumPy arrays and updated all at once
+
+    The monsters are still exposed to the towers, projectiles and views as IMonster
+    objects, through the `monsters` set. The broadphase and the targeting index are
+    rebuilt from the arrays too.
+    """
+
+    # Built from the stats of the monsters
+    _monster_factories: List[MonsterFactory] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _monster_stats: List[MonsterStats] = field(default_factory=list)
+    _monster_arrays: MonsterArrays = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._monster_factories = [
+            monster_factory(stats) for stats in self._monster_stats
+        ]
+        self._monster_arrays = MonsterArrays(self._monster_stats)
+
+    def _rebuild_monster_hash(self) -> None:
+        arrays = self._monster_arrays
+        self._monster_hash.assign(
+            arrays.bucket_by_cell(arrays.active_slots(), self._monster_hash.cell_size)
+        )
+
+    def _rebuild_targeting_index(self) -> None:
+        arrays = self._monster_arrays
+        self._targeting_index.rebuild_sorted(
+            *arrays.sort_by_distance(arrays.active_slots())
+        )
+
+    def spawn_monster(
+        self, monster_type_id: int, lane: Optional[int] = None
+    ) -> IMonster:
+        monster = self._monster_arrays.spawn(
+            monster_type_id, lane=self._pick_lane() if lane is None else lane
+        )
+        self.monsters.add(monster)
+        return monster
+
+    def _collect_children(self, dead_slots: np.ndarray) -> List[Tuple[int, float, int]]:
+        children = []
+        for slot in dead_slots:
+            stats = self._monster_arrays.get_stats(slot)
+            distance = self._monster_arrays.get_distance(slot)
+            lane = self._monster_arrays.get_lane(slot)
+            for respawn_monster_index in stats.respawn_indices:
+                children.append(
+                    (
+                        respawn_monster_index,
+                        distance + stats.respawn_spread * (1 - 2 * self.rng.random()),
+                        lane,
+                    )
+                )
+        return children
+
+    def _update_monsters(self, timestep: int) -> None:
+        arrays = self._monster_arrays
+        slots = arrays.active_slots()
+        dead_slots = arrays.dead_slots(slots)
+        self.player.money += arrays.total_value(dead_slots)
+        children = self._collect_children(dead_slots)
+        arrays.advance(self._lanes, timestep, slots)
+        arrived_slots = arrays.arrived_slots(self._lanes, slots)
+        self.player.health -= arrays.total_damage(arrived_slots)
+        to_remove = np.union1d(dead_slots, arrived_slots)
+        self.monsters.difference_update(arrays.release(to_remove.tolist()))
+        if not children:
+            return
+        child_slots = []
+        for monster_type_id, distance, lane in children:
+            child = arrays.spawn(monster_type_id, distance, lane)
+            child_slots.append(child.get_slot())
+            self.monsters.add(child)
+        arrays.advance(self._lanes, timestep, np.array(child_slots, dtype=np.intp))
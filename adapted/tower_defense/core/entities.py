@@ -1,62 +1,249 @@
+import random
 from dataclasses import dataclass, field
-from typing import Dict, Tuple, Set, List, Optional
+from typing import (
+    Dict,
+    Tuple,
+    List,
+    Optional,
+    Iterable,
+    Iterator,
+    Callable,
+    ClassVar,
+)
 
+from tower_defense.core.distance import distance
 from tower_defense.core.monster.monster import IMonster, MonsterFactory
+from tower_defense.core.ordered_set import OrderedSet
+from tower_defense.core.projectile.intercept import Flight
 from tower_defense.core.projectile.projectile import IProjectile
+from tower_defense.core.scheduler import Scheduler
+from tower_defense.core.spatial_hash import SpatialHash
+from tower_defense.core.tower.targeting_index import (
+    ITargetingIndex,
+    PathTargetingIndex,
+    LaneTargetingIndex,
+)
 from tower_defense.core.tower.tower_entity import ITowerEntity
 from tower_defense.interfaces.tower_factory import ITowerFactory
-from tower_defense.path import Path
+from tower_defense.interfaces.entity import IEntity
+from tower_defense.path import Path, Vector
 from tower_defense.player import Player
 from tower_defense.interfaces.updatable import Updatable
 
 
 @dataclass
 class Entities(Updatable):
-    _path: Path = field(default_factory=list)
+    _path: Path = field(default_factory=Path)
     _monster_factories: List[MonsterFactory] = field(default_factory=list)
     player: Player = field(default_factory=Player)
-    projectiles: Set[IProjectile] = field(default_factory=set)
-    monsters: Set[IMonster] = field(default_factory=set)
+    # Iterated in insertion order, so that a seeded game can be played again exactly
+    projectiles: OrderedSet[IProjectile] = field(default_factory=OrderedSet)
+    monsters: OrderedSet[IMonster] = field(default_factory=OrderedSet)
     towers: Dict[Tuple[int, int], ITowerEntity] = field(default_factory=dict)
+    # Simulation time at the start of the current tick, in milliseconds
+    time: int = 0
+    # Resolve the tracking projectiles by scheduling their hit when they are shot,
+    # instead of moving them at every tick
+    analytic_projectiles: bool = False
+    # Source of every random draw of the simulation
+    rng: random.Random = field(default_factory=random.Random)
+    # Every path the monsters may follow, `_path` being the first one: only `_path`
+    # if empty
+    _lanes: List[Path] = field(default_factory=list)
+    # Broadphase over the monsters' positions, rebuilt once per tick
+    _monster_hash: SpatialHash[IMonster] = field(
+        default_factory=SpatialHash, init=False, repr=False
+    )
+    # Monsters sorted along the path, rebuilt once per tick and shared by the towers
+    _targeting_index: ITargetingIndex = field(init=False, repr=False)
+    # Towers waiting for their reload, and slowed monsters waiting for their speed back
+    tower_reloads: Scheduler[ITowerEntity] = field(
+        default_factory=Scheduler, init=False, repr=False
+    )
+    slow_expiries: Scheduler[IMonster] = field(
+        default_factory=Scheduler, init=False, repr=False
+    )
+    # Tracking projectiles resolved analytically
+    flights: OrderedSet[Flight] = field(
+        default_factory=OrderedSet, init=False, repr=False
+    )
+    _projectile_hits: Scheduler[Flight] = field(
+        default_factory=Scheduler, init=False, repr=False
+    )
+    # Whether the whole state of the game can be written by `save_game`
+    can_be_saved: ClassVar[bool] = True
+
+    def __post_init__(self) -> None:
+        if self._lanes:
+            self._path = self._lanes[0]
+        else:
+            self._lanes = [self._path]
+        self._targeting_index = (
+            PathTargetingIndex(self._path)
+            if len(self._lanes) == 1
+            else LaneTargetingIndex(self._lanes)
+        )
+
+    def _rebuild_monster_hash(self) -> None:
+        self._monster_hash.rebuild(self.monsters)
+
+    def _rebuild_targeting_index(self) -> None:
+        self._targeting_index.rebuild(self.monsters)
 
     def _cleanup_projectiles(self, timestep: int) -> None:
+        if self.projectiles:
+            self._rebuild_monster_hash()
         to_remove = set()
         for projectile in self.projectiles:
             projectile.update_position(timestep)
             if projectile.is_out_of_range() or projectile.get_target().is_dead():
                 to_remove.add(projectile)
                 continue
-            for monster in projectile.get_hit_monsters(self.monsters):
-                projectile.apply_effects(monster)
+            for monster in projectile.get_hit_monsters(self._monster_hash):
+                self._apply_effects(projectile, monster)
                 to_remove.add(projectile)
         self.projectiles.difference_update(to_remove)
 
+    def _apply_effects(self, projectile: IProjectile, monster: IMonster) -> None:
+        projectile.apply_effects(monster)
+        slow_duration = monster.pop_slow_duration()
+        if slow_duration is not None:
+            self.slow_expiries.schedule(self.time + slow_duration, monster)
+
+    def _launch(self, flight: Flight) -> None:
+        self.flights.add(flight)
+        self._projectile_hits.schedule(flight.hit_time, flight)
+
+    def _resolve_flights(self, timestep: int) -> None:
+        for flight in self._projectile_hits.pop_due(self.time + timestep):
+            self.flights.discard(flight)
+            target = flight.get_target()
+            if target.is_dead():
+                continue
+            if flight.is_on_course(self.time):
+                self._apply_effects(flight.get_projectile(), target)
+            else:
+                # The target was slowed down since the shot: aim again
+                self._launch(flight.replan(self.time))
+
     def _update_monsters(self, timestep: int) -> None:
         to_remove = set()
-        to_add = set()
+        to_add: List[IMonster] = []
+        lanes = self._lanes
         for monster in self.monsters:
+            path = lanes[monster.lane_]
             if not monster.alive:
                 to_remove.add(monster)
                 self.player.money += monster.get_value()
-                for child in monster.get_children(self._monster_factories):
-                    child.update_position(self._path, timestep)
-                    to_add.add(child)
-            monster.update_position(self._path, timestep)
-            if monster.has_arrived(self._path):
+                for child in monster.get_children(self._monster_factories, self.rng):
+                    child.update_position(path, timestep)
+                    to_add.append(child)
+            monster.update_position(path, timestep)
+            if monster.has_arrived(path):
                 to_remove.add(monster)
                 self.player.health -= monster.get_damage()
         self.monsters.difference_update(to_remove)
         self.monsters.update(to_add)
 
+    def _expire_slow_effects(self, timestep: int) -> None:
+        for monster in self.slow_expiries.pop_due(self.time + timestep):
+            monster.restore_speed()
+
     def _generate_projectiles(self, timestep: int) -> None:
+        for reloaded_tower in self.tower_reloads.pop_due(self.time):
+            reloaded_tower.reload()
+        if self.towers:
+            self._rebuild_targeting_index()
         for tower in self.towers.values():
-            tower.select_target(self.monsters)
-            self.projectiles.update(tower.shoot(timestep))
+            if not tower.is_loaded():
+                # The target of a sticky tower is locked as soon as it is selected
+                if tower.sticky_target:
+                    tower.select_target(self._targeting_index)
+                else:
+                    self._drop_stale_target(tower)
+                continue
+            tower.select_target(self._targeting_index)
+            self._add_projectiles(tower.shoot(), timestep)
+            if not tower.is_loaded():
+                self.tower_reloads.schedule(self.time + tower.get_reload_time(), tower)
+
+    def _drop_stale_target(self, tower: ITowerEntity) -> None:
+        # The next target is selected once the tower is reloaded: until then, only a
+        # target gone from the game or out of reach is dropped
+        target = tower.get_target()
+        if target is not None and (
+            target not in self.monsters
+            or not target.alive
+            or distance(tower, target) > tower.get_range()
+        ):
+            tower.set_target(None)
+
+    def _add_projectiles(
+        self, projectiles: Iterable[IProjectile], timestep: int
+    ) -> None:
+        if not self.analytic_projectiles:
+            self.projectiles.update(projectiles)
+            return
+        for projectile in projectiles:
+            if projectile.is_tracking():
+                # Shot at the end of the tick, from where the tower stands
+                self.fly(projectile, projectile.get_position(), self.time + timestep)
+            else:
+                self.projectiles.add(projectile)
 
-    def spawn_monster(self, monster_type_id: int) -> None:
+    def fly(self, projectile: IProjectile, origin: Vector, launch_time: int) -> None:
+        """Schedule the hit of a tracking projectile launched from `origin`"""
+        path = self._lanes[projectile.get_target().lane_]
+        self._launch(Flight(projectile, path, origin, launch_time))
+
+    def count_projectiles(self) -> int:
+        return len(self.projectiles) + len(self.flights)
+
+    def iter_projectiles(self) -> Iterator[IEntity]:
+        yield from self.projectiles
+        for flight in self.flights:
+            if not flight.get_target().is_dead():
+                flight.materialize(self.time)
+                yield flight
+
+    def get_path(self) -> Path:
+        return self._path
+
+    def get_lanes(self) -> List[Path]:
+        return self._lanes
+
+    def _pick_lane(self) -> int:
+        # Nothing is drawn with a single lane, so that the draws of the game are the
+        # same as before lanes existed
+        if len(self._lanes) == 1:
+            return 0
+        return self.rng.randrange(len(self._lanes))
+
+    def get_monster_type_ids(self) -> Dict[str, int]:
+        """Map the model name of each type of monster to its type identifier"""
+        return {
+            factory().get_model_name(): monster_type_id
+            for monster_type_id, factory in enumerate(self._monster_factories)
+        }
+
+    def create_monster(
+        self, monster_type_id: int, distance: float = 0.0, lane: int = 0
+    ) -> IMonster:
+        """Create a monster, without adding it to the game"""
         monster_factory: MonsterFactory = self._monster_factories[monster_type_id]
-        monster: IMonster = monster_factory()
+        monster = monster_factory(distance)
+        monster.lane_ = lane
+        return monster
+
+    def spawn_monster(
+        self, monster_type_id: int, lane: Optional[int] = None
+    ) -> IMonster:
+        """Add a monster at the start of a lane, picked at random if None"""
+        monster: IMonster = self.create_monster(
+            monster_type_id, lane=self._pick_lane() if lane is None else lane
+        )
         self.monsters.add(monster)
+        return monster
 
     def try_build_tower(
         self, tower_factory: ITowerFactory, position: Tuple[int, int]
@@ -71,15 +258,46 @@ class Entities(Updatable):
         self.player.money -= tower_factory.get_cost()
         return True
 
+    def sell_tower(self, tower_position: Tuple[int, int]) -> None:
+        tower = self.towers.pop(tower_position, None)
+        if tower is not None:
+            self.tower_reloads.cancel(tower)
+            self._targeting_index.forget_range(tower.get_position(), tower.get_range())
+
     def upgrade_tower(self, tower_position: Tuple[int, int]) -> None:
         tower: ITowerEntity = self.towers[tower_position]
         upgrade_cost: Optional[int] = tower.get_upgrade_cost()
         if upgrade_cost is None or self.player.money < upgrade_cost:
             return
         self.player.money -= upgrade_cost
+        previous_range = tower.get_range()
         tower.upgrade()
+        if tower.get_range() != previous_range:
+            self._targeting_index.forget_range(tower.get_position(), previous_range)
+
+    def get_phases(self) -> List[Tuple[str, Callable[[int], None]]]:
+        """Return the steps of `update`, in order, to time them separately"""
+        return [
+            ("resolve_flights", self._resolve_flights),
+            ("cleanup_projectiles", self._cleanup_projectiles),
+            ("update_monsters", self._update_monsters),
+            ("expire_slow_effects", self._expire_slow_effects),
+            ("generate_projectiles", self._generate_projectiles),
+        ]
+
+    def advance_time(self, timestep: int) -> None:
+        self.time += timestep
+
+    def update(
+        self, timestep: int, on_phase_end: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """Run the phases of a tick, then advance the time
 
-    def update(self, timestep: int) -> None:
-        self._cleanup_projectiles(timestep)
-        self._update_monsters(timestep)
-        self._generate_projectiles(timestep)
+        :param on_phase_end: called with the name of each phase once it is over, to
+            time the phases
+        """
+        for name, phase in self.get_phases():
+            phase(timestep)
+            if on_phase_end is not None:
+                on_phase_end(name)
+        self.advance_time(timestep)
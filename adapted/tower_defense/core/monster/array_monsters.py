@@ -0,0 +1,338 @@
+import random
+from typing import Dict, List, Tuple, Iterable, Sequence, Optional
+
+import numpy as np
+
+from tower_defense.core.monster.monster import IMonster, MonsterFactory
+from tower_defense.core.monster.monster_stats import MonsterStats
+from tower_defense.core.spatial_hash import Cell
+from tower_defense.path import Path, Track
+
+
+class _Columns:
+    """Per-monster state, stored as one contiguous array per attribute"""
+
+    def __init__(self, capacity: int):
+        self.type_id = np.zeros(capacity, dtype=np.int64)
+        self.lane = np.zeros(capacity, dtype=np.int64)
+        self.health = np.zeros(capacity, dtype=np.int64)
+        self.speed = np.zeros(capacity, dtype=np.float64)
+        self.distance = np.zeros(capacity, dtype=np.float64)
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        # Rank of the spawn, which orders the monsters like the set of the entities
+        self.spawn_rank = np.zeros(capacity, dtype=np.int64)
+
+    def _arrays(self) -> List[str]:
+        return list(vars(self))
+
+    def resize(self, capacity: int) -> None:
+        for name in self._arrays():
+            array = getattr(self, name)
+            resized = np.zeros(capacity, dtype=array.dtype)
+            resized[: len(array)] = array[:capacity]
+            setattr(self, name, resized)
+
+    def take(self, slot: int) -> "_Columns":
+        columns = _Columns(0)
+        for name in self._arrays():
+            setattr(columns, name, getattr(self, name)[slot : slot + 1].copy())
+        return columns
+
+
+class ArrayMonster(IMonster):
+    """View of one monster stored in a MonsterArrays
+
+    When the monster is removed from the store, its last state is copied so that the
+    towers and projectiles still referencing it see a consistent monster.
+    """
+
+    def __init__(self, stats: Sequence[MonsterStats], columns: _Columns, slot: int):
+        self._all_stats = stats
+        self._columns = columns
+        self._slot = slot
+        self._slow_duration: Optional[int] = None
+
+    def get_slot(self) -> int:
+        return self._slot
+
+    def _detach(self) -> None:
+        self._columns = self._columns.take(self._slot)
+        self._slot = 0
+
+    @property
+    def _stats(self) -> MonsterStats:
+        return self._all_stats[self._columns.type_id[self._slot]]
+
+    @property  # type: ignore[override]
+    def health_(self) -> int:
+        return int(self._columns.health[self._slot])
+
+    @health_.setter
+    def health_(self, health: int) -> None:
+        self._columns.health[self._slot] = health
+
+    @property  # type: ignore[override]
+    def distance_travelled_(self) -> float:
+        return float(self._columns.distance[self._slot])
+
+    @distance_travelled_.setter
+    def distance_travelled_(self, distance: float) -> None:
+        self._columns.distance[self._slot] = distance
+
+    @property  # type: ignore[override]
+    def lane_(self) -> int:
+        return int(self._columns.lane[self._slot])
+
+    @lane_.setter
+    def lane_(self, lane: int) -> None:
+        self._columns.lane[self._slot] = lane
+
+    def get_value(self) -> int:
+        return self._stats.value
+
+    def update_position(self, path: Track, timestep: int) -> None:
+        columns, slot = self._columns, self._slot
+        columns.distance[slot] += columns.speed[slot] * timestep / 1000
+        columns.x[slot], columns.y[slot] = path.compute_position(
+            float(columns.distance[slot])
+        )
+
+    def has_arrived(self, path: Track) -> bool:
+        return path.has_arrived(self.distance_travelled_)
+
+    def get_damage(self) -> int:
+        return self._stats.damage
+
+    def get_max_health(self) -> int:
+        return self._stats.max_health
+
+    def get_speed(self) -> float:
+        return float(self._columns.speed[self._slot])
+
+    def inflict_damage(self, damage: int) -> None:
+        self._columns.health[self._slot] -= damage
+
+    def slow_down(self, slow_factor: float, duration: float) -> None:
+        columns, slot = self._columns, self._slot
+        if columns.speed[slot] != self._stats.speed:
+            return
+        self._slow_duration = int(duration * 1000)
+        columns.speed[slot] /= slow_factor
+
+    def pop_slow_duration(self) -> Optional[int]:
+        slow_duration, self._slow_duration = self._slow_duration, None
+        return slow_duration
+
+    def restore_speed(self) -> None:
+        self._columns.speed[self._slot] = self._stats.speed
+
+    def get_position(self) -> Tuple[float, float]:
+        return float(self._columns.x[self._slot]), float(self._columns.y[self._slot])
+
+    def get_orientation(self) -> float:
+        return 0.0
+
+    def get_model_name(self) -> str:
+        return self._stats.name
+
+    @property
+    def alive(self) -> bool:
+        return self.health_ > 0
+
+    def get_children(
+        self, monster_factories: List[MonsterFactory], rng: random.Random
+    ) -> Iterable[IMonster]:
+        # The children are spawned in the arrays by ArrayEntities
+        raise NotImplementedError("The children of array monsters are spawned in bulk")
+
+
+class _PathTables:
+    """NumPy copy of the lookup tables of a path, for batched position lookups"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.xs = np.array(path.xs, dtype=np.float64)
+        self.ys = np.array(path.ys, dtype=np.float64)
+        self.dxs = np.array(path.dxs, dtype=np.float64)
+        self.dys = np.array(path.dys, dtype=np.float64)
+
+    def compute_positions(self, distances: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Vectorized equivalent of Path.compute_position
+        int_part, last_block_distance = np.divmod(distances, 1.0)
+        last_block_distance[int_part < 0] = 0.0
+        index = np.clip(int_part, 0, self.path.arrival_distance).astype(np.intp)
+        xs = self.xs[index] + last_block_distance * self.dxs[index]
+        ys = self.ys[index] + last_block_distance * self.dys[index]
+        return xs, ys
+
+
+class MonsterArrays:
+    """Struct-of-arrays store of monsters, advanced with one vectorized step"""
+
+    def __init__(self, monster_stats: Sequence[MonsterStats], capacity: int = 64):
+        self._stats: List[MonsterStats] = list(monster_stats)
+        self._values = np.array([stats.value for stats in self._stats], dtype=np.int64)
+        self._damages = np.array(
+            [stats.damage for stats in self._stats], dtype=np.int64
+        )
+        self._columns = _Columns(capacity)
+        self._active = np.zeros(capacity, dtype=bool)
+        # Object array, so that the monsters of many slots are gathered at once
+        self._proxies = np.full(capacity, None, dtype=object)
+        self._free_slots: List[int] = list(reversed(range(capacity)))
+        self._path_tables: List[_PathTables] = []
+        self._spawn_count = 0
+
+    def __len__(self) -> int:
+        return len(self._proxies) - len(self._free_slots)
+
+    def _grow(self) -> None:
+        capacity = len(self._proxies)
+        new_capacity = 2 * capacity if capacity else 64
+        # The arrays are replaced in place, so the live ArrayMonsters see them
+        self._columns.resize(new_capacity)
+        self._active = np.concatenate(
+            [self._active, np.zeros(new_capacity - capacity, dtype=bool)]
+        )
+        self._proxies = np.concatenate(
+            [self._proxies, np.full(new_capacity - capacity, None, dtype=object)]
+        )
+        self._free_slots.extend(reversed(range(capacity, new_capacity)))
+
+    def spawn(
+        self, monster_type_id: int, distance: float = 0.0, lane: int = 0
+    ) -> ArrayMonster:
+        if not self._free_slots:
+            self._grow()
+        slot = self._free_slots.pop()
+        stats = self._stats[monster_type_id]
+        columns = self._columns
+        columns.type_id[slot] = monster_type_id
+        columns.lane[slot] = lane
+        columns.health[slot] = stats.max_health
+        columns.speed[slot] = stats.speed
+        columns.distance[slot] = max(distance, 0.0)
+        columns.x[slot] = columns.y[slot] = 0.0
+        columns.spawn_rank[slot] = self._spawn_count
+        self._spawn_count += 1
+        self._active[slot] = True
+        proxy = ArrayMonster(self._stats, columns, slot)
+        self._proxies[slot] = proxy
+        return proxy
+
+    def release(self, slots: Iterable[int]) -> List[ArrayMonster]:
+        released = []
+        for slot in slots:
+            proxy = self._proxies[slot]
+            assert proxy is not None
+            proxy._detach()
+            released.append(proxy)
+            self._proxies[slot] = None
+            self._active[slot] = False
+            self._free_slots.append(slot)
+        return released
+
+    def get_stats(self, slot: int) -> MonsterStats:
+        return self._stats[self._columns.type_id[slot]]
+
+    def get_distance(self, slot: int) -> float:
+        return float(self._columns.distance[slot])
+
+    def get_lane(self, slot: int) -> int:
+        return int(self._columns.lane[slot])
+
+    def active_slots(self) -> np.ndarray:
+        return np.flatnonzero(self._active)
+
+    def dead_slots(self, slots: np.ndarray) -> np.ndarray:
+        return slots[self._columns.health[slots] <= 0]
+
+    def arrived_slots(self, lanes: Sequence[Path], slots: np.ndarray) -> np.ndarray:
+        distances = self._columns.distance[slots]
+        if len(lanes) == 1:
+            return slots[distances >= lanes[0].arrival_distance]
+        arrival_distances = np.array([lane.arrival_distance for lane in lanes])
+        return slots[distances >= arrival_distances[self._columns.lane[slots]]]
+
+    def sort_by_distance(
+        self, slots: np.ndarray
+    ) -> Tuple[List[ArrayMonster], List[float], List[int]]:
+        """Return the monsters of `slots` sorted by distance, their distance and lane
+
+        The monsters at the same distance are in the order they were spawned.
+        """
+        columns = self._columns
+        distances = columns.distance[slots]
+        order = np.lexsort((columns.spawn_rank[slots], distances))
+        sorted_slots = slots[order]
+        return (
+            self._proxies[sorted_slots].tolist(),
+            distances[order].tolist(),
+            columns.lane[sorted_slots].tolist(),
+        )
+
+    def bucket_by_cell(
+        self, slots: np.ndarray, cell_size: float
+    ) -> Dict[Cell, List[ArrayMonster]]:
+        """Group the monsters of `slots` by cell of a grid, like SpatialHash.rebuild
+
+        The cells are in the order of the first monster spawned in each of them, and
+        the monsters of a cell in the order they were spawned.
+        """
+        if not len(slots):
+            return {}
+        columns = self._columns
+        spawn_ranks = columns.spawn_rank[slots]
+        cols = np.floor(columns.x[slots] / cell_size).astype(np.int64)
+        rows = np.floor(columns.y[slots] / cell_size).astype(np.int64)
+        order = np.lexsort((spawn_ranks, rows, cols))
+        cols, rows, spawn_ranks = cols[order], rows[order], spawn_ranks[order]
+        monsters = self._proxies[slots[order]].tolist()
+        starts = np.flatnonzero(
+            np.concatenate([[True], (cols[1:] != cols[:-1]) | (rows[1:] != rows[:-1])])
+        )
+        ends = np.append(starts[1:], len(monsters))
+        cell_order = np.argsort(spawn_ranks[starts])
+        return {
+            (col, row): monsters[start:end]
+            for col, row, start, end in zip(
+                cols[starts][cell_order].tolist(),
+                rows[starts][cell_order].tolist(),
+                starts[cell_order].tolist(),
+                ends[cell_order].tolist(),
+            )
+        }
+
+    def total_value(self, slots: np.ndarray) -> int:
+        return int(self._values[self._columns.type_id[slots]].sum())
+
+    def total_damage(self, slots: np.ndarray) -> int:
+        return int(self._damages[self._columns.type_id[slots]].sum())
+
+    def _get_path_tables(self, lanes: Sequence[Path]) -> List[_PathTables]:
+        if len(self._path_tables) != len(lanes) or any(
+            tables.path is not lane for tables, lane in zip(self._path_tables, lanes)
+        ):
+            self._path_tables = [_PathTables(lane) for lane in lanes]
+        return self._path_tables
+
+    def advance(self, lanes: Sequence[Path], timestep: int, slots: np.ndarray) -> None:
+        all_path_tables = self._get_path_tables(lanes)
+        columns = self._columns
+        distances = columns.distance[slots] + columns.speed[slots] * timestep / 1000
+        columns.distance[slots] = distances
+        if len(all_path_tables) == 1:
+            path_tables = all_path_tables[0]
+            columns.x[slots], columns.y[slots] = path_tables.compute_positions(
+                distances
+            )
+            return
+        slot_lanes = columns.lane[slots]
+        for lane, path_tables in enumerate(all_path_tables):
+            on_lane = slot_lanes == lane
+            lane_slots = slots[on_lane]
+            (
+                columns.x[lane_slots],
+                columns.y[lane_slots],
+            ) = path_tables.compute_positions(distances[on_lane])
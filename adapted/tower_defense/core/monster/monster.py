@@ -1,13 +1,16 @@
+import random
 from abc import ABC, abstractmethod
-from typing import List, Protocol, Iterable
+from typing import List, Protocol, Iterable, Optional
 
 from tower_defense.interfaces.monster_view import IMonsterView
-from tower_defense.path import Path
+from tower_defense.path import Track
 
 
 class IMonster(IMonsterView, ABC):
     health_: int
     distance_travelled_: float
+    # Index of the lane followed by the monster
+    lane_: int = 0
 
     def is_dead(self) -> bool:
         return self.health_ <= 0
@@ -27,26 +30,41 @@ class IMonster(IMonsterView, ABC):
 
     @abstractmethod
     def get_children(
-        self, monster_factories: List["MonsterFactory"]
+        self, monster_factories: List["MonsterFactory"], rng: random.Random
     ) -> Iterable["IMonster"]:
         ...
 
     @abstractmethod
-    def update_position(self, path: Path, timestep: int) -> None:
+    def update_position(self, path: Track, timestep: int) -> None:
         ...
 
     @abstractmethod
-    def has_arrived(self, path: Path) -> bool:
+    def has_arrived(self, path: Track) -> bool:
         ...
 
     @abstractmethod
     def get_damage(self) -> int:
         ...
 
+    @abstractmethod
+    def get_speed(self) -> float:
+        """Return the current speed of the monster, in blocks per second"""
+
     @abstractmethod
     def slow_down(self, slow_factor: float, duration: float) -> None:
         ...
 
+    @abstractmethod
+    def pop_slow_duration(self) -> Optional[int]:
+        """Return the duration of the slow effect started since the last call, if any
+
+        :return: the duration in milliseconds, after which `restore_speed` is due
+        """
+
+    @abstractmethod
+    def restore_speed(self) -> None:
+        ...
+
 
 class MonsterFactory(Protocol):
     def __call__(self, distance: float = 0.0) -> IMonster:
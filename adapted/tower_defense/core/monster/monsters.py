@@ -1,10 +1,9 @@
 import random
-from typing import List, Tuple, Iterable
+from typing import List, Tuple, Iterable, Optional
 
-from tower_defense.core.count_down import CountDown
 from tower_defense.core.monster.monster import IMonster, MonsterFactory
 from tower_defense.core.monster.monster_stats import MonsterStats
-from tower_defense.path import Path, has_arrived, compute_position
+from tower_defense.path import Track
 
 
 class Monster(IMonster):
@@ -12,7 +11,7 @@ class Monster(IMonster):
         self._stats = stats
         self.health_ = stats.max_health
         self._speed = stats.speed
-        self._countdown = CountDown()
+        self._slow_duration: Optional[int] = None
         self.distance_travelled_ = max(distance, 0.0)
         self._x: float = 0.0
         self._y: float = 0.0
@@ -20,15 +19,12 @@ class Monster(IMonster):
     def get_value(self) -> int:
         return self._stats.value
 
-    def update_position(self, path: Path, timestep: int) -> None:
+    def update_position(self, path: Track, timestep: int) -> None:
         self.distance_travelled_ += self._speed * timestep / 1000
-        self._x, self._y = compute_position(path, self.distance_travelled_)
-        self._countdown.update(timestep=timestep)
-        if self._countdown.ended():
-            self._speed = self._stats.speed
+        self._x, self._y = path.compute_position(self.distance_travelled_)
 
-    def has_arrived(self, path: Path) -> bool:
-        return has_arrived(path, self.distance_travelled_)
+    def has_arrived(self, path: Track) -> bool:
+        return path.has_arrived(self.distance_travelled_)
 
     def get_damage(self) -> int:
         return self._stats.damage
@@ -36,15 +32,25 @@ class Monster(IMonster):
     def get_max_health(self) -> int:
         return self._stats.max_health
 
+    def get_speed(self) -> float:
+        return self._speed
+
     def inflict_damage(self, damage: int) -> None:
         self.health_ -= damage
 
     def slow_down(self, slow_factor: float, duration: float) -> None:
         if self._speed != self._stats.speed:
             return
-        self._countdown.start(int(duration * 1000))
+        self._slow_duration = int(duration * 1000)
         self._speed /= slow_factor
 
+    def pop_slow_duration(self) -> Optional[int]:
+        slow_duration, self._slow_duration = self._slow_duration, None
+        return slow_duration
+
+    def restore_speed(self) -> None:
+        self._speed = self._stats.speed
+
     def get_position(self) -> Tuple[float, float]:
         return self._x, self._y
 
@@ -59,14 +65,16 @@ class Monster(IMonster):
         return self.health_ > 0
 
     def get_children(
-        self, monster_factories: List[MonsterFactory]
+        self, monster_factories: List[MonsterFactory], rng: random.Random
     ) -> Iterable[IMonster]:
         for respawn_monster_index in self._stats.respawn_indices:
             factory = monster_factories[respawn_monster_index]
-            yield factory(
+            child = factory(
                 self.distance_travelled_
-                + self._stats.respawn_spread * (1 - 2 * random.random()),
+                + self._stats.respawn_spread * (1 - 2 * rng.random()),
             )
+            child.lane_ = self.lane_
+            yield child
 
 
 def monster_factory(stats: MonsterStats) -> MonsterFactory:
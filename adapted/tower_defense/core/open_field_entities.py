@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, ClassVar
+
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.monster import IMonster
+from tower_defense.core.projectile.intercept import Flight
+from tower_defense.core.projectile.projectile import IProjectile
+from tower_defense.core.tower.targeting_index import SortedTargetingIndex
+from tower_defense.flow_field import FlowField, FlowFieldTrack
+from tower_defense.grid import Grid
+from tower_defense.interfaces.tower_factory import ITowerFactory
+from tower_defense.path import Vector
+
+
+@dataclass
+class OpenFieldEntities(Entities):
+    """Entities whose monsters walk across the open blocks, around the towers
+
+    The monsters appear at the start of their lane, then walk down a flow field to
+    the exit of the lanes, across the walkable and constructible blocks. A tower is
+    only built if every spawn and every monster can still reach the exit.
+    """
+
+    _grid: Grid = field(default_factory=Grid)
+    _flow_field: FlowField = field(init=False, repr=False)
+    _tracks: Dict[IMonster, FlowFieldTrack] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # The blocks walked by each monster would have to be saved too
+    can_be_saved: ClassVar[bool] = False
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._flow_field = FlowField(self._grid, self._path[-1], self.towers)
+        # The monsters are not sorted along a path anymore
+        self._targeting_index = SortedTargetingIndex()
+
+    def _get_track(self, monster: IMonster) -> FlowFieldTrack:
+        try:
+            return self._tracks[monster]
+        except KeyError:
+            track = FlowFieldTrack(self._flow_field, [self._lanes[monster.lane_][0]])
+            self._tracks[monster] = track
+            return track
+
+    def _update_monsters(self, timestep: int) -> None:
+        to_remove = set()
+        to_add: List[IMonster] = []
+        for monster in self.monsters:
+            track = self._get_track(monster)
+            if not monster.alive:
+                to_remove.add(monster)
+                self.player.money += monster.get_value()
+                for child in monster.get_children(self._monster_factories, self.rng):
+                    # The children go on from where their parent was
+                    child_track = self._tracks[child] = track.copy()
+                    child.update_position(child_track, timestep)
+                    to_add.append(child)
+            monster.update_position(track, timestep)
+            if monster.has_arrived(track):
+                to_remove.add(monster)
+                self.player.health -= monster.get_damage()
+        for monster in to_remove:
+            del self._tracks[monster]
+        self.monsters.difference_update(to_remove)
+        self.monsters.update(to_add)
+
+    def fly(self, projectile: IProjectile, origin: Vector, launch_time: int) -> None:
+        path = self._get_track(projectile.get_target()).to_path()
+        self._launch(Flight(projectile, path, origin, launch_time))
+
+    def _is_way_open(self) -> bool:
+        flow_field = self._flow_field
+        return all(flow_field.is_reachable(lane[0]) for lane in self._lanes) and all(
+            flow_field.is_reachable(block)
+            for monster in self.monsters
+            for block in self._get_track(monster).get_heading()
+        )
+
+    def try_build_tower(
+        self, tower_factory: ITowerFactory, position: Tuple[int, int]
+    ) -> bool:
+        if (
+            self.player.money < tower_factory.get_cost()
+            or self.towers.get(position) is not None
+            or any(
+                position in self._get_track(monster).get_heading()
+                for monster in self.monsters
+            )
+        ):
+            return False
+        self._flow_field.block(position)
+        if not self._is_way_open():
+            self._flow_field.unblock(position)
+            return False
+        return super().try_build_tower(tower_factory, position)
+
+    def sell_tower(self, tower_position: Tuple[int, int]) -> None:
+        if tower_position in self.towers:
+            super().sell_tower(tower_position)
+            self._flow_field.unblock(tower_position)
@@ -0,0 +1,40 @@
+from typing import Dict, Iterable, Iterator, MutableSet, TypeVar
+
+T = TypeVar("T")
+
+
+class OrderedSet(MutableSet[T]):
+    """Set iterated in insertion order
+
+    The built-in set iterates over objects in the order of their hashes, which are
+    derived from their memory addresses: two identical runs would not process the
+    entities in the same order.
+    """
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: Dict[T, None] = dict.fromkeys(items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items)!r})"
+
+    def add(self, item: T) -> None:
+        self._items[item] = None
+
+    def discard(self, item: T) -> None:
+        self._items.pop(item, None)
+
+    def update(self, items: Iterable[T]) -> None:
+        self._items.update(dict.fromkeys(items))
+
+    def difference_update(self, items: Iterable[T]) -> None:
+        for item in items:
+            self._items.pop(item, None)
@@ -0,0 +1,155 @@
+import math
+from typing import Optional, Tuple
+
+from tower_defense.core.monster.monster import IMonster
+from tower_defense.core.projectile.projectile import IProjectile
+from tower_defense.interfaces.entity import IEntity
+from tower_defense.path import Path, Vector
+
+# Distance under which a target is considered where its flight predicted it to be
+_COURSE_TOLERANCE = 1e-6
+
+
+def _first_root(a: float, b: float, c: float, upper: float) -> Optional[float]:
+    """Return the smallest t in [0, upper] such that a * t² + b * t + c <= 0
+
+    The constant term `c` must be positive, so that t = 0 is not a solution.
+    """
+    if a == 0.0:
+        if b >= 0.0:
+            return None
+        root = -c / b
+    else:
+        discriminant = b * b - 4.0 * a * c
+        if discriminant < 0.0:
+            return None
+        sqrt_discriminant = math.sqrt(discriminant)
+        roots = sorted(
+            (
+                (-b - sqrt_discriminant) / (2.0 * a),
+                (-b + sqrt_discriminant) / (2.0 * a),
+            )
+        )
+        positive_roots = [r for r in roots if r >= 0.0]
+        if not positive_roots:
+            return None
+        root = positive_roots[0]
+    return root if root <= upper else None
+
+
+def solve_intercept(
+    path: Path,
+    origin: Vector,
+    speed: float,
+    hitbox_radius: float,
+    target_distance: float,
+    target_speed: float,
+) -> Tuple[float, Vector]:
+    """Find when a projectile flying straight from `origin` first reaches its target
+
+    The target moves along `path` at a constant speed, so its position is linear on
+    each block of the path: on each of them, the hit condition
+    |target(t) - origin| <= speed * t + hitbox_radius is a quadratic inequality.
+
+    :return: the time to impact, in seconds, and the position of the target then
+    """
+    if speed <= 0.0:
+        raise ValueError(f"Cannot intercept a target at speed {speed}")
+    ox, oy = origin
+    start = 0.0
+    while True:
+        x, y = path.compute_position(target_distance)
+        moving = target_speed > 0.0 and target_distance < path.arrival_distance
+        if moving:
+            index = max(int(target_distance), 0)
+            duration = (index + 1 - target_distance) / target_speed
+            wx = target_speed * path.dxs[index]
+            wy = target_speed * path.dys[index]
+        else:
+            duration = math.inf
+            wx = wy = 0.0
+        dx, dy = x - ox, y - oy
+        reach = speed * start + hitbox_radius
+        c = dx * dx + dy * dy - reach * reach
+        if c <= 0.0:
+            return start, (x, y)
+        a = wx * wx + wy * wy - speed * speed
+        b = 2.0 * (dx * wx + dy * wy - reach * speed)
+        time = _first_root(a, b, c, duration)
+        if time is not None:
+            return start + time, (x + wx * time, y + wy * time)
+        start += duration
+        target_distance = index + 1
+
+
+class Flight(IEntity):
+    """Tracking projectile flying straight to the point where it meets its target
+
+    Its position is only computed when `materialize` is called, for the views.
+    """
+
+    def __init__(
+        self, projectile: IProjectile, path: Path, origin: Vector, launch_time: int
+    ):
+        self._projectile = projectile
+        self._path = path
+        self._origin = origin
+        self._launch_time = launch_time
+        target = projectile.get_target()
+        self._target_distance = target.distance_travelled_
+        self._target_speed = target.get_speed()
+        speed = projectile.get_speed()
+        seconds, target_position = solve_intercept(
+            path,
+            origin,
+            speed,
+            projectile.get_hitbox_radius(),
+            self._target_distance,
+            self._target_speed,
+        )
+        self.hit_time: int = launch_time + math.ceil(seconds * 1000)
+        length = math.dist(origin, target_position)
+        travelled = min(length, speed * seconds)
+        scale = travelled / length if length > 0.0 else 0.0
+        self._impact: Vector = (
+            origin[0] + scale * (target_position[0] - origin[0]),
+            origin[1] + scale * (target_position[1] - origin[1]),
+        )
+        self._position: Vector = origin
+
+    def get_projectile(self) -> IProjectile:
+        return self._projectile
+
+    def get_target(self) -> IMonster:
+        return self._projectile.get_target()
+
+    def _compute_position(self, time: int) -> Vector:
+        duration = self.hit_time - self._launch_time
+        if duration <= 0:
+            return self._impact
+        fraction = min(max((time - self._launch_time) / duration, 0.0), 1.0)
+        (x, y), (impact_x, impact_y) = self._origin, self._impact
+        return x + fraction * (impact_x - x), y + fraction * (impact_y - y)
+
+    def materialize(self, time: int) -> None:
+        self._position = self._compute_position(time)
+
+    def is_on_course(self, time: int) -> bool:
+        """Tell whether the target is where it was predicted to be at `time`"""
+        elapsed_distance = self._target_speed * (time - self._launch_time) / 1000
+        expected = self._path.compute_position(self._target_distance + elapsed_distance)
+        actual = self.get_target().get_position()
+        return math.dist(expected, actual) <= _COURSE_TOLERANCE
+
+    def replan(self, time: int) -> "Flight":
+        """Aim again at the target, from where the projectile is at `time`"""
+        return Flight(self._projectile, self._path, self._compute_position(time), time)
+
+    def get_position(self) -> Tuple[float, float]:
+        return self._position
+
+    def get_orientation(self) -> float:
+        return self._projectile.get_orientation()
+
+    def get_model_name(self) -> str:
+        return self._projectile.get_model_name()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Set, Iterable
+from typing import Iterable
 
+from tower_defense.core.spatial_hash import SpatialHash
 from tower_defense.interfaces.entity import IEntity
 from tower_defense.core.monster.monster import IMonster
 
@@ -18,12 +19,16 @@ class IProjectile(IEntity, ABC):
     def get_speed(self) -> float:
         ...
 
+    @abstractmethod
+    def get_hitbox_radius(self) -> float:
+        ...
+
     @abstractmethod
     def get_target(self) -> IMonster:
         ...
 
     @abstractmethod
-    def get_hit_monsters(self, monsters: Set[IMonster]) -> Iterable[IMonster]:
+    def get_hit_monsters(self, monsters: SpatialHash[IMonster]) -> Iterable[IMonster]:
         ...
 
     @abstractmethod
@@ -33,3 +38,10 @@ class IProjectile(IEntity, ABC):
     @abstractmethod
     def is_out_of_range(self) -> bool:
         ...
+
+    @abstractmethod
+    def is_tracking(self) -> bool:
+        """Tell whether the projectile chases its target until it hits it
+
+        Such a projectile only ever hits its target, and never goes out of range.
+        """
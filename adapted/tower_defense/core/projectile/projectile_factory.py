@@ -1,5 +1,5 @@
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
 from tower_defense.core.monster.monster import IMonster
 from tower_defense.core.projectile.projectile import IProjectile
@@ -8,7 +8,10 @@ from tower_defense.core.projectile.projectile_strategies import (
     HitStrategy,
 )
 from tower_defense.core.projectile.projectiles import Projectile
-from tower_defense.core.projectile.stats import ProjectileStats
+from tower_defense.core.projectile.stats import (
+    ProjectileStats,
+    FrozenProjectileStats,
+)
 from tower_defense.core.upgradable import UpgradableData
 
 
@@ -18,10 +21,23 @@ class ProjectileFactory(UpgradableData):
     projectile_stats: ProjectileStats
     movement_strategy: MovementStrategy
     hit_strategy: HitStrategy
+    # Built on the first shot at the current level, and dropped on upgrade
+    _frozen_stats: Optional[FrozenProjectileStats] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_range(self) -> float:
         return self.projectile_stats.range.value
 
+    def get_frozen_stats(self) -> FrozenProjectileStats:
+        if self._frozen_stats is None:
+            self._frozen_stats = self.projectile_stats.freeze()
+        return self._frozen_stats
+
+    def upgrade(self) -> None:
+        super().upgrade()
+        self._frozen_stats = None
+
     def create_projectile(
         self, x: float, y: float, angle: float, target: IMonster
     ) -> IProjectile:
@@ -30,7 +46,7 @@ class ProjectileFactory(UpgradableData):
             x,
             y,
             angle,
-            deepcopy(self.projectile_stats),
+            self.get_frozen_stats(),
             self.movement_strategy,
             self.hit_strategy,
             target,
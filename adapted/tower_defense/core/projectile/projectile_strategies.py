@@ -1,12 +1,13 @@
 import math
-from typing import Tuple, Set, Iterable, Callable
+from typing import Tuple, Iterable, Callable
 
 from tower_defense.core.distance import distance
 from tower_defense.core.monster.monster import IMonster
 from tower_defense.core.projectile.projectile import IProjectile
+from tower_defense.core.spatial_hash import SpatialHash
 
 MovementStrategy = Callable[[IProjectile, int], Tuple[float, float]]
-HitStrategy = Callable[[IProjectile, Set[IMonster]], Iterable[IMonster]]
+HitStrategy = Callable[[IProjectile, SpatialHash[IMonster]], Iterable[IMonster]]
 
 
 def tracking_movement_strategy(
@@ -37,7 +38,7 @@ def constant_angle_movement_strategy(
 
 
 def tracking_hit_strategy(
-    projectile: IProjectile, _monsters: Set[IMonster]
+    projectile: IProjectile, _monsters: SpatialHash[IMonster]
 ) -> Iterable[IMonster]:
     target = projectile.get_target()
     if projectile.is_in_range(target):
@@ -45,6 +46,9 @@ def tracking_hit_strategy(
 
 
 def near_enough_hit_strategy(
-    projectile: IProjectile, monsters: Set[IMonster]
+    projectile: IProjectile, monsters: SpatialHash[IMonster]
 ) -> Iterable[IMonster]:
-    return (monster for monster in monsters if projectile.is_in_range(monster))
+    candidates = monsters.query(
+        projectile.get_position(), projectile.get_hitbox_radius()
+    )
+    return (monster for monster in candidates if projectile.is_in_range(monster))
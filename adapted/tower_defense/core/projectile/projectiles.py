@@ -1,5 +1,5 @@
 import math
-from typing import Tuple, Iterable, Set
+from typing import Tuple, Iterable
 
 from tower_defense.interfaces.entity import IEntity
 from tower_defense.core.distance import distance
@@ -8,8 +8,11 @@ from tower_defense.core.projectile.projectile import IProjectile
 from tower_defense.core.projectile.projectile_strategies import (
     MovementStrategy,
     HitStrategy,
+    tracking_movement_strategy,
+    tracking_hit_strategy,
 )
-from tower_defense.core.projectile.stats import ProjectileStats
+from tower_defense.core.projectile.stats import FrozenProjectileStats
+from tower_defense.core.spatial_hash import SpatialHash
 
 
 class Projectile(IProjectile):
@@ -19,10 +22,11 @@ class Projectile(IProjectile):
         x: float,
         y: float,
         angle: float,
-        stats: ProjectileStats,
+        stats: FrozenProjectileStats,
         movement_strategy: MovementStrategy,
         hit_strategy: HitStrategy,
         target: IMonster,
+        travelled_distance: float = 0.0,
     ):
         self.name = name
         self.x = x
@@ -32,7 +36,7 @@ class Projectile(IProjectile):
         self.movement_strategy = movement_strategy
         self.hit_strategy = hit_strategy
         self.target: IMonster = target
-        self._travelled_distance = 0.0
+        self._travelled_distance = travelled_distance
 
     def get_orientation(self) -> float:
         return self.angle
@@ -40,8 +44,14 @@ class Projectile(IProjectile):
     def get_target(self) -> IMonster:
         return self.target
 
+    def get_travelled_distance(self) -> float:
+        return self._travelled_distance
+
     def get_speed(self) -> float:
-        return self.stats.speed.value
+        return self.stats.speed
+
+    def get_hitbox_radius(self) -> float:
+        return self.stats.hitbox_radius
 
     def get_model_name(self) -> str:
         return self.name
@@ -54,7 +64,7 @@ class Projectile(IProjectile):
         self._travelled_distance += math.dist(self.get_position(), new_position)
         self.x, self.y = new_position
 
-    def get_hit_monsters(self, monsters: Set[IMonster]) -> Iterable[IMonster]:
+    def get_hit_monsters(self, monsters: SpatialHash[IMonster]) -> Iterable[IMonster]:
         return self.hit_strategy(self, monsters)
 
     def apply_effects(self, monster: IMonster) -> None:
@@ -63,9 +73,15 @@ class Projectile(IProjectile):
 
     def is_out_of_range(self) -> bool:
         return (
-            self.stats.range_sensitive.value
-            and self._travelled_distance >= self.stats.range.value
+            self.stats.range_sensitive and self._travelled_distance >= self.stats.range
+        )
+
+    def is_tracking(self) -> bool:
+        return (
+            self.movement_strategy is tracking_movement_strategy
+            and self.hit_strategy is tracking_hit_strategy
+            and not self.stats.range_sensitive
         )
 
     def is_in_range(self, entity: IEntity) -> bool:
-        return distance(self, entity) <= self.stats.hitbox_radius.value
+        return distance(self, entity) <= self.get_hitbox_radius()
@@ -1,4 +1,6 @@
+from copy import deepcopy
 from dataclasses import dataclass
+from typing import Tuple
 
 from tower_defense.core.effects import IEffect
 from tower_defense.core.upgradable import UpgradableData, Up, UpgradableList
@@ -15,3 +17,24 @@ class ProjectileStats(UpgradableData):
         bool
     ]  # If set to True, the projectile dies after travelling more than its range
     effects: UpgradableList[IEffect]
+
+    def freeze(self) -> "FrozenProjectileStats":
+        return FrozenProjectileStats(
+            speed=self.speed.value,
+            range=self.range.value,
+            hitbox_radius=self.hitbox_radius.value,
+            range_sensitive=self.range_sensitive.value,
+            # Copied, so that upgrading these stats does not affect the snapshot
+            effects=tuple(deepcopy(self.effects)),
+        )
+
+
+@dataclass(frozen=True)
+class FrozenProjectileStats:
+    """Snapshot of the projectile stats at one level, shared by all its projectiles"""
+
+    speed: float
+    range: float
+    hitbox_radius: float
+    range_sensitive: bool
+    effects: Tuple[IEffect, ...]
@@ -0,0 +1,36 @@
+import heapq
+import itertools
+from typing import Generic, TypeVar, List, Tuple, Iterator, Optional
+
+T = TypeVar("T")
+
+
+class Scheduler(Generic[T]):
+    """Priority queue of items due at absolute simulation times, in milliseconds"""
+
+    def __init__(self) -> None:
+        # The counter keeps the order of insertion between items due at the same time
+        self._queue: List[Tuple[int, int, T]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[Tuple[int, T]]:
+        return ((due_time, item) for due_time, _, item in sorted(self._queue))
+
+    def schedule(self, due_time: int, item: T) -> None:
+        heapq.heappush(self._queue, (due_time, next(self._counter), item))
+
+    def cancel(self, item: T) -> None:
+        """Remove every scheduled occurrence of `item`"""
+        self._queue = [entry for entry in self._queue if entry[2] is not item]
+        heapq.heapify(self._queue)
+
+    def next_due_time(self) -> Optional[int]:
+        return self._queue[0][0] if self._queue else None
+
+    def pop_due(self, time: int) -> Iterator[T]:
+        """Remove and yield the items due at or before `time`, earliest first"""
+        while self._queue and self._queue[0][0] <= time:
+            yield heapq.heappop(self._queue)[2]
@@ -4,6 +4,7 @@ from typing import Optional, Iterable
 from tower_defense.interfaces.entity import IEntity
 from tower_defense.core.monster.monster import IMonster
 from tower_defense.core.projectile.projectile import IProjectile
+from tower_defense.core.tower.targeting_index import ITargetingIndex
 
 
 class IShooter(IEntity, ABC):
@@ -16,9 +17,29 @@ class IShooter(IEntity, ABC):
         ...
 
     @abstractmethod
-    def select_target(self, monsters: Iterable[IMonster]) -> None:
+    def set_target(self, target: Optional[IMonster]) -> None:
         ...
 
     @abstractmethod
-    def shoot(self, timestep: int) -> Iterable[IProjectile]:
+    def select_target(self, monsters: ITargetingIndex) -> None:
         ...
+
+    @abstractmethod
+    def is_loaded(self) -> bool:
+        ...
+
+    @abstractmethod
+    def reload(self) -> None:
+        ...
+
+    @abstractmethod
+    def unload(self) -> None:
+        ...
+
+    @abstractmethod
+    def get_reload_time(self) -> int:
+        """Return the time needed to reload after a shot, in milliseconds"""
+
+    @abstractmethod
+    def shoot(self) -> Iterable[IProjectile]:
+        """Shoot the target if it is valid and the shooter is loaded, unloading it"""
@@ -0,0 +1,65 @@
+import math
+from typing import Dict, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+from tower_defense.interfaces.entity import IEntity
+
+Cell = Tuple[int, int]
+E = TypeVar("E", bound=IEntity)
+
+# Margin added to the queried area, so that rounding errors on its bounds can never
+# exclude an entity that lies exactly on the border of the queried circle
+_EPSILON = 1e-9
+
+
+class SpatialHash(Generic[E]):
+    """Uniform grid bucketing entities by position, to query entities near a point"""
+
+    def __init__(self, cell_size: float = 1.0):
+        self._cell_size = cell_size
+        self._cells: Dict[Cell, List[E]] = {}
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    def _get_cell(self, x: float, y: float) -> Cell:
+        return math.floor(x / self._cell_size), math.floor(y / self._cell_size)
+
+    def rebuild(self, entities: Iterable[E]) -> None:
+        cells: Dict[Cell, List[E]] = {}
+        for entity in entities:
+            cell = self._get_cell(*entity.get_position())
+            try:
+                cells[cell].append(entity)
+            except KeyError:
+                cells[cell] = [entity]
+        self._cells = cells
+
+    def assign(self, cells: Dict[Cell, List[E]]) -> None:
+        """Replace the entities by the ones already bucketed into `cells`"""
+        self._cells = cells
+
+    def __iter__(self) -> Iterator[E]:
+        for bucket in self._cells.values():
+            yield from bucket
+
+    def query(self, position: Tuple[float, float], radius: float) -> Iterator[E]:
+        """Yield every entity in the cells overlapping the square bounding the circle
+
+        The result is a superset of the entities within `radius` of `position`: the
+        exact distance check is left to the caller.
+        """
+        x, y = position
+        margin = radius + _EPSILON
+        if not math.isfinite(margin):
+            yield from self
+            return
+        col_min, row_min = self._get_cell(x - margin, y - margin)
+        col_max, row_max = self._get_cell(x + margin, y + margin)
+        cell_count = (col_max - col_min + 1) * (row_max - row_min + 1)
+        if cell_count >= len(self._cells):
+            yield from self
+            return
+        for col in range(col_min, col_max + 1):
+            for row in range(row_min, row_max + 1):
+                yield from self._cells.get((col, row), ())
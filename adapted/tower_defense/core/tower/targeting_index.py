@@ -0,0 +1,165 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import chain
+from typing import Iterable, List, Dict, Tuple, Sequence
+
+from tower_defense.core.monster.monster import IMonster
+from tower_defense.core.tower.targeting_strategies import (
+    SORTING_FUNCTIONS,
+    query_monsters,
+)
+from tower_defense.interfaces.targeting_strategies import (
+    TargetingStrategy,
+    SortingParam,
+)
+from tower_defense.path import Path, Vector, Interval, compute_range_intervals
+
+
+class ITargetingIndex(ABC):
+    @abstractmethod
+    def rebuild(self, monsters: Iterable[IMonster]) -> None:
+        ...
+
+    @abstractmethod
+    def query(
+        self, center: Vector, radius: float, targeting_strategy: TargetingStrategy
+    ) -> Iterable[IMonster]:
+        """Yield the monsters that may be within range, by order of preference
+
+        The result is a superset of the monsters within `radius` of `center`: the
+        exact range check is left to the caller.
+        """
+
+    def rebuild_sorted(
+        self,
+        monsters: Sequence[IMonster],
+        distances: Sequence[float],
+        lanes: Sequence[int],
+    ) -> None:
+        """Rebuild from the monsters sorted by distance, with their distance and lane"""
+        self.rebuild(monsters)
+
+    def forget_range(self, center: Vector, radius: float) -> None:
+        """Drop what was computed for the range, no longer queried by any tower"""
+
+
+class SortedTargetingIndex(ITargetingIndex):
+    def __init__(self) -> None:
+        self._monsters: List[IMonster] = []
+
+    def rebuild(self, monsters: Iterable[IMonster]) -> None:
+        self._monsters = list(monsters)
+
+    def query(
+        self, center: Vector, radius: float, targeting_strategy: TargetingStrategy
+    ) -> Iterable[IMonster]:
+        return query_monsters(self._monsters, targeting_strategy)
+
+
+class PathTargetingIndex(ITargetingIndex):
+    """Index of the monsters sorted by distance travelled along a path
+
+    The range of a tower is mapped once to intervals of distance along the path, so
+    that the monsters within range are found by bisection instead of a full scan.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._monsters: List[IMonster] = []
+        self._distances: List[float] = []
+        self._intervals: Dict[Tuple[Vector, float], List[Interval]] = {}
+
+    def rebuild(self, monsters: Iterable[IMonster]) -> None:
+        by_distance = SORTING_FUNCTIONS[SortingParam.DISTANCE]
+        self._monsters = sorted(monsters, key=by_distance)
+        self._distances = [by_distance(monster) for monster in self._monsters]
+
+    def rebuild_sorted(
+        self,
+        monsters: Sequence[IMonster],
+        distances: Sequence[float],
+        lanes: Sequence[int],
+    ) -> None:
+        self._monsters = list(monsters)
+        self._distances = list(distances)
+
+    def forget_range(self, center: Vector, radius: float) -> None:
+        self._intervals.pop((center, radius), None)
+
+    def _get_intervals(self, center: Vector, radius: float) -> List[Interval]:
+        key = (center, radius)
+        try:
+            return self._intervals[key]
+        except KeyError:
+            intervals = compute_range_intervals(self._path, center, radius)
+            self._intervals[key] = intervals
+            return intervals
+
+    def _get_slices(self, center: Vector, radius: float) -> List[List[IMonster]]:
+        slices = []
+        for start, end in self._get_intervals(center, radius):
+            first = bisect_left(self._distances, start)
+            last = bisect_right(self._distances, end)
+            if first < last:
+                slices.append(self._monsters[first:last])
+        return slices
+
+    def query(
+        self, center: Vector, radius: float, targeting_strategy: TargetingStrategy
+    ) -> Iterable[IMonster]:
+        slices = self._get_slices(center, radius)
+        if targeting_strategy.key == SortingParam.DISTANCE:
+            if targeting_strategy.reverse:
+                return chain.from_iterable(reversed(s) for s in reversed(slices))
+            return chain.from_iterable(slices)
+        return query_monsters(chain.from_iterable(slices), targeting_strategy)
+
+
+class LaneTargetingIndex(ITargetingIndex):
+    """One PathTargetingIndex per lane, each holding the monsters following it"""
+
+    def __init__(self, lanes: Sequence[Path]):
+        self._indices = [PathTargetingIndex(lane) for lane in lanes]
+
+    def rebuild(self, monsters: Iterable[IMonster]) -> None:
+        monsters_by_lane: List[List[IMonster]] = [[] for _ in self._indices]
+        for monster in monsters:
+            monsters_by_lane[monster.lane_].append(monster)
+        for index, lane_monsters in zip(self._indices, monsters_by_lane):
+            index.rebuild(lane_monsters)
+
+    def rebuild_sorted(
+        self,
+        monsters: Sequence[IMonster],
+        distances: Sequence[float],
+        lanes: Sequence[int],
+    ) -> None:
+        monsters_by_lane: List[List[IMonster]] = [[] for _ in self._indices]
+        distances_by_lane: List[List[float]] = [[] for _ in self._indices]
+        for monster, distance, lane in zip(monsters, distances, lanes):
+            monsters_by_lane[lane].append(monster)
+            distances_by_lane[lane].append(distance)
+        for index, lane_monsters, lane_distances in zip(
+            self._indices, monsters_by_lane, distances_by_lane
+        ):
+            index.rebuild_sorted(lane_monsters, lane_distances, ())
+
+    def forget_range(self, center: Vector, radius: float) -> None:
+        for index in self._indices:
+            index.forget_range(center, radius)
+
+    def query(
+        self, center: Vector, radius: float, targeting_strategy: TargetingStrategy
+    ) -> Iterable[IMonster]:
+        queries = [
+            index.query(center, radius, targeting_strategy) for index in self._indices
+        ]
+        if targeting_strategy.key == SortingParam.DISTANCE:
+            # Each lane yields its monsters in order already
+            return merge(
+                *queries,
+                key=SORTING_FUNCTIONS[SortingParam.DISTANCE],
+                reverse=targeting_strategy.reverse,
+            )
+        return query_monsters(chain.from_iterable(queries), targeting_strategy)
@@ -7,15 +7,14 @@ from tower_defense.core.projectile.orientation_strategies import (
 )
 from tower_defense.core.tower.tower_entity import ITowerEntity
 from tower_defense.interfaces.tower_factory import ITowerFactory
-from tower_defense.core.count_down import CountDown
 from tower_defense.core.distance import distance
 from tower_defense.core.monster.monster import IMonster
 from tower_defense.core.projectile.projectile import IProjectile
 from tower_defense.core.projectile.projectile_factory import ProjectileFactory
 from tower_defense.core.tower.stats import TowerStats
+from tower_defense.core.tower.targeting_index import ITargetingIndex
 from tower_defense.core.tower.targeting_strategies import (
     TargetingStrategy,
-    query_monsters,
     SortingParam,
 )
 from tower_defense.core.upgradable import UpgradableData
@@ -43,7 +42,7 @@ class Tower(ITowerEntity):
         self.tower_stats = tower_stats
         self.x = x
         self.y = y
-        self.countdown = CountDown()
+        self._loaded = True
         self.target: Optional[IMonster] = target
         self.sticky_target = sticky_target
         self._level: int = 1
@@ -57,6 +56,9 @@ class Tower(ITowerEntity):
     def get_target(self) -> Optional[IMonster]:
         return self.target
 
+    def set_target(self, target: Optional[IMonster]) -> None:
+        self.target = target
+
     def get_range(self) -> float:
         return self.projectile_factory.get_range()
 
@@ -85,10 +87,13 @@ class Tower(ITowerEntity):
     def _monster_is_close_enough(self, monster: IMonster) -> bool:
         return distance(self, monster) <= self.projectile_factory.get_range()
 
-    def select_target(self, monsters: Iterable[IMonster]):
+    def select_target(self, monsters: ITargetingIndex):
         if self._is_valid_target(self.target) and self.sticky_target:
             return
-        for monster in query_monsters(monsters, self.targeting_strategy):
+        candidates = monsters.query(
+            self.get_position(), self.get_range(), self.targeting_strategy
+        )
+        for monster in candidates:
             if self._is_valid_target(monster):
                 self.target = monster
                 return
@@ -101,13 +106,23 @@ class Tower(ITowerEntity):
             and monster.alive
         )
 
-    def shoot(self, timestep: int) -> Iterable[IProjectile]:
-        self.countdown.update(timestep)
-        if self._is_valid_target(self.target) and self.countdown.ended():
-            duration: int = int(1000 / self.tower_stats.shots_per_second.value)
-            self.countdown.start(duration)
-            return self._shoot(self.target)
-        return []
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    def reload(self) -> None:
+        self._loaded = True
+
+    def unload(self) -> None:
+        self._loaded = False
+
+    def get_reload_time(self) -> int:
+        return int(1000 / self.tower_stats.shots_per_second.value)
+
+    def shoot(self) -> Iterable[IProjectile]:
+        if not self._loaded or not self._is_valid_target(self.target):
+            return []
+        self.unload()
+        return self._shoot(self.target)
 
     def get_name(self) -> str:
         return self.name
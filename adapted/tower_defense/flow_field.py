@@ -0,0 +1,216 @@
+import heapq
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from tower_defense.grid import Grid, GridVector, DIRECTIONS
+from tower_defense.path import Path, Vector
+
+# Fixed order, so that the monsters choose the same block between equal ones
+_DIRECTIONS: List[GridVector] = sorted(DIRECTIONS)
+
+
+class FlowField:
+    """Distance of every block to the exit, across the open blocks of a grid
+
+    The walkable and constructible blocks are open, unless blocked by a tower. The
+    monsters walk down the distances, to the exit. When a block is blocked or opened
+    again, only the distances that change are computed again.
+    """
+
+    def __init__(
+        self, grid: Grid, exit_: GridVector, blocked: Iterable[GridVector] = ()
+    ):
+        self._grid = grid
+        self.exit = exit_
+        self._blocked: Set[GridVector] = set(blocked)
+        # Changes each time distances change, so that the routes can be updated
+        self.version = 0
+        self.distances: Dict[GridVector, int] = {exit_: 0}
+        self._propagate([exit_])
+
+    def is_open(self, block: GridVector) -> bool:
+        x, y = block
+        if block in self._blocked or not (
+            0 <= x < self._grid.width and 0 <= y < self._grid.height
+        ):
+            return False
+        grid_block = self._grid.get_block(block)
+        return grid_block.is_walkable or grid_block.is_constructible
+
+    def _get_open_neighbors(self, block: GridVector) -> List[GridVector]:
+        x, y = block
+        neighbors = [(x + dx, y + dy) for dx, dy in _DIRECTIONS]
+        return [neighbor for neighbor in neighbors if self.is_open(neighbor)]
+
+    def _propagate(self, sources: Iterable[GridVector]) -> None:
+        # Breadth-first search, lowering the distances that a source makes shorter
+        distances = self.distances
+        queue = deque(sources)
+        while queue:
+            block = queue.popleft()
+            distance = distances[block] + 1
+            for neighbor in self._get_open_neighbors(block):
+                if distances.get(neighbor, distance + 1) > distance:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+
+    def is_reachable(self, block: GridVector) -> bool:
+        return block in self.distances
+
+    def get_next_block(self, block: GridVector) -> Optional[GridVector]:
+        """Return the next block towards the exit, None at the exit or if stranded"""
+        distance = self.distances.get(block)
+        if not distance:
+            return None
+        for neighbor in self._get_open_neighbors(block):
+            if self.distances.get(neighbor) == distance - 1:
+                return neighbor
+        return None
+
+    def block(self, block: GridVector) -> None:
+        """Close `block`, and compute again the distances that went through it"""
+        if block in self._blocked:
+            return
+        self._blocked.add(block)
+        self._remove_routes_through(block)
+        # Only once the distances are up to date, for the tracks reading them
+        self.version += 1
+
+    def _remove_routes_through(self, block: GridVector) -> None:
+        distances = self.distances
+        if block not in distances:
+            return
+        # The blocks whose every shortest route went through `block`, found by
+        # increasing distance: the blocks one step closer are sorted out first
+        orphans = {block}
+        queue = deque([block])
+        while queue:
+            parent = queue.popleft()
+            distance = distances[parent] + 1
+            for child in self._get_open_neighbors(parent):
+                if (
+                    distances.get(child) != distance
+                    or child in orphans
+                    or any(
+                        distances.get(other_parent) == distance - 1
+                        and other_parent not in orphans
+                        for other_parent in self._get_open_neighbors(child)
+                    )
+                ):
+                    continue
+                orphans.add(child)
+                queue.append(child)
+        for orphan in orphans:
+            del distances[orphan]
+        orphans.discard(block)
+        # Shortest routes from the rest of the field, through the orphans only
+        heap: List[Tuple[int, GridVector]] = []
+        for orphan in orphans:
+            neighbor_distances = [
+                distances[neighbor]
+                for neighbor in self._get_open_neighbors(orphan)
+                if neighbor in distances
+            ]
+            if neighbor_distances:
+                heap.append((min(neighbor_distances) + 1, orphan))
+        heapq.heapify(heap)
+        while heap:
+            distance, orphan = heapq.heappop(heap)
+            if orphan in distances:
+                continue
+            distances[orphan] = distance
+            for neighbor in self._get_open_neighbors(orphan):
+                if neighbor in orphans and neighbor not in distances:
+                    heapq.heappush(heap, (distance + 1, neighbor))
+
+    def unblock(self, block: GridVector) -> None:
+        """Open `block` again, and shorten the distances that go through it"""
+        if block not in self._blocked:
+            return
+        self._blocked.discard(block)
+        self._add_routes_through(block)
+        self.version += 1
+
+    def _add_routes_through(self, block: GridVector) -> None:
+        if not self.is_open(block):
+            return
+        neighbor_distances = [
+            self.distances[neighbor]
+            for neighbor in self._get_open_neighbors(block)
+            if neighbor in self.distances
+        ]
+        if not neighbor_distances:
+            return
+        self.distances[block] = min(neighbor_distances) + 1
+        self._propagate([block])
+
+
+class FlowFieldTrack:
+    """Blocks walked by one monster down a flow field, extended as it moves on
+
+    The distance travelled indexes the blocks as on a Path. When the flow field
+    changes, the blocks after the one the monster is heading to are found again.
+    """
+
+    def __init__(self, flow_field: FlowField, blocks: Iterable[GridVector]):
+        self._flow_field = flow_field
+        self._version = flow_field.version
+        self._blocks = list(blocks)
+        self._index = 0
+        self._path: Optional[Path] = None
+
+    def copy(self) -> "FlowFieldTrack":
+        track = FlowFieldTrack(self._flow_field, self._blocks)
+        track._version, track._index = self._version, self._index
+        return track
+
+    def _follow(self, index: int) -> None:
+        """Move the monster to the block at `index`, and find the next block"""
+        blocks = self._blocks
+        if self._version != self._flow_field.version:
+            self._version = self._flow_field.version
+            # The monster keeps heading to the same block
+            del blocks[self._index + 2 :]
+            self._path = None
+        self._index = index
+        self._extend(index + 2)
+
+    def _extend(self, length: float) -> None:
+        blocks = self._blocks
+        while len(blocks) < length:
+            next_block = self._flow_field.get_next_block(blocks[-1])
+            if next_block is None:
+                return
+            blocks.append(next_block)
+            self._path = None
+
+    def get_heading(self) -> List[GridVector]:
+        """Return the block where the monster stands, and the one it is heading to"""
+        return self._blocks[self._index : self._index + 2]
+
+    def compute_position(self, distance: float) -> Vector:
+        index = max(int(distance), 0)
+        self._follow(index)
+        blocks = self._blocks
+        if index >= len(blocks) - 1:
+            x, y = blocks[-1]
+            return float(x), float(y)
+        fraction = max(distance - index, 0.0)
+        (x, y), (next_x, next_y) = blocks[index], blocks[index + 1]
+        return x + fraction * (next_x - x), y + fraction * (next_y - y)
+
+    def has_arrived(self, distance: float) -> bool:
+        self._follow(max(int(distance), 0))
+        return (
+            self._blocks[-1] == self._flow_field.exit
+            and distance >= len(self._blocks) - 1
+        )
+
+    def to_path(self) -> Path:
+        """Return the route of the monster to the exit, as the flow field is now"""
+        self._follow(self._index)
+        self._extend(math.inf)
+        if self._path is None:
+            self._path = Path(self._blocks)
+        return self._path
@@ -0,0 +1,64 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from tower_defense.interfaces.updatable import Updatable
+
+
+@dataclass
+class LoopStats:
+    frames: int = 0
+    steps: int = 0
+    # Frames that reached the catch-up limit before consuming the elapsed time
+    overruns: int = 0
+    # Elapsed time given up by the overruns, in milliseconds
+    dropped_ms: float = 0.0
+
+
+class GameLoop:
+    """Advance the simulation in fixed steps, following the wall clock
+
+    The elapsed time is accumulated, and consumed by steps of `timestep`
+    milliseconds. If updating falls behind, at most `max_steps_per_frame` steps are
+    run in a row, and the remaining whole steps are dropped, so that a slow tick
+    slows the game down instead of making it spiral out of control.
+    """
+
+    def __init__(
+        self,
+        timestep: int,
+        max_steps_per_frame: int = 5,
+        clock: Callable[[], int] = time.perf_counter_ns,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.timestep = timestep
+        self.max_steps_per_frame = max_steps_per_frame
+        self._clock = clock
+        self._sleep = sleep
+        self.stats = LoopStats()
+
+    def run(self, controller: Updatable, max_frames: Optional[int] = None) -> None:
+        # Integer nanoseconds, so that no time is lost to rounding errors
+        timestep_ns = self.timestep * 1_000_000
+        accumulator_ns = 0
+        previous_ns = self._clock()
+        while max_frames is None or self.stats.frames < max_frames:
+            now_ns = self._clock()
+            accumulator_ns += now_ns - previous_ns
+            previous_ns = now_ns
+            steps = 0
+            while accumulator_ns >= timestep_ns:
+                if steps == self.max_steps_per_frame:
+                    dropped_ns = accumulator_ns - accumulator_ns % timestep_ns
+                    accumulator_ns -= dropped_ns
+                    self.stats.overruns += 1
+                    self.stats.dropped_ms += dropped_ns / 1_000_000
+                    break
+                controller.update(self.timestep)
+                accumulator_ns -= timestep_ns
+                steps += 1
+            self.stats.frames += 1
+            self.stats.steps += steps
+            # Sleep until the next step is due
+            due_in_ns = timestep_ns - accumulator_ns - (self._clock() - previous_ns)
+            self._sleep(max(due_in_ns, 0) / 1e9)
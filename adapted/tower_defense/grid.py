@@ -1,5 +1,7 @@
-from dataclasses import dataclass, field
-from typing import List, Tuple, Iterator, Set
+import mmap
+import os
+import struct
+from typing import List, Tuple, Iterator, Set, Optional, Sequence, Union
 
 from tower_defense.block import Block
 
@@ -24,6 +26,17 @@ class GridNotRectangularError(Exception):
     ...
 
 
+class GridFormatError(Exception):
+    ...
+
+
+# Binary maps: a header, then one block code per cell, column after column
+GRID_MAGIC = b"TDGR"
+GRID_VERSION = 1
+# Magic, version, width and height, little-endian
+_GRID_HEADER = struct.Struct("<4sHII")
+
+# Index of each block in the text and binary maps
 BLOCK_MAPPING: List[Block] = [
     Block(is_constructible=True, is_walkable=False),
     Block(is_constructible=False, is_walkable=True),
@@ -31,27 +44,84 @@ BLOCK_MAPPING: List[Block] = [
 ]
 
 
+# Block codes, read-only when memory-mapped
+BlockCodes = Union[bytearray, memoryview]
+
+
 def _add_grid_vectors(vector_a: GridVector, vector_b: GridVector) -> GridVector:
     return vector_a[0] + vector_b[0], vector_a[1] + vector_b[1]
 
 
-@dataclass
 class Grid:
-    _block_grid: List[List[Block]] = field(default_factory=list)
+    """Rectangular grid of blocks, stored as one byte per cell
+
+    The cells are stored column after column, each as the index of its block in a
+    palette: the blocks of BLOCK_MAPPING first, then any other block of the grid.
+    """
 
-    def __post_init__(self):
+    def __init__(self, block_grid: Optional[List[List[Block]]] = None):
+        block_grid = [] if block_grid is None else block_grid
+        height = len(block_grid[0]) if block_grid else 0
         invalid_rows = {}
-        for row_index, block_row in enumerate(self._block_grid):
-            if len(block_row) != self.height:
+        for row_index, block_row in enumerate(block_grid):
+            if len(block_row) != height:
                 invalid_rows[row_index] = len(block_row)
         if len(invalid_rows):
             raise GridNotRectangularError(
-                f"The following rows do not match the height of the row 0 of height {self.height}:\n"
+                f"The following rows do not match the height of the row 0 of height {height}:\n"
                 + "\n".join(
                     f"- Row {row_index} with height {row_height}"
                     for row_index, row_height in invalid_rows.items()
                 )
             )
+        blocks = list(BLOCK_MAPPING)
+        codes_by_block = {block: code for code, block in enumerate(blocks)}
+        codes = bytearray()
+        for block_col in block_grid:
+            for block in block_col:
+                code = codes_by_block.get(block)
+                if code is None:
+                    code = codes_by_block[block] = len(blocks)
+                    blocks.append(block)
+                codes.append(code)
+        self._init(len(block_grid), height, codes, blocks)
+
+    def _init(
+        self, width: int, height: int, codes: BlockCodes, blocks: Sequence[Block]
+    ) -> None:
+        self._width = width
+        self._height = height
+        self._codes = codes
+        self._blocks = blocks
+        # One view per column, without copy, so that a block is found by indexing
+        # like in nested lists
+        view = memoryview(codes)
+        self._columns = [view[x * height : (x + 1) * height] for x in range(width)]
+
+    @classmethod
+    def from_codes(
+        cls,
+        width: int,
+        height: int,
+        codes: BlockCodes,
+        blocks: Sequence[Block] = BLOCK_MAPPING,
+    ) -> "Grid":
+        """Wrap block codes stored column after column, without copying them"""
+        if len(codes) != width * height:
+            raise GridFormatError(
+                f"Expected {width * height} block codes, found {len(codes)}"
+            )
+        grid = cls.__new__(cls)
+        grid._init(width, height, codes, blocks)
+        return grid
+
+    def __repr__(self) -> str:
+        return f"Grid(shape={self.shape})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.shape == other.shape and list(self) == list(other)
 
     @property
     def shape(self) -> Tuple[int, int]:
@@ -59,26 +129,63 @@ class Grid:
 
     @property
     def width(self) -> int:
-        return len(self._block_grid)
+        return self._width
 
     @property
     def height(self) -> int:
-        try:
-            return len(self._block_grid[0])
-        except IndexError:
-            return 0
+        return self._height
 
     def __iter__(self) -> Iterator[Tuple[GridVector, Block]]:
-        for col, block_col in enumerate(self._block_grid):
-            for row, block in enumerate(block_col):
-                yield (col, row), block
+        blocks, codes, height = self._blocks, self._codes, self._height
+        for col in range(self._width):
+            offset = col * height
+            for row, code in enumerate(codes[offset : offset + height]):
+                yield (col, row), blocks[code]
 
     @classmethod
     def load(cls, map_name: str) -> "Grid":
-        with open("texts/mapTexts/" + map_name + ".txt", "r") as map_file:
+        """Load a map by name, from its binary file unless its text file is newer"""
+        binary_path = "texts/mapTexts/" + map_name + ".grid"
+        text_path = "texts/mapTexts/" + map_name + ".txt"
+        if os.path.exists(binary_path) and (
+            not os.path.exists(text_path)
+            or os.path.getmtime(binary_path) >= os.path.getmtime(text_path)
+        ):
+            return cls.load_binary(binary_path)
+        with open(text_path, "r") as map_file:
             grid_values = list(map(int, map_file.read().split()))
         return cls._fill_grid(grid_values)
 
+    @classmethod
+    def load_binary(cls, path: str) -> "Grid":
+        """Memory-map a map written by `save_binary`: its cells are read on demand"""
+        with open(path, "rb") as map_file:
+            try:
+                mapped = mmap.mmap(map_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as error:
+                # Empty files cannot be mapped
+                raise GridFormatError(f"Not a binary map: {path}") from error
+        if len(mapped) < _GRID_HEADER.size:
+            raise GridFormatError(f"Not a binary map: {path}")
+        magic, version, width, height = _GRID_HEADER.unpack_from(mapped)
+        if magic != GRID_MAGIC:
+            raise GridFormatError(f"Not a binary map: {path}")
+        if version != GRID_VERSION:
+            raise GridFormatError(f"Unsupported binary map version: {version}")
+        return cls.from_codes(width, height, memoryview(mapped)[_GRID_HEADER.size :])
+
+    def save_binary(self, path: str) -> None:
+        """Write the grid in a binary file, which can be memory-mapped when loaded"""
+        if self._blocks[: len(BLOCK_MAPPING)] != BLOCK_MAPPING or any(
+            code >= len(BLOCK_MAPPING) for code in set(self._codes)
+        ):
+            raise GridFormatError("Only the blocks of BLOCK_MAPPING can be saved")
+        with open(path, "wb") as map_file:
+            map_file.write(
+                _GRID_HEADER.pack(GRID_MAGIC, GRID_VERSION, self._width, self._height)
+            )
+            map_file.write(self._codes)
+
     @staticmethod
     def get_block_position(world_position: Tuple[float, float]) -> Tuple[int, int]:
         return int(world_position[0]), int(world_position[1])
@@ -90,16 +197,19 @@ class Grid:
         return self.get_block(grid_position).is_walkable
 
     def find_spawn(self) -> GridVector:
+        blocks, codes, height = self._blocks, self._codes, self._height
         for x in range(self.width):
-            if self._block_grid[x][0].is_walkable:
+            if blocks[codes[x * height]].is_walkable:
                 return x, 0
-        for y in range(self.height):
-            if self._block_grid[0][y].is_walkable:
-                return 0, y
+        if self.width:
+            for y in range(self.height):
+                if blocks[codes[y]].is_walkable:
+                    return 0, y
         raise SpawnNotFoundError(f"The spawn was not found in the grid: {self}")
 
     def get_block(self, grid_position: GridVector) -> Block:
-        return self._block_grid[grid_position[0]][grid_position[1]]
+        x, y = grid_position
+        return self._blocks[self._columns[x][y]]
 
     def get_neighbors(self, grid_position: GridVector) -> List[GridVector]:
         neighbors = []
@@ -114,11 +224,11 @@ class Grid:
 
     @property
     def _grid_size(self) -> int:
-        return len(self._block_grid)
+        return self._width
 
     def _is_in_grid(self, grid_position: GridVector) -> bool:
         x, y = grid_position
-        return 0 <= x < len(self._block_grid) and 0 <= y < len(self._block_grid[0])
+        return 0 <= x < self._width and 0 <= y < self._height
 
     @staticmethod
     def _build_block(block_number: int) -> Block:
@@ -132,12 +242,12 @@ class Grid:
                 f"Invalid number of values to initialize the grid: "
                 f"expected a perfect square, found {len(grid_values)}"
             )
-        grid = Grid()
-        grid._block_grid = [
-            [
-                cls._build_block(grid_values[grid_size * grid_y + grid_x])
-                for grid_y in range(grid_size)
-            ]
-            for grid_x in range(grid_size)
-        ]
-        return grid
+        for block_number in set(grid_values):
+            cls._build_block(block_number)
+        # The text maps are written row after row
+        codes = bytearray(grid_size * grid_size)
+        for grid_y in range(grid_size):
+            codes[grid_y::grid_size] = bytes(
+                grid_values[grid_size * grid_y : grid_size * (grid_y + 1)]
+            )
+        return cls.from_codes(grid_size, grid_size, codes)
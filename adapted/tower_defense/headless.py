@@ -0,0 +1,102 @@
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, Callable, Iterable
+
+from tower_defense.input_log import Command, apply_command
+from tower_defense.tower_defense_controller import TowerDefenseController
+
+# Plays the turn of the player before each tick, and tells whether the game goes on
+Pilot = Callable[[TowerDefenseController], bool]
+
+
+@dataclass
+class HeadlessReport:
+    ticks: int
+    simulated_ms: int
+    wall_time_s: float
+    ticks_per_second: float
+    waves_finished: bool
+    player_health: int
+    player_money: int
+    peak_monsters: int
+    peak_projectiles: int
+    peak_towers: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _waves_finished(controller: TowerDefenseController) -> bool:
+    return (
+        controller.wave_generator.is_finished()
+        and len(controller.entities.monsters) == 0
+    )
+
+
+def start_waves_pilot(controller: TowerDefenseController) -> bool:
+    """Start each wave as soon as possible, until all the waves are over"""
+    if _waves_finished(controller):
+        return False
+    if controller.can_start_spawning_monsters():
+        controller.start_spawning_monsters()
+    return True
+
+
+class ReplayPilot:
+    """Issue recorded commands at their time, then let the current wave end"""
+
+    def __init__(self, commands: Iterable[Command]):
+        self._commands = deque(commands)
+
+    def __call__(self, controller: TowerDefenseController) -> bool:
+        commands = self._commands
+        while commands and commands[0].time <= controller.entities.time:
+            apply_command(controller, commands.popleft())
+        return bool(commands) or (
+            controller.wave_generator.spawning or len(controller.entities.monsters) > 0
+        )
+
+
+def run_headless(
+    controller: TowerDefenseController,
+    timestep: int,
+    max_ticks: Optional[int] = None,
+    pilot: Pilot = start_waves_pilot,
+) -> HeadlessReport:
+    """Run the simulation without any view, as fast as possible
+
+    The simulation is advanced by a fixed virtual timestep until the pilot ends the
+    game, or until `max_ticks` ticks have been simulated. By default, each wave is
+    started as soon as the controller allows it, until all the waves are over.
+
+    :param controller: the controller to drive
+    :param timestep: the virtual time elapsed at each tick, in milliseconds
+    :param max_ticks: the maximum number of ticks to simulate, unbounded if None
+    :param pilot: the player's commands, issued before each tick
+    """
+    entities = controller.entities
+    ticks = 0
+    peak_monsters = peak_projectiles = peak_towers = 0
+    start = time.perf_counter()
+    while max_ticks is None or ticks < max_ticks:
+        if not pilot(controller):
+            break
+        controller.update(timestep)
+        ticks += 1
+        peak_monsters = max(peak_monsters, len(entities.monsters))
+        peak_projectiles = max(peak_projectiles, entities.count_projectiles())
+        peak_towers = max(peak_towers, len(entities.towers))
+    wall_time_s = time.perf_counter() - start
+    return HeadlessReport(
+        ticks=ticks,
+        simulated_ms=ticks * timestep,
+        wall_time_s=wall_time_s,
+        ticks_per_second=ticks / wall_time_s if wall_time_s > 0 else float("inf"),
+        waves_finished=_waves_finished(controller),
+        player_health=controller.get_player_health(),
+        player_money=controller.get_player_money(),
+        peak_monsters=peak_monsters,
+        peak_projectiles=peak_projectiles,
+        peak_towers=peak_towers,
+    )
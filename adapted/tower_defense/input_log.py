@@ -0,0 +1,137 @@
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, IO, Iterable, List, Sequence, Tuple
+
+from tower_defense.interfaces.targeting_strategies import (
+    TargetingStrategy,
+    SortingParam,
+)
+from tower_defense.interfaces.tower_defense_controller import (
+    ITowerDefenseController,
+)
+
+VERSION = 1
+
+
+class InputLogError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Command:
+    # Simulation time of the tick before which the command was issued, in milliseconds
+    time: int
+    name: str
+    args: Tuple[Any, ...]
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Cannot record {value!r}")
+
+
+class InputRecorder:
+    """Append the commands of the player to a stream, one JSON line each
+
+    The first line is a header, describing how to build the game again. Several
+    sessions may be appended to the same stream, each with its header.
+    """
+
+    def __init__(self, stream: IO[str], header: Dict[str, Any]):
+        self._stream = stream
+        self._write({"version": VERSION, **header})
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._stream.write(json.dumps(record, default=_encode) + "\n")
+        # Commands are rare: flushing each of them keeps the log of a crashed game
+        self._stream.flush()
+
+    def record(self, time: int, name: str, args: Sequence[Any]) -> None:
+        self._write({"time": time, "command": name, "args": list(args)})
+
+
+def _start_spawning_monsters(controller: ITowerDefenseController) -> None:
+    controller.start_spawning_monsters()
+
+
+def _try_build_tower(
+    controller: ITowerDefenseController,
+    tower_view_name: str,
+    world_position: List[float],
+) -> None:
+    x, y = world_position
+    controller.try_build_tower(tower_view_name, (x, y))
+
+
+def _upgrade_tower(
+    controller: ITowerDefenseController, tower_position: List[int]
+) -> None:
+    x, y = tower_position
+    controller.upgrade_tower((x, y))
+
+
+def _sell_tower(controller: ITowerDefenseController, tower_position: List[int]) -> None:
+    x, y = tower_position
+    controller.sell_tower((x, y))
+
+
+def _set_targeting_strategy(
+    controller: ITowerDefenseController,
+    tower_position: List[int],
+    targeting_strategy: List[Any],
+) -> None:
+    (x, y), (key, reverse) = tower_position, targeting_strategy
+    controller.set_targeting_strategy(
+        (x, y), TargetingStrategy(SortingParam(key), reverse)
+    )
+
+
+def _set_sticky_target(
+    controller: ITowerDefenseController,
+    tower_position: List[int],
+    sticky_target: bool,
+) -> None:
+    x, y = tower_position
+    controller.set_sticky_target((x, y), sticky_target)
+
+
+_COMMANDS = {
+    "start_spawning_monsters": _start_spawning_monsters,
+    "try_build_tower": _try_build_tower,
+    "upgrade_tower": _upgrade_tower,
+    "sell_tower": _sell_tower,
+    "set_targeting_strategy": _set_targeting_strategy,
+    "set_sticky_target": _set_sticky_target,
+}
+
+
+def apply_command(controller: ITowerDefenseController, command: Command) -> None:
+    _COMMANDS[command.name](controller, *command.args)
+
+
+def read_input_log(lines: Iterable[str]) -> Tuple[Dict[str, Any], List[Command]]:
+    """Parse a log written by InputRecorders, one session after the other
+
+    :return: the header of the last session, and its commands in the order they were
+        issued
+    """
+    records = (json.loads(line) for line in lines if line.strip())
+    header = next(records, None)
+    if header is None or header.get("version") != VERSION:
+        raise InputLogError("Not a supported input log")
+    commands = []
+    for record in records:
+        if "command" not in record:
+            # The header of a session recorded later, in the same file
+            if record.get("version") != VERSION:
+                raise InputLogError("Not a supported input log")
+            header, commands = record, []
+            continue
+        if record["command"] not in _COMMANDS:
+            raise InputLogError(f"Unknown command {record['command']!r}")
+        commands.append(
+            Command(record["time"], record["command"], tuple(record["args"]))
+        )
+    return header, commands
@@ -8,4 +8,9 @@ class IMonsterSpawner(ABC):
 
     @abstractmethod
     def start_spawning_monsters(self) -> bool:
-        ...
+        """Return whether the next wave started spawning
+
+        If the controller queues the commands of the views, the wave may only start
+        before the next tick, and False is returned: the views then find out from
+        `can_start_spawning_monsters`, which returns False while the wave spawns.
+        """
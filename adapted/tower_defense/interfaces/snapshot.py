@@ -0,0 +1,55 @@
+from typing import NamedTuple, Tuple, Optional
+
+from tower_defense.interfaces.targeting_strategies import TargetingStrategy
+
+Position = Tuple[float, float]
+
+
+class EntitySnapshot(NamedTuple):
+    # Identifier of the entity, never reused during a game
+    entity_id: int
+    model_name: str
+    position: Position
+    orientation: float
+
+
+class MonsterSnapshot(NamedTuple):
+    entity_id: int
+    model_name: str
+    position: Position
+    orientation: float
+    health: int
+    max_health: int
+
+
+class TowerSnapshot(NamedTuple):
+    entity_id: int
+    model_name: str
+    position: Position
+    orientation: float
+    level: int
+    # Position of the block of the tower, which identifies it for the commands
+    block_position: Tuple[int, int]
+    name: str
+    range: float
+    # None if the tower cannot be upgraded anymore
+    upgrade_cost: Optional[int]
+    targeting_strategy: TargetingStrategy
+    sticky_target: bool
+
+
+class WorldSnapshot(NamedTuple):
+    """Immutable state of the entities at the end of a tick, for the views"""
+
+    # Simulation time of the end of the tick, in milliseconds
+    time: int
+    towers: Tuple[TowerSnapshot, ...]
+    # Monsters sorted along the path, the last ones being the furthest
+    monsters: Tuple[MonsterSnapshot, ...]
+    projectiles: Tuple[EntitySnapshot, ...]
+
+    def get_tower(self, block_position: Tuple[int, int]) -> Optional[TowerSnapshot]:
+        for tower in self.towers:
+            if tower.block_position == block_position:
+                return tower
+        return None
@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, Dict
 
 from tower_defense.interfaces.block_manager import IBlockManager
 from tower_defense.interfaces.entity import IEntity
 from tower_defense.interfaces.monster_spawner import IMonsterSpawner
 from tower_defense.interfaces.monster_view import IMonsterView
 from tower_defense.interfaces.player import IPlayer
+from tower_defense.interfaces.snapshot import WorldSnapshot
 from tower_defense.interfaces.tower_manager import ITowerManager
 from tower_defense.interfaces.tower_view_manager import ITowerViewManager
 
@@ -25,3 +26,19 @@ class ITowerDefenseController(
     @abstractmethod
     def iter_projectiles(self) -> Iterable[IEntity]:
         ...
+
+    @abstractmethod
+    def get_tick_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the rolling percentiles of the measures taken at each tick
+
+        Durations are in milliseconds. The result is empty if the measures are off.
+        In real time, the counters of the game loop are under "game_loop".
+        """
+
+    @abstractmethod
+    def get_snapshot(self) -> WorldSnapshot:
+        """Return the state of the entities at the end of the last tick
+
+        The snapshot is immutable, and safe to read from any thread while the game
+        goes on.
+        """
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Tuple, Optional, Iterable
 
+from tower_defense.interfaces.targeting_strategies import TargetingStrategy
 from tower_defense.interfaces.tower import ITower
 
 
@@ -17,6 +18,18 @@ class ITowerManager(ABC):
     def sell_tower(self, tower_position: Tuple[int, int]) -> None:
         ...
 
+    @abstractmethod
+    def set_targeting_strategy(
+        self, tower_position: Tuple[int, int], targeting_strategy: TargetingStrategy
+    ) -> None:
+        ...
+
+    @abstractmethod
+    def set_sticky_target(
+        self, tower_position: Tuple[int, int], sticky_target: bool
+    ) -> None:
+        ...
+
     @abstractmethod
     def iter_towers(self) -> Iterable[ITower]:
         ...
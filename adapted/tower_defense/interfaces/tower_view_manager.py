@@ -17,4 +17,9 @@ class ITowerViewManager(ABC):
     def try_build_tower(
         self, tower_view_name: str, world_position: Tuple[float, float]
     ) -> bool:
-        ...
+        """Return whether the tower was built
+
+        If the controller queues the commands of the views, the tower may only be
+        built before the next tick, and False is returned: the views then find out
+        from the towers of the next snapshot.
+        """
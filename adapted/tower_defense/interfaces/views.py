@@ -1,9 +1,14 @@
-from typing import List, Callable
+import sys
+from importlib.metadata import EntryPoint, entry_points
+from typing import List, Callable, Dict, Iterable
 
 from tower_defense.interfaces.tower_defense_controller import ITowerDefenseController
 
 ViewLauncher = Callable[[ITowerDefenseController], None]
 
+# Group of the entry points of the view plugins: loading one registers its launchers
+VIEWS_GROUP = "tower_defense.views"
+
 _VIEW_LAUNCHERS: List[ViewLauncher] = []
 
 
@@ -13,3 +18,14 @@ def register_view_launcher(view_launcher: ViewLauncher) -> None:
 
 def retrieve_view_launchers() -> List[ViewLauncher]:
     return list(_VIEW_LAUNCHERS)
+
+
+def find_view_plugins() -> Dict[str, EntryPoint]:
+    """Find the installed view plugins by name, without importing any of them"""
+    view_entry_points: Iterable[EntryPoint]
+    if sys.version_info >= (3, 10):
+        view_entry_points = entry_points(group=VIEWS_GROUP)
+    else:
+        # Selecting a group only exists since Python 3.10
+        view_entry_points = entry_points().get(VIEWS_GROUP, [])
+    return {entry_point.name: entry_point for entry_point in view_entry_points}
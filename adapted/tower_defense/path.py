@@ -1,42 +1,144 @@
-from typing import List, Tuple, Set, Dict, Optional
+import math
+from collections import deque
+from typing import List, Tuple, Set, Dict, Optional, Iterable, Sequence, Protocol
 
 from tower_defense.grid import GridVector, Grid
 
-Path = List[GridVector]
 Vector = Tuple[float, float]
 GridPosition = Tuple[int, int]
 Graph = Dict[GridPosition, Set[GridPosition]]
+DistanceField = Dict[GridPosition, int]
+Interval = Tuple[float, float]
 
-
-def _add_vectors(vector_a: Vector, vector_b: Vector) -> Vector:
-    return vector_a[0] + vector_b[0], vector_a[1] + vector_b[1]
+# Margin by which the range intervals are widened, so that rounding errors can never
+# exclude a monster standing exactly at the limit of the range
+_INTERVAL_MARGIN = 1e-6
 
 
 def _subtract_vectors(vector_a: Vector, vector_b: Vector) -> Vector:
     return vector_a[0] - vector_b[0], vector_a[1] - vector_b[1]
 
 
-def _multiply_vector(vector: Vector, scalar: float) -> Vector:
-    return scalar * vector[0], scalar * vector[1]
+class Track(Protocol):
+    """What a monster follows, by distance travelled"""
+
+    def compute_position(self, distance: float) -> Vector:
+        ...
+
+    def has_arrived(self, distance: float) -> bool:
+        ...
+
+
+class Path(List[GridVector]):
+    """Blocks followed by the monsters, compiled into position lookup tables
+
+    A path behaves as the list of its blocks, and must not be modified once built.
+    """
+
+    def __init__(self, blocks: Iterable[GridVector] = ()):
+        super().__init__(blocks)
+        self.xs: Tuple[float, ...] = tuple(float(x) for x, _ in self)
+        self.ys: Tuple[float, ...] = tuple(float(y) for _, y in self)
+        # Direction from each block to the next one, null for the last block
+        self.dxs: Tuple[float, ...] = tuple(
+            after - before for before, after in zip(self.xs, self.xs[1:])
+        ) + (0.0,)
+        self.dys: Tuple[float, ...] = tuple(
+            after - before for before, after in zip(self.ys, self.ys[1:])
+        ) + (0.0,)
+        # Distance travelled when reaching the last block
+        self.arrival_distance: int = len(self) - 1
+
+    def compute_position(self, distance: float) -> Vector:
+        int_part, last_block_distance = divmod(distance, 1)
+        index = int(int_part)
+        if index >= self.arrival_distance:
+            index = self.arrival_distance
+        elif index < 0:
+            index = 0
+        else:
+            return (
+                self.xs[index] + last_block_distance * self.dxs[index],
+                self.ys[index] + last_block_distance * self.dys[index],
+            )
+        return self.xs[index], self.ys[index]
+
+    def compute_positions(self, distances: Iterable[float]) -> List[Vector]:
+        compute = self.compute_position
+        return [compute(distance) for distance in distances]
+
+    def has_arrived(self, distance: float) -> bool:
+        return distance >= self.arrival_distance
+
+
+def _as_path(path: Sequence[GridVector]) -> Path:
+    return path if isinstance(path, Path) else Path(path)
+
 
+def compute_position(path: Sequence[GridVector], distance: float) -> Vector:
+    return _as_path(path).compute_position(distance)
 
-def compute_position(path: Path, distance: float) -> Vector:
-    int_part, last_block_distance = divmod(distance, 1)
 
-    def clip(value):
-        return min(max(value, 0), len(path) - 1)
+def has_arrived(path: Sequence[GridVector], distance: float) -> bool:
+    return _as_path(path).has_arrived(distance)
 
-    before_index = clip(int(int_part))
-    after_index = clip(int(int_part) + 1)
-    before_position = path[before_index]
-    after_position = path[after_index]
-    vector = _subtract_vectors(after_position, before_position)
-    scaled_vector = _multiply_vector(vector, last_block_distance)
-    return _add_vectors(before_position, scaled_vector)
 
+def _segment_range_interval(
+    start: Vector, end: Vector, center: Vector, radius: float
+) -> Optional[Interval]:
+    # Solves |start + t * (end - start) - center| <= radius for t in [0, 1]
+    direction = _subtract_vectors(end, start)
+    offset = _subtract_vectors(start, center)
+    a = direction[0] ** 2 + direction[1] ** 2
+    b = 2 * (offset[0] * direction[0] + offset[1] * direction[1])
+    c = offset[0] ** 2 + offset[1] ** 2 - radius**2
+    if a == 0:
+        return (0.0, 1.0) if c <= 0 else None
+    discriminant = b**2 - 4 * a * c
+    if discriminant < 0:
+        return None
+    root = math.sqrt(discriminant)
+    t_min = max((-b - root) / (2 * a), 0.0)
+    t_max = min((-b + root) / (2 * a), 1.0)
+    return (t_min, t_max) if t_min <= t_max else None
 
-def has_arrived(path, distance: float) -> bool:
-    return distance >= len(path) - 1
+
+def compute_range_intervals(
+    path: Sequence[GridVector], center: Vector, radius: float
+) -> List[Interval]:
+    """Compute the sorted distance intervals along the path that lie within range
+
+    The intervals are slightly widened: they contain every distance whose position
+    is within `radius` of `center`, and the exact check is left to the caller.
+    """
+    if len(path) == 0:
+        return []
+    if not math.isfinite(radius):
+        return [(-math.inf, math.inf)]
+    intervals: List[Interval] = []
+    for index in range(len(path) - 1):
+        interval = _segment_range_interval(path[index], path[index + 1], center, radius)
+        if interval is None:
+            continue
+        start = index + interval[0] - _INTERVAL_MARGIN
+        end = index + interval[1] + _INTERVAL_MARGIN
+        if intervals and start <= intervals[-1][1]:
+            intervals[-1] = (intervals[-1][0], end)
+        else:
+            intervals.append((start, end))
+    # Positions are clipped to the ends of the path
+    if math.dist(path[0], center) <= radius + _INTERVAL_MARGIN:
+        if intervals and intervals[0][0] <= _INTERVAL_MARGIN:
+            intervals[0] = (-math.inf, intervals[0][1])
+        else:
+            intervals.insert(0, (-math.inf, _INTERVAL_MARGIN))
+    if math.dist(path[-1], center) <= radius + _INTERVAL_MARGIN:
+        last_index = len(path) - 1
+        if intervals and intervals[-1][1] >= last_index - _INTERVAL_MARGIN:
+            intervals[-1] = (intervals[-1][0], math.inf)
+        else:
+            intervals.append((last_index - _INTERVAL_MARGIN, math.inf))
+    return intervals
 
 
 def _build_graph(grid: Grid) -> Graph:
@@ -52,25 +154,132 @@ def _build_graph(grid: Grid) -> Graph:
     return graph
 
 
-def _find_path(graph: Graph, spawn: GridPosition) -> List[GridPosition]:
+def _compute_distances(graph: Graph, origins: Iterable[GridPosition]) -> DistanceField:
+    # Breadth-first search: the blocks are found by increasing distance to the
+    # closest origin
+    distances = dict.fromkeys(origins, 0)
+    queue = deque(distances)
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph[node]:
+            if neighbor not in distances:
+                distances[neighbor] = distances[node] + 1
+                queue.append(neighbor)
+    return distances
+
+
+def _get_next_nodes(
+    graph: Graph, distance_field: DistanceField, node: GridPosition
+) -> List[GridPosition]:
+    next_distance = distance_field[node] - 1
+    return sorted(
+        neighbor
+        for neighbor in graph[node]
+        if distance_field[neighbor] == next_distance
+    )
+
+
+def _count_routes(
+    graph: Graph, distance_field: DistanceField, limit: int
+) -> Dict[GridPosition, int]:
+    """Count the shortest routes from each block to an exit, up to `limit`"""
+    route_counts: Dict[GridPosition, int] = {}
+    # The distance field lists the blocks by increasing distance
+    for node in distance_field:
+        next_nodes = _get_next_nodes(graph, distance_field, node)
+        route_counts[node] = (
+            min(sum(route_counts[next_node] for next_node in next_nodes), limit)
+            if next_nodes
+            else 1
+        )
+    return route_counts
+
+
+def _draw_route(
+    graph: Graph,
+    distance_field: DistanceField,
+    route_counts: Dict[GridPosition, int],
+    spawn: GridPosition,
+    rank: int,
+) -> List[GridPosition]:
+    """Walk down the distance field from `spawn`, along its route of rank `rank`
+
+    At each fork, the branch is chosen from the number of routes through each
+    branch, so that the ranks below the route count of `spawn` give distinct routes.
+    """
+    route = [spawn]
     node = spawn
-    previous_node: Optional[GridPosition] = None
-    path_list = []
-    while True:
-        path_list.append(node)
-        next_nodes = [neighbor for neighbor in graph[node] if neighbor != previous_node]
-        if len(next_nodes) == 0:
-            break
-        elif len(next_nodes) > 1:
-            raise ValueError(
-                f"Found an ambiguous path choice in the provided map at block {node}"
-            )
-        previous_node = node
-        node = next_nodes[0]
-    return path_list
+    next_nodes = _get_next_nodes(graph, distance_field, node)
+    while next_nodes:
+        for node in next_nodes:
+            if rank < route_counts[node]:
+                break
+            rank -= route_counts[node]
+        route.append(node)
+        next_nodes = _get_next_nodes(graph, distance_field, node)
+    return route
 
 
-def extract_path(grid: Grid) -> Path:
+def _is_on_edge(grid: Grid, position: GridPosition) -> bool:
+    x, y = position
+    return x in (0, grid.width - 1) or y in (0, grid.height - 1)
+
+
+class Lanes(List[Path]):
+    """Paths followed by the monsters, from every spawn to the closest exit
+
+    The walkable blocks connected to the spawn of the grid form the map. Its dead
+    ends on the edge of the grid are the exits, and its other dead ends are spawns,
+    along with the spawn of the grid, which is the exit too if it is alone. A lane is
+    a shortest route from a spawn to an exit: at most a given number of lanes are
+    drawn down the distance field, choosing a branch at each fork, and the other
+    routes are left out.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        spawns: Sequence[GridPosition],
+        exits: Sequence[GridPosition],
+        distance_field: DistanceField,
+    ):
+        super().__init__(paths)
+        self.spawns = spawns
+        self.exits = exits
+        # Distance from each walkable block to the closest exit, in blocks
+        self.distance_field = distance_field
+
+
+def extract_lanes(grid: Grid, max_lanes: int = 64) -> Lanes:
     graph = _build_graph(grid)
     spawn = grid.find_spawn()
-    return _find_path(graph, spawn)
+    dead_ends = sorted(
+        node
+        for node in _compute_distances(graph, [spawn])
+        if len(graph[node]) <= 1 and node != spawn
+    )
+    # A lone spawn is also the exit
+    exits = [node for node in dead_ends if _is_on_edge(grid, node)] or (
+        [] if graph[spawn] else [spawn]
+    )
+    if not exits:
+        raise ValueError(
+            f"Found no exit in the provided map: no dead end of the path from the "
+            f"block {spawn} is on the edge of the grid"
+        )
+    distance_field = _compute_distances(graph, exits)
+    spawns = [spawn] + [node for node in dead_ends if not _is_on_edge(grid, node)]
+    route_counts = _count_routes(graph, distance_field, max_lanes)
+    paths = []
+    for index, lane_spawn in enumerate(spawns):
+        # Each spawn gets at least one lane
+        lanes_left = max(max_lanes - len(paths) - (len(spawns) - index - 1), 1)
+        for rank in range(min(route_counts[lane_spawn], lanes_left)):
+            route = _draw_route(graph, distance_field, route_counts, lane_spawn, rank)
+            paths.append(Path(route))
+    return Lanes(paths, spawns, exits, distance_field)
+
+
+def extract_path(grid: Grid) -> Path:
+    """Extract the first lane of the grid: the one from the spawn of the grid"""
+    return extract_lanes(grid)[0]
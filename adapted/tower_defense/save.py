@@ -0,0 +1,387 @@
+import struct
+import math
+from typing import Dict, List, Tuple, Optional, Iterable, Any
+
+from tower_defense.core.effects import IEffect, DamageEffect, SlowEffect, StunEffect
+from tower_defense.core.entities import Entities
+from tower_defense.core.monster.monster import IMonster
+from tower_defense.core.projectile.projectile import IProjectile
+from tower_defense.core.projectile.projectile_strategies import (
+    MovementStrategy,
+    HitStrategy,
+    tracking_movement_strategy,
+    constant_angle_movement_strategy,
+    tracking_hit_strategy,
+    near_enough_hit_strategy,
+)
+from tower_defense.core.projectile.projectiles import Projectile
+from tower_defense.core.projectile.stats import FrozenProjectileStats
+from tower_defense.core.tower.default import TowerMapping
+from tower_defense.core.tower.tower_entity import ITowerEntity
+from tower_defense.core.upgradable import Up
+from tower_defense.interfaces.targeting_strategies import (
+    TargetingStrategy,
+    SortingParam,
+)
+from tower_defense.wave_generator import WaveGenerator
+
+MAGIC = b"TDSV"
+VERSION = 3
+
+# All the records are little-endian, without padding
+_HEADER = struct.Struct("<4sH")
+# Time, player money and health
+_GAME = struct.Struct("<qqq")
+# Internal state of the Mersenne Twister of the game: 624 words and a position
+_RNG = struct.Struct("<625I")
+# Wave index, monster index, spawning flag, spawning time and next spawn time
+_WAVES = struct.Struct("<II?qq")
+_COUNT = struct.Struct("<I")
+_STRING_LENGTH = struct.Struct("<H")
+# Type, in game flag, health, distance, speed, due time of the end of the slow, lane
+_MONSTER = struct.Struct("<H?qddqH")
+# Speed, range, hitbox radius, range sensitive flag, number of effects
+_STATS = struct.Struct("<ddd?B")
+# Kind of effect, and its two parameters
+_EFFECT = struct.Struct("<Bdd")
+# Position, name, level, targeting key and order, sticky flag, target, reload time
+_TOWER = struct.Struct("<iiHHB??qq")
+# Name, stats, strategies, flight flag, target, position, angle, travelled distance
+_PROJECTILE = struct.Struct("<HHBB?qdddd")
+
+# Index of the missing monsters, and due time of the events not scheduled
+_NONE = -1
+
+_MOVEMENT_STRATEGIES: List[MovementStrategy] = [
+    tracking_movement_strategy,
+    constant_angle_movement_strategy,
+]
+_HIT_STRATEGIES: List[HitStrategy] = [tracking_hit_strategy, near_enough_hit_strategy]
+_DAMAGE, _SLOW, _STUN = range(3)
+
+
+class SaveFormatError(ValueError):
+    pass
+
+
+def _encode_effect(effect: IEffect) -> bytes:
+    if isinstance(effect, StunEffect):
+        return _EFFECT.pack(_STUN, 0.0, effect.duration.value)
+    if isinstance(effect, SlowEffect):
+        return _EFFECT.pack(_SLOW, effect.factor.value, effect.duration.value)
+    if isinstance(effect, DamageEffect):
+        return _EFFECT.pack(_DAMAGE, effect.damage.value, 0.0)
+    raise SaveFormatError(f"Cannot save effect {effect!r}")
+
+
+def _decode_effect(kind: int, first: float, second: float) -> IEffect:
+    if kind == _STUN:
+        return StunEffect(duration=Up(second))
+    if kind == _SLOW:
+        return SlowEffect(factor=Up(first), duration=Up(second))
+    if kind == _DAMAGE:
+        return DamageEffect(damage=Up(int(first)))
+    raise SaveFormatError(f"Unknown effect kind {kind}")
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+        self._strings: Dict[str, int] = {}
+
+    def intern(self, string: str) -> int:
+        return self._strings.setdefault(string, len(self._strings))
+
+    def write_count(self, count: int) -> None:
+        self.chunks.append(_COUNT.pack(count))
+
+    def string_table(self) -> bytes:
+        chunks = [_COUNT.pack(len(self._strings))]
+        for string in self._strings:
+            encoded = string.encode()
+            chunks.append(_STRING_LENGTH.pack(len(encoded)))
+            chunks.append(encoded)
+        return b"".join(chunks)
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+        self._offset = 0
+
+    def read(self, record: struct.Struct) -> Tuple[Any, ...]:
+        try:
+            values = record.unpack_from(self._data, self._offset)
+        except struct.error as error:
+            raise SaveFormatError("Truncated save") from error
+        self._offset += record.size
+        return values
+
+    def read_count(self) -> int:
+        return self.read(_COUNT)[0]
+
+    def read_records(self, record: struct.Struct) -> Iterable[Tuple[Any, ...]]:
+        count = self.read_count()
+        end = self._offset + count * record.size
+        if end > len(self._data):
+            raise SaveFormatError("Truncated save")
+        records = record.iter_unpack(self._data[self._offset : end])
+        self._offset = end
+        return records
+
+    def read_string_table(self) -> List[str]:
+        strings = []
+        for _ in range(self.read_count()):
+            (length,) = self.read(_STRING_LENGTH)
+            strings.append(
+                bytes(self._data[self._offset : self._offset + length]).decode()
+            )
+            self._offset += length
+        return strings
+
+
+def _collect_monsters(entities: Entities) -> List[IMonster]:
+    """List the monsters in game, then the removed ones still referenced"""
+    monsters: Dict[IMonster, None] = dict.fromkeys(entities.monsters)
+    for tower in entities.towers.values():
+        target = tower.get_target()
+        if target is not None:
+            monsters.setdefault(target)
+    for projectile in entities.projectiles:
+        monsters.setdefault(projectile.get_target())
+    for flight in entities.flights:
+        monsters.setdefault(flight.get_target())
+    return list(monsters)
+
+
+def save_game(entities: Entities, wave_generator: WaveGenerator) -> bytes:
+    """Serialize the state of a game, to be restored with `load_game`"""
+    if not entities.can_be_saved:
+        raise SaveFormatError("Cannot save an open field game")
+    writer = _Writer()
+    chunks = writer.chunks
+    chunks.append(_HEADER.pack(MAGIC, VERSION))
+    player = entities.player
+    chunks.append(_GAME.pack(entities.time, player.money, player.health))
+    _, rng_state, _ = entities.rng.getstate()
+    chunks.append(_RNG.pack(*rng_state))
+    chunks.append(
+        _WAVES.pack(
+            wave_generator.current_wave_index,
+            wave_generator.current_monster_index,
+            wave_generator.spawning,
+            wave_generator.spawning_time,
+            wave_generator.next_spawn_time,
+        )
+    )
+    body_start = len(chunks)
+
+    monsters = _collect_monsters(entities)
+    monster_indices = {monster: index for index, monster in enumerate(monsters)}
+    slow_expiries = {monster: due for due, monster in entities.slow_expiries}
+    type_ids = entities.get_monster_type_ids()
+    writer.write_count(len(monsters))
+    pack_monster = _MONSTER.pack
+    chunks.extend(
+        pack_monster(
+            type_ids[monster.get_model_name()],
+            monster in entities.monsters,
+            monster.health_,
+            monster.distance_travelled_,
+            monster.get_speed(),
+            slow_expiries.get(monster, _NONE),
+            monster.lane_,
+        )
+        for monster in monsters
+    )
+
+    def target_index(target: Optional[IMonster]) -> int:
+        return _NONE if target is None else monster_indices[target]
+
+    reloads = {tower: due for due, tower in entities.tower_reloads}
+    writer.write_count(len(entities.towers))
+    for (x, y), tower in entities.towers.items():
+        chunks.append(
+            _TOWER.pack(
+                x,
+                y,
+                writer.intern(tower.get_name()),
+                tower.get_level(),
+                tower.targeting_strategy.key.value,
+                tower.targeting_strategy.reverse,
+                tower.sticky_target,
+                target_index(tower.get_target()),
+                _NONE if tower.is_loaded() else reloads[tower],
+            )
+        )
+
+    # Projectiles, with their position and whether they are resolved analytically
+    in_flight: List[Tuple[IProjectile, Tuple[float, float], bool]] = [
+        (projectile, projectile.get_position(), False)
+        for projectile in entities.projectiles
+    ]
+    for flight in entities.flights:
+        flight.materialize(entities.time)
+        in_flight.append((flight.get_projectile(), flight.get_position(), True))
+    # Stats are shared by the projectiles of a level, and saved once, by identity
+    stats_indices: Dict[int, int] = {}
+    stats_table: List[FrozenProjectileStats] = []
+    projectile_chunks = []
+    for projectile, (x, y), flying in in_flight:
+        if not isinstance(projectile, Projectile):
+            raise SaveFormatError(f"Cannot save projectile {projectile!r}")
+        stats_index = stats_indices.get(id(projectile.stats))
+        if stats_index is None:
+            stats_index = stats_indices[id(projectile.stats)] = len(stats_table)
+            stats_table.append(projectile.stats)
+        projectile_chunks.append(
+            _PROJECTILE.pack(
+                writer.intern(projectile.get_model_name()),
+                stats_index,
+                _MOVEMENT_STRATEGIES.index(projectile.movement_strategy),
+                _HIT_STRATEGIES.index(projectile.hit_strategy),
+                flying,
+                monster_indices[projectile.get_target()],
+                x,
+                y,
+                projectile.get_orientation(),
+                projectile.get_travelled_distance(),
+            )
+        )
+    writer.write_count(len(stats_table))
+    for stats in stats_table:
+        chunks.append(
+            _STATS.pack(
+                stats.speed,
+                stats.range,
+                stats.hitbox_radius,
+                stats.range_sensitive,
+                len(stats.effects),
+            )
+        )
+        chunks.extend(_encode_effect(effect) for effect in stats.effects)
+    writer.write_count(len(projectile_chunks))
+    chunks.extend(projectile_chunks)
+
+    chunks.insert(body_start, writer.string_table())
+    return b"".join(chunks)
+
+
+def load_game(
+    data: bytes,
+    entities: Entities,
+    wave_generator: WaveGenerator,
+    tower_mapping: TowerMapping,
+) -> None:
+    """Restore a game saved by `save_game`, without replaying its ticks
+
+    The entities and the wave generator must be new, built on the same lanes, monster
+    types and scenario as the saved game.
+    """
+    reader = _Reader(data)
+    magic, version = reader.read(_HEADER)
+    if magic != MAGIC:
+        raise SaveFormatError("Not a tower defense save")
+    if version != VERSION:
+        raise SaveFormatError(f"Unsupported save version: {version}")
+    entities.time, entities.player.money, entities.player.health = reader.read(_GAME)
+    entities.rng.setstate((3, reader.read(_RNG), None))
+    (
+        wave_generator.current_wave_index,
+        wave_generator.current_monster_index,
+        wave_generator.spawning,
+        wave_generator.spawning_time,
+        wave_generator.next_spawn_time,
+    ) = reader.read(_WAVES)
+    strings = reader.read_string_table()
+
+    lanes = entities.get_lanes()
+    monsters: List[IMonster] = []
+    for (
+        type_id,
+        in_game,
+        health,
+        distance,
+        speed,
+        slow_due,
+        lane,
+    ) in reader.read_records(_MONSTER):
+        monster = (
+            entities.spawn_monster(type_id, lane)
+            if in_game
+            else entities.create_monster(type_id, lane=lane)
+        )
+        monster.health_ = health
+        monster.distance_travelled_ = distance
+        base_speed = monster.get_speed()
+        if speed != base_speed:
+            monster.slow_down(base_speed / speed if speed else math.inf, 0.0)
+            monster.pop_slow_duration()
+        if slow_due != _NONE:
+            entities.slow_expiries.schedule(slow_due, monster)
+        monster.update_position(lanes[lane], 0)
+        monsters.append(monster)
+
+    for (
+        x,
+        y,
+        name_index,
+        level,
+        key,
+        reverse,
+        sticky,
+        target,
+        reload_due,
+    ) in reader.read_records(_TOWER):
+        tower: ITowerEntity = tower_mapping[strings[name_index]].build_tower(x, y)
+        for _ in range(level - 1):
+            tower.upgrade()
+        tower.targeting_strategy = TargetingStrategy(SortingParam(key), reverse)
+        tower.sticky_target = sticky
+        tower.set_target(None if target == _NONE else monsters[target])
+        if reload_due != _NONE:
+            tower.unload()
+            entities.tower_reloads.schedule(reload_due, tower)
+        entities.towers[(x, y)] = tower
+
+    stats_table = []
+    for _ in range(reader.read_count()):
+        speed, range_, hitbox_radius, range_sensitive, effect_count = reader.read(
+            _STATS
+        )
+        effects = tuple(
+            _decode_effect(*reader.read(_EFFECT)) for _ in range(effect_count)
+        )
+        stats_table.append(
+            FrozenProjectileStats(
+                speed, range_, hitbox_radius, range_sensitive, effects
+            )
+        )
+
+    for (
+        name_index,
+        stats_index,
+        movement,
+        hit,
+        flying,
+        target,
+        x,
+        y,
+        angle,
+        travelled_distance,
+    ) in reader.read_records(_PROJECTILE):
+        projectile = Projectile(
+            strings[name_index],
+            x,
+            y,
+            angle,
+            stats_table[stats_index],
+            _MOVEMENT_STRATEGIES[movement],
+            _HIT_STRATEGIES[hit],
+            monsters[target],
+            travelled_distance,
+        )
+        if flying:
+            entities.fly(projectile, (x, y), entities.time)
+        else:
+            entities.projectiles.add(projectile)
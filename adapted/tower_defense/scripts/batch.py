@@ -0,0 +1,86 @@
+import csv
+import json
+import os
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+from itertools import product
+from typing import List
+
+from tower_defense.batch import BatchJob, BatchResult, run_batch, aggregate
+from tower_defense.scripts.game import TIMESTEP, get_file_stems, get_map_names
+
+
+def add_arguments(
+    parser: ArgumentParser, map_names: List[str], wave_names: List[str]
+) -> None:
+    parser.add_argument(
+        "-m",
+        "--maps",
+        help="Maps to play on",
+        nargs="+",
+        choices=map_names,
+        default=map_names,
+    )
+    parser.add_argument(
+        "-s",
+        "--scenarios",
+        help="Scenarios to play (waves of monsters)",
+        nargs="+",
+        choices=wave_names,
+        default=wave_names,
+    )
+    parser.add_argument(
+        "--layouts", help="Number of random tower layouts per map", type=int, default=4
+    )
+    parser.add_argument(
+        "--towers", help="Number of towers per layout", type=int, default=10
+    )
+    parser.add_argument(
+        "--seeds", help="Number of games per layout and scenario", type=int, default=4
+    )
+    parser.add_argument(
+        "--ticks",
+        help="Maximum number of ticks to simulate per game, "
+        "unbounded if not provided",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--workers", help="Number of processes", type=int, default=os.cpu_count()
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="CSV file receiving the results aggregated over the seeds",
+        default="batch.csv",
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
+    map_names = get_map_names()
+    wave_names = sorted(get_file_stems("texts/waveTexts"))
+    add_arguments(parser, map_names, wave_names)
+    args = parser.parse_args()
+    jobs = [
+        BatchJob(
+            map_name, scenario, layout_index, args.towers, seed, TIMESTEP, args.ticks
+        )
+        for map_name, scenario, layout_index, seed in product(
+            args.maps, args.scenarios, range(args.layouts), range(args.seeds)
+        )
+    ]
+    results: List[BatchResult] = []
+    for result in run_batch(jobs, args.workers):
+        results.append(result)
+        print(json.dumps(result.to_dict()), flush=True)
+    rows = aggregate(results)
+    if not rows:
+        return
+    with open(args.output, "w", newline="") as output_file:
+        writer = csv.DictWriter(output_file, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,57 @@
 import time
-from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter
+
+# Taken first, so that the startup report covers the imports of the game
+_IMPORTS_STARTED = time.perf_counter()
+
+import json
+import random
+import sys
+from argparse import ArgumentParser, ArgumentDefaultsHelpFormatter, Namespace
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Iterable, Sequence
-
-import pkg_resources
+from importlib.metadata import EntryPoint
+from typing import List, Iterable, Sequence, Optional, Dict, Any
 
 from tower_defense.core.entities import Entities
-from tower_defense.core.monster.default import MONSTER_MAPPING
+from tower_defense.core.monster.default import MONSTER_MAPPING, MONSTER_STATS
+from tower_defense.core.open_field_entities import OpenFieldEntities
+from tower_defense.game_loop import GameLoop, LoopStats
 from tower_defense.grid import Grid
+from tower_defense.headless import run_headless, ReplayPilot, HeadlessReport
+from tower_defense.input_log import InputRecorder, read_input_log
 from tower_defense.interfaces.updatable import Updatable
-from tower_defense.interfaces.views import ViewLauncher, retrieve_view_launchers
-from tower_defense.path import extract_path
+from tower_defense.interfaces.views import (
+    ViewLauncher,
+    retrieve_view_launchers,
+    find_view_plugins,
+)
+from tower_defense.path import extract_lanes, Path as MonsterPath
+from tower_defense.startup import STARTUP_TIMER
+from tower_defense.tick_stats import TickStats
 from tower_defense.tower_defense_controller import TowerDefenseController
 from tower_defense.wave_generator import WaveGenerator
 
 TIMESTEP: int = 50
 
+DEFAULT_VIEW = "tkinter_view"
+
 
 def get_file_stems(folder_path: str, pattern: str = "*.txt") -> List[str]:
     return [path.stem for path in Path(folder_path).glob(pattern)]
 
 
+def get_map_names(folder_path: str = "texts/mapTexts") -> List[str]:
+    # Large maps may only exist in the binary format
+    return sorted(
+        set(get_file_stems(folder_path)) | set(get_file_stems(folder_path, "*.grid"))
+    )
+
+
 def add_arguments(
-    parser: ArgumentParser, map_names: Iterable[str], wave_names: Iterable[str]
+    parser: ArgumentParser,
+    map_names: Iterable[str],
+    wave_names: Iterable[str],
+    view_names: Sequence[str] = (),
 ) -> None:
     parser.add_argument(
         "-m", "--map", help="Map to play on", choices=map_names, default="LeoMap"
@@ -35,41 +63,273 @@ def add_arguments(
         choices=wave_names,
         default="WaveGenerator2",
     )
+    parser.add_argument(
+        "--monster-engine",
+        help="Storage of the monsters: one object per monster, "
+        "or NumPy arrays updated all at once (requires the numpy extra)",
+        choices=["objects", "arrays"],
+        default="objects",
+    )
+    parser.add_argument(
+        "--analytic-projectiles",
+        help="Schedule the hits of the tracking projectiles when they are shot, "
+        "instead of moving them at every tick",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--open-field",
+        help="Let the monsters walk across the constructible blocks too, around the "
+        "towers, which can then be built anywhere the way to the exit stays open "
+        "(requires the objects monster engine)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--timestep",
+        help="Simulated time of a tick, in milliseconds: the views interpolate the "
+        "entities between ticks, so that the game can run at a lower tick rate",
+        type=int,
+        default=TIMESTEP,
+    )
+    parser.add_argument(
+        "--seed",
+        help="Seed of the random draws of the simulation, "
+        "so that a game can be played again identically",
+        type=int,
+        default=None,
+    )
+    parser.add_argument(
+        "--tick-stats",
+        help="Measure the duration of each phase of the ticks, "
+        "and add their percentiles to the headless report, or print them with the "
+        "counters of the game loop when the game is closed",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--headless",
+        help="Run the simulation as fast as possible without any view, "
+        "then print a JSON report",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--view",
+        help="View plugin to load, the only one imported: none in headless mode",
+        choices=view_names,
+        default=DEFAULT_VIEW if DEFAULT_VIEW in view_names else None,
+    )
+    parser.add_argument(
+        "--startup-report",
+        help="Print the duration of each phase of the startup on stderr, as JSON",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--record",
+        help="File where to log the commands of the player, to replay the game",
+        default=None,
+    )
+    parser.add_argument(
+        "--replay",
+        help="Log of commands to play again headlessly, as fast as possible, "
+        "on the map and scenario it was recorded on",
+        default=None,
+    )
+    parser.add_argument(
+        "--ticks",
+        help="Maximum number of ticks to simulate in headless mode, "
+        "unbounded if not provided",
+        type=int,
+        default=None,
+    )
 
 
-def run_controller(controller: Updatable, timestep: int = TIMESTEP) -> None:
-    previous_ns: int = time.time_ns()
-    while True:
-        now_ns: int = time.time_ns()
-        elapsed_ms: int = (now_ns - previous_ns) // 1_000_000
-        previous_ns = now_ns
-        controller.update(elapsed_ms)
-        time.sleep(timestep / 1000)
+def build_entities(
+    lanes: Sequence[MonsterPath],
+    monster_engine: str = "objects",
+    analytic_projectiles: bool = False,
+    seed: Optional[int] = None,
+    open_field_grid: Optional[Grid] = None,
+) -> Entities:
+    """
+    :param open_field_grid: the grid the monsters walk across, around the towers,
+        instead of following their lane, if not None
+    """
+    if open_field_grid is not None:
+        if monster_engine != "objects":
+            raise ValueError("The open field requires the objects monster engine")
+        return OpenFieldEntities(
+            _monster_factories=MONSTER_MAPPING,
+            analytic_projectiles=analytic_projectiles,
+            rng=random.Random(seed),
+            _lanes=list(lanes),
+            _grid=open_field_grid,
+        )
+    if monster_engine == "arrays":
+        # Imported here, as NumPy is an optional dependency
+        from tower_defense.core.array_entities import ArrayEntities
+
+        return ArrayEntities(
+            _monster_stats=MONSTER_STATS,
+            analytic_projectiles=analytic_projectiles,
+            rng=random.Random(seed),
+            _lanes=list(lanes),
+        )
+    return Entities(
+        _monster_factories=MONSTER_MAPPING,
+        analytic_projectiles=analytic_projectiles,
+        rng=random.Random(seed),
+        _lanes=list(lanes),
+    )
+
+
+def run_controller(controller: Updatable, loop: GameLoop) -> LoopStats:
+    loop.run(controller)
+    return loop.stats
 
 
 def run(
-    view_launchers: Sequence[ViewLauncher], controller: TowerDefenseController
-) -> None:
+    view_launchers: Sequence[ViewLauncher],
+    controller: TowerDefenseController,
+    timestep: int = TIMESTEP,
+) -> LoopStats:
+    loop = GameLoop(timestep)
+    # Reported with the tick stats
+    controller.loop_stats = loop.stats
     with ThreadPoolExecutor() as executor:
         for view_launcher in view_launchers:
             executor.submit(view_launcher, controller)
-        run_controller(controller)
+        return run_controller(controller, loop)
+
+
+def _game_header(args: Namespace) -> Dict[str, Any]:
+    return {
+        "map": args.map,
+        "scenario": args.scenario,
+        "seed": args.seed,
+        "monster_engine": args.monster_engine,
+        "analytic_projectiles": args.analytic_projectiles,
+        "open_field": args.open_field,
+        "timestep": args.timestep,
+    }
+
+
+def _build_controller(
+    args: Namespace,
+    input_recorder: Optional[InputRecorder] = None,
+    threaded_views: bool = False,
+) -> TowerDefenseController:
+    with STARTUP_TIMER.measure("map_load"):
+        grid = Grid.load(args.map)
+        wave_generator = WaveGenerator.load(args.scenario)
+    with STARTUP_TIMER.measure("path_extraction"):
+        lanes = extract_lanes(grid)
+    entities = build_entities(
+        lanes,
+        args.monster_engine,
+        args.analytic_projectiles,
+        args.seed,
+        grid if args.open_field else None,
+    )
+    return TowerDefenseController(
+        grid,
+        wave_generator,
+        entities,
+        tick_stats=TickStats() if args.tick_stats else None,
+        input_recorder=input_recorder,
+        publish_snapshots=threaded_views,
+        queue_commands=threaded_views,
+    )
+
+
+def _print_report(
+    controller: TowerDefenseController, report: HeadlessReport, args: Namespace
+) -> None:
+    report_dict = report.to_dict()
+    if args.tick_stats:
+        report_dict["tick_stats"] = controller.get_tick_stats()
+    print(json.dumps(report_dict, indent=2))
+
+
+def _print_tick_stats(controller: TowerDefenseController) -> None:
+    print(json.dumps({"tick_stats": controller.get_tick_stats()}), file=sys.stderr)
+
+
+def _print_startup_report(durations_ms: Dict[str, float]) -> None:
+    print(json.dumps({"startup_ms": durations_ms}), file=sys.stderr)
+
+
+def _load_view_plugin(view_plugin: Optional[EntryPoint]) -> None:
+    if view_plugin is None:
+        return
+    with STARTUP_TIMER.measure("import"):
+        # Registers the launchers of the view
+        view_plugin.load()
+
+
+def play(
+    args: Namespace,
+    view_plugin: Optional[EntryPoint] = None,
+    input_recorder: Optional[InputRecorder] = None,
+) -> None:
+    _load_view_plugin(view_plugin)
+    # The views run in other threads: they read the published snapshots, and their
+    # commands are applied between the ticks
+    controller = _build_controller(args, input_recorder, not args.headless)
+    if args.headless:
+        report = run_headless(controller, args.timestep, args.ticks)
+        _print_report(controller, report, args)
+    else:
+        try:
+            run(retrieve_view_launchers(), controller, args.timestep)
+        finally:
+            # The game runs until it is interrupted
+            if args.tick_stats:
+                _print_tick_stats(controller)
+
+
+def replay(args: Namespace) -> None:
+    with open(args.replay) as stream:
+        header, commands = read_input_log(stream)
+    for name in ("map", "scenario", "seed", "monster_engine", "analytic_projectiles"):
+        setattr(args, name, header[name])
+    # Absent from the logs recorded before the open field existed
+    args.open_field = header.get("open_field", False)
+    controller = _build_controller(args)
+    report = run_headless(
+        controller, header["timestep"], args.ticks, ReplayPilot(commands)
+    )
+    _print_report(controller, report, args)
 
 
 def main() -> None:
-    for entry_point in pkg_resources.iter_entry_points("tower_defense.views"):
-        print(f"Loading {entry_point.name} plugin")
-        entry_point.load()
+    STARTUP_TIMER.add("import", time.perf_counter() - _IMPORTS_STARTED)
+    view_plugins = find_view_plugins()
     parser = ArgumentParser(formatter_class=ArgumentDefaultsHelpFormatter)
-    map_names = get_file_stems("texts/mapTexts")
+    map_names = get_map_names()
     wave_names = get_file_stems("texts/waveTexts")
-    add_arguments(parser, map_names, wave_names)
+    add_arguments(parser, map_names, wave_names, sorted(view_plugins))
     args = parser.parse_args()
-    grid = Grid.load(args.map)
-    wave_generator = WaveGenerator.load(args.scenario)
-    entities = Entities(_path=extract_path(grid), _monster_factories=MONSTER_MAPPING)
-    controller = TowerDefenseController(grid, wave_generator, entities)
-    run(retrieve_view_launchers(), controller)
+    if args.open_field and args.monster_engine != "objects":
+        parser.error("--open-field requires the objects monster engine")
+    view_plugin = None
+    if args.replay is None and not args.headless and args.view is not None:
+        view_plugin = view_plugins[args.view]
+        print(f"Loading {args.view} plugin")
+    if args.startup_report:
+        phases = ["import", "map_load", "path_extraction"]
+        if view_plugin is not None:
+            # Measured by the view, once its sprites are decoded
+            phases.append("asset_load")
+        STARTUP_TIMER.report_when_measured(phases, _print_startup_report)
+    if args.replay is not None:
+        replay(args)
+    elif args.record is not None:
+        # The seed is part of the log, so that the game can be played again
+        if args.seed is None:
+            args.seed = random.randrange(2**32)
+        # Appended to, so that the sessions recorded before are kept
+        with open(args.record, "a") as stream:
+            play(args, view_plugin, InputRecorder(stream, _game_header(args)))
+    else:
+        play(args, view_plugin)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,162 @@
+import itertools
+import math
+import time
+from typing import Dict, Hashable, Tuple, TypeVar, Callable, Optional
+
+from tower_defense.core.entities import Entities
+from tower_defense.interfaces.snapshot import (
+    WorldSnapshot,
+    TowerSnapshot,
+    MonsterSnapshot,
+    EntitySnapshot,
+    Position,
+)
+
+S = TypeVar("S", EntitySnapshot, MonsterSnapshot, TowerSnapshot)
+
+
+class SnapshotBuilder:
+    """Copy the state of the entities into immutable snapshots
+
+    Each entity keeps the same identifier from one snapshot to the next, for as long
+    as it is in the game.
+    """
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+        self._ids: Dict[Hashable, int] = {}
+
+    def build(self, entities: Entities) -> WorldSnapshot:
+        previous_ids, counter = self._ids, self._counter
+        # Only the entities still in the game are kept, so that none is leaked
+        ids: Dict[Hashable, int] = {}
+
+        def get_id(entity: Hashable) -> int:
+            entity_id = previous_ids.get(entity)
+            if entity_id is None:
+                entity_id = next(counter)
+            ids[entity] = entity_id
+            return entity_id
+
+        towers = tuple(
+            TowerSnapshot(
+                get_id(tower),
+                tower.get_model_name(),
+                tower.get_position(),
+                tower.get_orientation(),
+                tower.get_level(),
+                block_position,
+                tower.get_name(),
+                tower.get_range(),
+                tower.get_upgrade_cost(),
+                tower.targeting_strategy,
+                tower.sticky_target,
+            )
+            for block_position, tower in entities.towers.items()
+        )
+        monsters = tuple(
+            MonsterSnapshot(
+                get_id(monster),
+                monster.get_model_name(),
+                monster.get_position(),
+                monster.get_orientation(),
+                monster.health_,
+                monster.get_max_health(),
+            )
+            for monster in sorted(
+                entities.monsters, key=lambda m: m.distance_travelled_
+            )
+        )
+        projectiles = [
+            EntitySnapshot(
+                get_id(projectile),
+                projectile.get_model_name(),
+                projectile.get_position(),
+                projectile.get_orientation(),
+            )
+            for projectile in entities.projectiles
+        ]
+        for flight in entities.flights:
+            if flight.get_target().is_dead():
+                continue
+            flight.materialize(entities.time)
+            # A flight is replaced when its target is aimed at again: the projectile
+            # identifies it
+            projectiles.append(
+                EntitySnapshot(
+                    get_id(flight.get_projectile()),
+                    flight.get_model_name(),
+                    flight.get_position(),
+                    flight.get_orientation(),
+                )
+            )
+        self._ids = ids
+        return WorldSnapshot(entities.time, towers, monsters, tuple(projectiles))
+
+
+def _interpolate_angle(start: float, end: float, alpha: float) -> float:
+    # Turn the shortest way round
+    difference = (end - start + math.pi) % (2 * math.pi) - math.pi
+    return start + alpha * difference
+
+
+def _interpolate_entities(
+    previous: Tuple[S, ...], current: Tuple[S, ...], alpha: float
+) -> Tuple[S, ...]:
+    previous_by_id = {entity.entity_id: entity for entity in previous}
+    entities = []
+    for entity in current:
+        start = previous_by_id.get(entity.entity_id)
+        if start is None:
+            entities.append(entity)
+            continue
+        (x, y), (end_x, end_y) = start.position, entity.position
+        position: Position = (x + alpha * (end_x - x), y + alpha * (end_y - y))
+        orientation = _interpolate_angle(start.orientation, entity.orientation, alpha)
+        entities.append(entity._replace(position=position, orientation=orientation))
+    return tuple(entities)
+
+
+def interpolate_snapshots(
+    previous: WorldSnapshot, current: WorldSnapshot, alpha: float
+) -> WorldSnapshot:
+    """Blend the positions and orientations of the entities of two snapshots
+
+    The entities are the ones of `current`: the new ones are where they spawned, and
+    the ones removed since `previous` are left out.
+
+    :param alpha: 0 for the state of `previous`, 1 for the state of `current`
+    """
+    return WorldSnapshot(
+        round(previous.time + alpha * (current.time - previous.time)),
+        _interpolate_entities(previous.towers, current.towers, alpha),
+        _interpolate_entities(previous.monsters, current.monsters, alpha),
+        _interpolate_entities(previous.projectiles, current.projectiles, alpha),
+    )
+
+
+class SnapshotInterpolator:
+    """Render the published snapshots smoothly, whatever the tick rate
+
+    The last two snapshots are kept, and rendered one tick late: the entities move
+    from their state in the previous snapshot to their state in the latest one, over
+    the time that separates them.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._previous: Optional[WorldSnapshot] = None
+        self._current: Optional[WorldSnapshot] = None
+        self._received_at = 0.0
+
+    def get_render_snapshot(self, latest: WorldSnapshot) -> WorldSnapshot:
+        now = self._clock()
+        if latest is not self._current:
+            self._previous, self._current = self._current, latest
+            self._received_at = now
+        previous = self._previous
+        if previous is None or latest.time <= previous.time:
+            return latest
+        duration = (latest.time - previous.time) / 1000
+        alpha = min((now - self._received_at) / duration, 1.0)
+        return interpolate_snapshots(previous, latest, alpha)
@@ -0,0 +1,58 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set
+
+# Called with the duration of each phase, in milliseconds
+StartupReporter = Callable[[Dict[str, float]], None]
+
+
+class StartupTimer:
+    """Durations of the phases of the startup, measured from any thread
+
+    The phases measured several times are summed up. Once all the expected phases
+    have been measured, the durations are reported, once.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._durations_ms: Dict[str, float] = {}
+        self._expected: Set[str] = set()
+        self._reporter: Optional[StartupReporter] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self._durations_ms[phase] = (
+                self._durations_ms.get(phase, 0.0) + seconds * 1000
+            )
+        self._report_if_complete()
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.add(phase, self._clock() - start)
+
+    def report_when_measured(
+        self, phases: Iterable[str], reporter: StartupReporter
+    ) -> None:
+        with self._lock:
+            self._expected = set(phases)
+            self._reporter = reporter
+        self._report_if_complete()
+
+    def _report_if_complete(self) -> None:
+        with self._lock:
+            reporter = self._reporter
+            if reporter is None or not self._expected <= self._durations_ms.keys():
+                return
+            self._reporter = None
+            durations_ms = dict(self._durations_ms)
+        reporter(durations_ms)
+
+
+# Shared by the game and the view plugins, which are loaded by name
+STARTUP_TIMER = StartupTimer()
@@ -0,0 +1,50 @@
+import math
+from collections import deque
+from typing import Deque, Dict, Sequence
+
+PERCENTILES: Sequence[int] = (50, 95, 99)
+
+
+class RingBuffer:
+    """The last `capacity` values of a series, older values being dropped"""
+
+    def __init__(self, capacity: int):
+        self._values: Deque[float] = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def append(self, value: float) -> None:
+        self._values.append(value)
+
+    def percentiles(self, percentiles: Sequence[int] = PERCENTILES) -> Dict[str, float]:
+        """Return the requested percentiles, using the nearest-rank method"""
+        values = sorted(self._values)
+        if not values:
+            return {}
+        return {
+            f"p{percentile}": values[
+                max(math.ceil(percentile / 100 * len(values)) - 1, 0)
+            ]
+            for percentile in percentiles
+        }
+
+
+class TickStats:
+    """Rolling series of measures, one value per tick"""
+
+    def __init__(self, capacity: int = 1000):
+        self._capacity = capacity
+        self._series: Dict[str, RingBuffer] = {}
+
+    def record(self, name: str, value: float) -> None:
+        try:
+            series = self._series[name]
+        except KeyError:
+            series = self._series[name] = RingBuffer(self._capacity)
+        series.append(value)
+
+    def summarize(self) -> Dict[str, Dict[str, float]]:
+        # Copied first, as the series may be summarized from another thread
+        series_items = list(self._series.items())
+        return {name: series.percentiles() for name, series in series_items}
@@ -1,17 +1,26 @@
-from typing import Optional, List, Tuple, Iterable
+import time
+from collections import deque
+from dataclasses import asdict
+from typing import Optional, List, Tuple, Iterable, Dict, Any, Deque
 
 from tower_defense.block import Block
 from tower_defense.core.entities import Entities
 from tower_defense.core.monster.monster import IMonster
 from tower_defense.core.tower.default import TOWER_MAPPING, TowerMapping
+from tower_defense.game_loop import LoopStats
 from tower_defense.grid import Grid
+from tower_defense.input_log import InputRecorder
 from tower_defense.interfaces.entity import IEntity
+from tower_defense.interfaces.snapshot import WorldSnapshot
+from tower_defense.interfaces.targeting_strategies import TargetingStrategy
 from tower_defense.interfaces.tower import ITower
 from tower_defense.interfaces.tower_defense_controller import (
     ITowerDefenseController,
 )
 from tower_defense.interfaces.tower_factory import ITowerFactory
 from tower_defense.interfaces.tower_view import ITowerView
+from tower_defense.snapshot import SnapshotBuilder
+from tower_defense.tick_stats import TickStats
 from tower_defense.wave_generator import WaveGenerator
 
 
@@ -22,6 +31,10 @@ class TowerDefenseController(ITowerDefenseController):
         wave_generator: WaveGenerator,
         entities: Entities,
         tower_mapping: Optional[TowerMapping] = None,
+        tick_stats: Optional[TickStats] = None,
+        input_recorder: Optional[InputRecorder] = None,
+        publish_snapshots: bool = False,
+        queue_commands: bool = False,
     ):
         self.grid = grid
         self.wave_generator = wave_generator
@@ -29,6 +42,41 @@ class TowerDefenseController(ITowerDefenseController):
             TOWER_MAPPING if tower_mapping is None else tower_mapping
         )
         self.entities: Entities = entities
+        # Measures taken at each tick, if not None
+        self.tick_stats: Optional[TickStats] = tick_stats
+        # Counters of the loop running the ticks in real time, if any
+        self.loop_stats: Optional[LoopStats] = None
+        # Log of the commands of the player, to replay the game, if not None
+        self.input_recorder: Optional[InputRecorder] = input_recorder
+        # Copy the state of the entities after each tick, for views in other threads
+        self.publish_snapshots = publish_snapshots
+        self._snapshot_builder = SnapshotBuilder()
+        self._snapshot: WorldSnapshot = self._snapshot_builder.build(entities)
+        # Apply the commands of the player before the next tick, instead of when they
+        # are issued, for views in other threads
+        self.queue_commands = queue_commands
+        # Appending and popping are atomic: the views append, the simulation pops
+        self._commands: Deque[Tuple[str, Tuple[Any, ...]]] = deque()
+
+    def _issue(self, name: str, *args: Any, queued_result: Any = None) -> Any:
+        """Apply a command now and return its result
+
+        If commands are queued, queue it instead, and return `queued_result`.
+        """
+        if self.queue_commands:
+            self._commands.append((name, args))
+            return queued_result
+        return self._apply(name, args)
+
+    def _apply(self, name: str, args: Tuple[Any, ...]) -> Any:
+        if self.input_recorder is not None:
+            self.input_recorder.record(self.entities.time, name, args)
+        return getattr(self, "_" + name)(*args)
+
+    def _apply_queued_commands(self) -> None:
+        commands = self._commands
+        while commands:
+            self._apply(*commands.popleft())
 
     def get_player_health(self) -> int:
         return self.entities.player.health
@@ -64,6 +112,10 @@ class TowerDefenseController(ITowerDefenseController):
         )
 
     def start_spawning_monsters(self) -> bool:
+        # Not started yet if queued
+        return self._issue("start_spawning_monsters", queued_result=False)
+
+    def _start_spawning_monsters(self) -> bool:
         if not self.can_start_spawning_monsters():
             return False
         self.wave_generator.start_spawning()
@@ -77,6 +129,14 @@ class TowerDefenseController(ITowerDefenseController):
 
     def try_build_tower(
         self, tower_view_name: str, world_position: Tuple[float, float]
+    ) -> bool:
+        # Not built yet if queued
+        return self._issue(
+            "try_build_tower", tower_view_name, world_position, queued_result=False
+        )
+
+    def _try_build_tower(
+        self, tower_view_name: str, world_position: Tuple[float, float]
     ) -> bool:
         tower_factory: ITowerFactory = self.tower_mapping[tower_view_name]
         block_position, block = self.get_block(world_position)
@@ -87,14 +147,86 @@ class TowerDefenseController(ITowerDefenseController):
         )
 
     def upgrade_tower(self, tower_position: Tuple[int, int]) -> None:
-        self.entities.upgrade_tower(tower_position)
+        self._issue("upgrade_tower", tower_position)
+
+    def _upgrade_tower(self, tower_position: Tuple[int, int]) -> None:
+        # The tower may have been sold by a command queued before
+        if tower_position in self.entities.towers:
+            self.entities.upgrade_tower(tower_position)
 
     def sell_tower(self, tower_position: Tuple[int, int]) -> None:
-        self.entities.towers.pop(tower_position, None)
+        self._issue("sell_tower", tower_position)
+
+    def _sell_tower(self, tower_position: Tuple[int, int]) -> None:
+        self.entities.sell_tower(tower_position)
+
+    def set_targeting_strategy(
+        self, tower_position: Tuple[int, int], targeting_strategy: TargetingStrategy
+    ) -> None:
+        self._issue("set_targeting_strategy", tower_position, targeting_strategy)
+
+    def _set_targeting_strategy(
+        self, tower_position: Tuple[int, int], targeting_strategy: TargetingStrategy
+    ) -> None:
+        tower = self.entities.towers.get(tower_position)
+        if tower is not None:
+            tower.targeting_strategy = targeting_strategy
+
+    def set_sticky_target(
+        self, tower_position: Tuple[int, int], sticky_target: bool
+    ) -> None:
+        self._issue("set_sticky_target", tower_position, sticky_target)
+
+    def _set_sticky_target(
+        self, tower_position: Tuple[int, int], sticky_target: bool
+    ) -> None:
+        tower = self.entities.towers.get(tower_position)
+        if tower is not None:
+            tower.sticky_target = sticky_target
 
     def update(self, timestep: int) -> None:
+        self._apply_queued_commands()
+        if self.tick_stats is not None:
+            self._update_with_stats(timestep, self.tick_stats)
+        else:
+            self._try_spawn_monster(timestep)
+            self.entities.update(timestep)
+        if self.publish_snapshots:
+            # Replacing the reference is atomic: readers see either snapshot, whole
+            self._snapshot = self._snapshot_builder.build(self.entities)
+
+    def _update_with_stats(self, timestep: int, tick_stats: TickStats) -> None:
+        clock = time.perf_counter
+        tick_start = clock()
         self._try_spawn_monster(timestep)
-        self.entities.update(timestep)
+        phase_start = clock()
+        tick_stats.record("wave_spawn_ms", (phase_start - tick_start) * 1000)
+
+        def record_phase(name: str) -> None:
+            nonlocal phase_start
+            phase_end = clock()
+            tick_stats.record(f"{name}_ms", (phase_end - phase_start) * 1000)
+            phase_start = phase_end
+
+        self.entities.update(timestep, record_phase)
+        tick_stats.record("tick_ms", (clock() - tick_start) * 1000)
+        tick_stats.record("monsters", len(self.entities.monsters))
+        tick_stats.record("projectiles", self.entities.count_projectiles())
+        tick_stats.record("towers", len(self.entities.towers))
+
+    def get_tick_stats(self) -> Dict[str, Dict[str, float]]:
+        if self.tick_stats is None:
+            return {}
+        tick_stats = self.tick_stats.summarize()
+        if self.loop_stats is not None:
+            tick_stats["game_loop"] = asdict(self.loop_stats)
+        return tick_stats
+
+    def get_snapshot(self) -> WorldSnapshot:
+        if not self.publish_snapshots:
+            # Nothing is published: the caller is the thread running the simulation
+            self._snapshot = self._snapshot_builder.build(self.entities)
+        return self._snapshot
 
     def iter_towers(self) -> Iterable[ITower]:
         return list(self.entities.towers.values())
@@ -103,4 +235,4 @@ class TowerDefenseController(ITowerDefenseController):
         return sorted(self.entities.monsters, key=lambda m: m.distance_travelled_)
 
     def iter_projectiles(self) -> Iterable[IEntity]:
-        return list(self.entities.projectiles)
+        return list(self.entities.iter_projectiles())
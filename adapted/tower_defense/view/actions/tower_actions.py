@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 
 from tower_defense.interfaces.targeting_strategies import TargetingStrategy
-from tower_defense.interfaces.tower import ITower
+from tower_defense.interfaces.snapshot import TowerSnapshot
 from tower_defense.view.actions.action import IAction
 from tower_defense.view.selection import Selection, InvalidSelectedTowerException
 
@@ -14,7 +14,7 @@ class TowerAction(IAction, ABC):
         self._selection = selection
 
     @abstractmethod
-    def _running(self, selected_tower: ITower) -> bool:
+    def _running(self, selected_tower: TowerSnapshot) -> bool:
         ...
 
     def running(self) -> bool:
@@ -25,7 +25,7 @@ class TowerAction(IAction, ABC):
         return self._running(selected_tower)
 
     @abstractmethod
-    def _start(self, selected_tower: ITower) -> None:
+    def _start(self, selected_tower: TowerSnapshot) -> None:
         ...
 
     def start(self) -> None:
@@ -45,26 +45,36 @@ class SetTargetingStrategyAction(TowerAction):
         super().__init__(selection)
         self.targeting_strategy = targeting_strategy
 
-    def _running(self, selected_tower: ITower) -> bool:
+    def _running(self, selected_tower: TowerSnapshot) -> bool:
         return selected_tower.targeting_strategy == self.targeting_strategy
 
-    def _start(self, selected_tower: ITower) -> None:
-        selected_tower.targeting_strategy = self.targeting_strategy
+    def _start(self, selected_tower: TowerSnapshot) -> None:
+        try:
+            self._selection.set_selected_tower_targeting_strategy(
+                self.targeting_strategy
+            )
+        except InvalidSelectedTowerException:
+            pass
 
 
 class ToggleStickyTargetAction(TowerAction):
-    def _running(self, selected_tower: ITower) -> bool:
+    def _running(self, selected_tower: TowerSnapshot) -> bool:
         return selected_tower.sticky_target
 
-    def _start(self, selected_tower: ITower) -> None:
-        selected_tower.sticky_target = not selected_tower.sticky_target
+    def _start(self, selected_tower: TowerSnapshot) -> None:
+        try:
+            self._selection.set_selected_tower_sticky_target(
+                not selected_tower.sticky_target
+            )
+        except InvalidSelectedTowerException:
+            pass
 
 
 class SellAction(TowerAction):
-    def _running(self, selected_tower: ITower) -> bool:
+    def _running(self, selected_tower: TowerSnapshot) -> bool:
         return False
 
-    def _start(self, selected_tower: ITower) -> None:
+    def _start(self, selected_tower: TowerSnapshot) -> None:
         try:
             self._selection.sell_selected_tower()
         except InvalidSelectedTowerException:
@@ -72,10 +82,10 @@ class SellAction(TowerAction):
 
 
 class UpgradeAction(TowerAction):
-    def _running(self, selected_tower: ITower) -> bool:
+    def _running(self, selected_tower: TowerSnapshot) -> bool:
         return False
 
-    def _start(self, selected_tower: ITower) -> None:
+    def _start(self, selected_tower: TowerSnapshot) -> None:
         try:
             self._selection.upgrade_selected_tower()
         except InvalidSelectedTowerException:
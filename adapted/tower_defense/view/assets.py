@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from PIL import Image
+
+
+def build_manifest(root: str = "images") -> List[str]:
+    """List the sprites of the game: every PNG image under `root`"""
+    return sorted(path.as_posix() for path in Path(root).rglob("*.png"))
+
+
+def _decode(path: str) -> Image.Image:
+    with Image.open(path) as image:
+        image.load()
+    return image
+
+
+class AssetRegistry:
+    """Decoded images, shared by all the components of the view"""
+
+    def __init__(self) -> None:
+        self._images: Dict[str, Image.Image] = {}
+
+    def preload(self, paths: Iterable[str], max_workers: Optional[int] = None) -> None:
+        """Decode the images in a pool of threads, before they are first displayed"""
+        paths = list(paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Pillow releases the GIL while inflating the images
+            self._images.update(zip(paths, executor.map(_decode, paths)))
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def get_image(self, path: str) -> Image.Image:
+        try:
+            return self._images[path]
+        except KeyError:
+            # Missing from the manifest: decoded on first use
+            image = self._images[path] = _decode(path)
+            return image
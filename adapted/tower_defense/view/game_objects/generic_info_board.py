@@ -14,11 +14,12 @@ class GenericInfoBoard(GameObject):
         self,
         canvas: tk.Canvas,
         selection: Selection,
+        image_cache: ImageCache,
     ):
         self.canvas: tk.Canvas = canvas
         self.tower_image: Optional[ImageTk.PhotoImage] = None
         self.selection = selection
-        self.image_cache = ImageCache()
+        self.image_cache = image_cache
 
     def refresh(self) -> None:
         try:
@@ -30,5 +31,5 @@ class GenericInfoBoard(GameObject):
         self.canvas.create_text(80, 75, text=text)
 
         image_path = f"images/towerImages/{tower_view.get_model_name()}/1.png"
-        self.tower_image = ImageTk.PhotoImage(self.image_cache.get_image(image_path))
+        self.tower_image = self.image_cache.get_tk_image(image_path)
         self.canvas.create_image(5, 5, image=self.tower_image, anchor=tk.NW)
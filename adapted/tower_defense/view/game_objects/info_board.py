@@ -1,18 +1,19 @@
 import tkinter as tk
 from typing import List
 
-from PIL import ImageTk, Image
-
 from tower_defense.view.game_objects.game_object import GameObject
 from tower_defense.view.game_objects.generic_info_board import GenericInfoBoard
 from tower_defense.view.mouse import Mouse
 from tower_defense.view.selection import Selection
 from tower_defense.view.game_objects.specific_info_board import SpecificInfoBoard
+from tower_defense.view.image_cache import ImageCache
 
 
 class InfoBoard(GameObject):
-    def __init__(self, master_frame: tk.Frame, selection: Selection):
-        self.info_board_image = ImageTk.PhotoImage(Image.open("images/infoBoard.png"))
+    def __init__(
+        self, master_frame: tk.Frame, selection: Selection, image_cache: ImageCache
+    ):
+        self.info_board_image = image_cache.get_tk_image("images/infoBoard.png")
         self.canvas = tk.Canvas(
             master=master_frame,
             width=self.info_board_image.width(),
@@ -23,8 +24,8 @@ class InfoBoard(GameObject):
         mouse.bind_listeners(self.canvas)
         self.canvas.grid(row=0, column=1, sticky="NW")
         self.game_objects: List[GameObject] = [
-            GenericInfoBoard(self.canvas, selection),
-            SpecificInfoBoard(self.canvas, selection, mouse),
+            GenericInfoBoard(self.canvas, selection, image_cache),
+            SpecificInfoBoard(self.canvas, selection, mouse, image_cache),
         ]
 
     def refresh(self) -> None:
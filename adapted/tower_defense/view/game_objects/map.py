@@ -1,15 +1,19 @@
-import math
 import tkinter as tk
-from typing import Tuple, List
+from abc import ABC, abstractmethod
+from typing import Tuple, List, Dict, Set
 
-from PIL import ImageTk, Image
+from PIL import ImageTk
 
 from tower_defense.block import Block
 from tower_defense.interfaces.tower_defense_controller import (
     ITowerDefenseController,
 )
-from tower_defense.interfaces.entity import IEntity
-from tower_defense.interfaces.monster_view import IMonsterView
+from tower_defense.interfaces.snapshot import (
+    WorldSnapshot,
+    MonsterSnapshot,
+    Position,
+)
+from tower_defense.snapshot import SnapshotInterpolator
 from tower_defense.view.game_objects.game_object import GameObject
 from tower_defense.view.image_cache import ImageCache
 from tower_defense.view.mouse import Mouse
@@ -17,82 +21,198 @@ from tower_defense.view.position_converter import PositionConverter
 from tower_defense.view.selection import Selection, InvalidSelectedTowerException
 
 
-class EntityDisplayer(GameObject):
+# Stacking order of the canvas items drawn over the background, from bottom to top
+_LAYERS = ("tower", "monster", "projectile", "range", "cursor")
+
+
+class EntityDisplayer(ABC):
+    """Keep one set of canvas items per entity, from its spawn to its death
+
+    Creating and deleting canvas items is what costs the most to Tk: the items of
+    the entities still in the game are only moved, or given another image.
+    """
+
+    layer: str
+
     def __init__(
         self,
         canvas: tk.Canvas,
-        controller: ITowerDefenseController,
         position_converter: PositionConverter,
+        image_cache: ImageCache,
     ):
         self.canvas = canvas
-        self.controller = controller
         self.position_converter = position_converter
-        self.image_cache = ImageCache()
+        self.image_cache = image_cache
+        self._image_items: Dict[int, int] = {}
+        self._pixels: Dict[int, Tuple[int, int]] = {}
+        # Storing a reference to the displayed images so that the reference counter does not remove them before Tkinter uses them
+        self._tk_images: Dict[int, ImageTk.PhotoImage] = {}
+        self._painted: Set[int] = set()
+        self._created = False
 
-    def _paint_entity(self, entity: IEntity, image_path: str):
-        x, y = self.position_converter.position_to_pixel(entity.get_position())
-        angle = entity.get_orientation()
-        image = self.image_cache.get_image(image_path)
-        if angle:
-            image = image.rotate(math.degrees(angle))
-        tk_image = ImageTk.PhotoImage(image)
-        # Storing a reference to tk_image so that the reference counter does not remove it before Tkinter uses it
-        self.image_cache.add_reference(tk_image)
-        self.canvas.create_image(x, y, image=tk_image, anchor=tk.CENTER)
-
-    def _refresh(self) -> None:
+    def _get_tag(self, entity_id: int) -> str:
+        return f"{self.layer}{entity_id}"
+
+    def _paint_entity(
+        self, entity_id: int, position: Position, angle: float, image_path: str
+    ) -> Tuple[int, int]:
+        pixel = self.position_converter.position_to_pixel(position)
+        tk_image = self.image_cache.get_tk_image(image_path, angle)
+        self._painted.add(entity_id)
+        item = self._image_items.get(entity_id)
+        if item is None:
+            self._image_items[entity_id] = self.canvas.create_image(
+                *pixel,
+                image=tk_image,
+                anchor=tk.CENTER,
+                tags=(self.layer, self._get_tag(entity_id)),
+            )
+            self._tk_images[entity_id] = tk_image
+            self._pixels[entity_id] = pixel
+            self._created = True
+            return pixel
+        if self._pixels[entity_id] != pixel:
+            self.canvas.coords(item, *pixel)
+            self._pixels[entity_id] = pixel
+        if self._tk_images[entity_id] is not tk_image:
+            self.canvas.itemconfigure(item, image=tk_image)
+            self._tk_images[entity_id] = tk_image
+        return pixel
+
+    def _forget(self, entity_id: int) -> None:
+        self.canvas.delete(self._get_tag(entity_id))
+        del self._image_items[entity_id]
+        del self._pixels[entity_id]
+        del self._tk_images[entity_id]
+
+    @abstractmethod
+    def _refresh(self, snapshot: WorldSnapshot) -> None:
         ...
 
-    def refresh(self) -> None:
-        self.image_cache.clear_references()
-        self._refresh()
+    def refresh(self, snapshot: WorldSnapshot) -> bool:
+        """Update the items of the entities, and tell whether some were created"""
+        self._painted = set()
+        self._created = False
+        self._refresh(snapshot)
+        for entity_id in self._image_items.keys() - self._painted:
+            self._forget(entity_id)
+        return self._created
 
 
 class MonsterDisplayer(EntityDisplayer):
-    def _paint_health(self, monster: IMonsterView):
-        x, y = self.position_converter.position_to_pixel(monster.get_position())
-        image_path = f"images/monsterImages/{monster.get_model_name()}.png"
+    layer = "monster"
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        position_converter: PositionConverter,
+        image_cache: ImageCache,
+    ):
+        super().__init__(canvas, position_converter, image_cache)
+        self._health_items: Dict[int, Tuple[int, int]] = {}
+        self._health_bars: Dict[int, Tuple[Tuple[int, int], int]] = {}
+        # Identifiers of the monsters, in the order they are stacked in
+        self._order: List[int] = []
+        self._restacked = False
+
+    def _paint_health(self, monster: MonsterSnapshot, pixel: Tuple[int, int]):
+        x, y = pixel
+        image_path = f"images/monsterImages/{monster.model_name}.png"
         image = self.image_cache.get_image(image_path)
         scale = image.width // 2
-        self.canvas.create_rectangle(
+        health_bar = (pixel, monster.health)
+        items = self._health_items.get(monster.entity_id)
+        if items is not None and self._health_bars[monster.entity_id] == health_bar:
+            return
+        background_coords = (
             x - scale,
             y - 3 * scale / 2,
             x + scale - 1,
             y - scale - 1,
-            fill="red",
-            outline="black",
         )
-        self.canvas.create_rectangle(
+        health_coords = (
             x - scale + 1,
             y - 3 * scale / 2 + 1,
-            x - scale + (scale * 2 - 2) * monster.health_ / monster.get_max_health(),
+            x - scale + (scale * 2 - 2) * monster.health / monster.max_health,
             y - scale - 2,
-            fill="green",
-            outline="green",
         )
+        self._health_bars[monster.entity_id] = health_bar
+        if items is None:
+            tags = (self.layer, self._get_tag(monster.entity_id))
+            self._health_items[monster.entity_id] = (
+                self.canvas.create_rectangle(
+                    *background_coords, fill="red", outline="black", tags=tags
+                ),
+                self.canvas.create_rectangle(
+                    *health_coords, fill="green", outline="green", tags=tags
+                ),
+            )
+            return
+        background_item, health_item = items
+        self.canvas.coords(background_item, *background_coords)
+        self.canvas.coords(health_item, *health_coords)
+
+    def _forget(self, entity_id: int) -> None:
+        super()._forget(entity_id)
+        del self._health_items[entity_id]
+        del self._health_bars[entity_id]
+
+    def _restack(self, order: List[int]) -> None:
+        """Stack the monsters in the order of the snapshot, the furthest on top"""
+        kept = [entity_id for entity_id in self._order if entity_id in self._painted]
+        new_count = len(order) - len(kept)
+        if order[new_count:] == kept:
+            # Only new monsters, at the entrance of the path: they go under the others
+            if kept:
+                for entity_id in order[:new_count]:
+                    self.canvas.tag_lower(
+                        self._get_tag(entity_id), self._get_tag(kept[0])
+                    )
+        else:
+            for entity_id in order:
+                self.canvas.tag_raise(self._get_tag(entity_id))
+            self._restacked = True
+        self._order = order
+
+    def _refresh(self, snapshot: WorldSnapshot):
+        self._restacked = False
+        for monster in snapshot.monsters:
+            image_path = f"images/monsterImages/{monster.model_name}.png"
+            pixel = self._paint_entity(
+                monster.entity_id, monster.position, monster.orientation, image_path
+            )
+            self._paint_health(monster, pixel)
+        order = [monster.entity_id for monster in snapshot.monsters]
+        if order != self._order:
+            self._restack(order)
 
-    def _refresh(self):
-        for monster in self.controller.iter_monsters():
-            image_path = f"images/monsterImages/{monster.get_model_name()}.png"
-            self._paint_entity(monster, image_path)
-            self._paint_health(monster)
+    def refresh(self, snapshot: WorldSnapshot) -> bool:
+        return super().refresh(snapshot) or self._restacked
 
 
 class TowerDisplayer(EntityDisplayer):
-    def _refresh(self):
-        for tower in self.controller.iter_towers():
-            level: int = tower.get_level()
-            image_path: str = f"images/towerImages/{tower.get_model_name()}/{level}.png"
-            self._paint_entity(tower, image_path)
+    layer = "tower"
+
+    def _refresh(self, snapshot: WorldSnapshot):
+        for tower in snapshot.towers:
+            image_path: str = f"images/towerImages/{tower.model_name}/{tower.level}.png"
+            self._paint_entity(
+                tower.entity_id, tower.position, tower.orientation, image_path
+            )
 
 
 class ProjectileDisplayer(EntityDisplayer):
-    def _refresh(self):
-        for projectile in self.controller.iter_projectiles():
-            image_path: str = (
-                f"images/projectileImages/{projectile.get_model_name()}.png"
+    layer = "projectile"
+
+    def _refresh(self, snapshot: WorldSnapshot):
+        for projectile in snapshot.projectiles:
+            image_path: str = f"images/projectileImages/{projectile.model_name}.png"
+            self._paint_entity(
+                projectile.entity_id,
+                projectile.position,
+                projectile.orientation,
+                image_path,
             )
-            self._paint_entity(projectile, image_path)
 
 
 class RangeDisplayer(GameObject):
@@ -105,29 +225,34 @@ class RangeDisplayer(GameObject):
         self.position_converter = position_converter
         self.canvas = canvas
         self.selection = selection
+        self._item = self.canvas.create_oval(
+            0, 0, 0, 0, outline="white", state=tk.HIDDEN, tags=("range",)
+        )
 
     def refresh(self) -> None:
         try:
             tower_position, tower = self.selection.get_selected_tower()
         except InvalidSelectedTowerException:
+            self.canvas.itemconfigure(self._item, state=tk.HIDDEN)
             return
         x, y = self.position_converter.position_to_pixel(tower_position)
         # In the original version, the radius of the circle is 0.5 units smaller than the actual range
         error = 0.5
-        tower_range = tower.get_range() - error
+        tower_range = tower.range - error
         (
             horizontal_radius,
             vertical_radius,
         ) = self.position_converter.world_vector_to_screen_vector(
             (tower_range, tower_range)
         )
-        self.canvas.create_oval(
+        self.canvas.coords(
+            self._item,
             x - horizontal_radius,
             y - vertical_radius,
             x + horizontal_radius,
             y + vertical_radius,
-            outline="white",
         )
+        self.canvas.itemconfigure(self._item, state=tk.NORMAL)
 
 
 class MouseCursor(GameObject):
@@ -137,22 +262,29 @@ class MouseCursor(GameObject):
         controller: ITowerDefenseController,
         position_converter: PositionConverter,
         selection: Selection,
+        image_cache: ImageCache,
     ):
         self.canvas = canvas
         self.position_converter = position_converter
         self.controller = controller
-        self.pressed_image = ImageTk.PhotoImage(
-            Image.open("images/mouseImages/Pressed.png")
-        )
-        self.can_press_image = ImageTk.PhotoImage(
-            Image.open("images/mouseImages/HoveringCanPress.png")
+        self.pressed_image = image_cache.get_tk_image("images/mouseImages/Pressed.png")
+        self.can_press_image = image_cache.get_tk_image(
+            "images/mouseImages/HoveringCanPress.png"
         )
-        self.cannot_press_image = ImageTk.PhotoImage(
-            Image.open("images/mouseImages/HoveringCanNotPress.png")
+        self.cannot_press_image = image_cache.get_tk_image(
+            "images/mouseImages/HoveringCanNotPress.png"
         )
         self.selection = selection
         self._mouse = Mouse()
         self._mouse.bind_listeners(self.canvas)
+        self._item = self.canvas.create_image(
+            0,
+            0,
+            image=self.cannot_press_image,
+            anchor=tk.CENTER,
+            state=tk.HIDDEN,
+            tags=("cursor",),
+        )
 
     def _get_cursor_image(self, block: Block) -> ImageTk.PhotoImage:
         if block.is_constructible:
@@ -163,15 +295,12 @@ class MouseCursor(GameObject):
         block_position, block = self.controller.get_block(world_position)
         block_col, block_row = self.position_converter.position_to_pixel(block_position)
         image: ImageTk.PhotoImage = self._get_cursor_image(block)
-        self.canvas.create_image(
-            block_col,
-            block_row,
-            image=image,
-            anchor=tk.CENTER,
-        )
+        self.canvas.coords(self._item, block_col, block_row)
+        self.canvas.itemconfigure(self._item, image=image, state=tk.NORMAL)
 
     def refresh(self) -> None:
         if self._mouse.position is None:
+            self.canvas.itemconfigure(self._item, state=tk.HIDDEN)
             return
         world_position: Tuple[float, float] = self.position_converter.pixel_to_position(
             self._mouse.position
@@ -195,10 +324,11 @@ class BackgroundDisplayer(GameObject):
             highlightthickness=0,
         )
         self.canvas.grid(row=0, column=0, rowspan=2, columnspan=1)
+        # Created first, the background stays under all the other items
+        self.canvas.create_image(0, 0, image=self._image, anchor=tk.NW)
 
     def refresh(self) -> None:
-        self.canvas.delete(tk.ALL)
-        self.canvas.create_image(0, 0, image=self._image, anchor=tk.NW)
+        pass
 
 
 class Map(GameObject):
@@ -209,17 +339,35 @@ class Map(GameObject):
         position_converter: PositionConverter,
         image: ImageTk.PhotoImage,
         selection: Selection,
+        image_cache: ImageCache,
     ):
-        background_displayer = BackgroundDisplayer(master_frame, image)
-        canvas = background_displayer.canvas
+        self.controller = controller
+        self.background_displayer = BackgroundDisplayer(master_frame, image)
+        self.canvas = canvas = self.background_displayer.canvas
+        self.entity_displayers: List[EntityDisplayer] = [
+            TowerDisplayer(canvas, position_converter, image_cache),
+            MonsterDisplayer(canvas, position_converter, image_cache),
+            ProjectileDisplayer(canvas, position_converter, image_cache),
+        ]
         self.game_objects: List[GameObject] = [
-            background_displayer,
-            TowerDisplayer(canvas, controller, position_converter),
-            MonsterDisplayer(canvas, controller, position_converter),
-            ProjectileDisplayer(canvas, controller, position_converter),
             RangeDisplayer(canvas, position_converter, selection),
-            MouseCursor(canvas, controller, position_converter, selection),
+            MouseCursor(canvas, controller, position_converter, selection, image_cache),
         ]
+        self._interpolator = SnapshotInterpolator()
+
+    def render(self) -> None:
+        """Draw the entities, possibly several times per tick"""
+        # A single snapshot per frame, so that all the entities are from the same tick
+        snapshot = self._interpolator.get_render_snapshot(
+            self.controller.get_snapshot()
+        )
+        restack = False
+        for entity_displayer in self.entity_displayers:
+            restack = entity_displayer.refresh(snapshot) or restack
+        if restack:
+            # New items are created on top of all the others
+            for layer in _LAYERS:
+                self.canvas.tag_raise(layer)
 
     def refresh(self) -> None:
         for game_object in self.game_objects:
@@ -23,11 +23,13 @@ from tower_defense.view.actions.tower_actions import (
 
 
 class TowerInfo(GameObject):
-    def __init__(self, canvas: tk.Canvas, selection: Selection) -> None:
+    def __init__(
+        self, canvas: tk.Canvas, selection: Selection, image_cache: ImageCache
+    ) -> None:
         self.canvas = canvas
         self.selection = selection
         self.tower_image: Optional[ImageTk.PhotoImage] = None
-        self.image_cache = ImageCache()
+        self.image_cache = image_cache
 
     def paint(self) -> None:
         try:
@@ -35,13 +37,11 @@ class TowerInfo(GameObject):
         except InvalidSelectedTowerException:
             return
 
-        self.canvas.create_text(
-            80, 75, text=selected_tower.get_name(), font=("times", 20)
-        )
+        self.canvas.create_text(80, 75, text=selected_tower.name, font=("times", 20))
 
-        model_name = selected_tower.get_model_name()
-        image_path = f"images/towerImages/{model_name}/{selected_tower.get_level()}.png"
-        self.tower_image = ImageTk.PhotoImage(self.image_cache.get_image(image_path))
+        model_name = selected_tower.model_name
+        image_path = f"images/towerImages/{model_name}/{selected_tower.level}.png"
+        self.tower_image = self.image_cache.get_tk_image(image_path)
         self.canvas.create_image(5, 5, image=self.tower_image, anchor=tk.NW)
 
 
@@ -68,7 +68,7 @@ class UpgradeButton(GameObject):
             _, selected_tower = self.selection.get_selected_tower()
         except InvalidSelectedTowerException:
             return
-        upgrade_cost = selected_tower.get_upgrade_cost()
+        upgrade_cost = selected_tower.upgrade_cost
         if upgrade_cost is not None:
             self.canvas.create_text(
                 120,
@@ -161,6 +161,7 @@ class SpecificInfoBoard(GameObject):
         canvas: tk.Canvas,
         selection: Selection,
         mouse: Mouse,
+        image_cache: ImageCache,
     ):
         self.selection = selection
         self.game_objects: List[GameObject] = [
@@ -206,7 +207,7 @@ class SpecificInfoBoard(GameObject):
                 ToggleStickyTargetAction(self.selection),
                 mouse,
             ),
-            TowerInfo(canvas, selection),
+            TowerInfo(canvas, selection, image_cache),
             UpgradeButton(canvas, selection, mouse),
             SellButton(canvas, selection, mouse),
         ]
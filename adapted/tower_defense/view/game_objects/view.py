@@ -6,11 +6,14 @@ from PIL import ImageTk
 from tower_defense.interfaces.tower_defense_controller import (
     ITowerDefenseController,
 )
+from tower_defense.startup import STARTUP_TIMER
+from tower_defense.view.assets import AssetRegistry, build_manifest
 from tower_defense.view.game_objects.display_board import DisplayBoard
 from tower_defense.view.game_objects.game_object import GameObject
 from tower_defense.view.game_objects.info_board import InfoBoard
 from tower_defense.view.game_objects.map import Map
-from tower_defense.view.map_generator import MapGenerator
+from tower_defense.view.image_cache import ImageCache
+from tower_defense.view.map_generator import MapGenerator, default_cache_dir
 from tower_defense.view.position_converter import PositionConverter
 from tower_defense.view.selection import Selection
 from tower_defense.view.tower_box import TowerBox
@@ -22,24 +25,40 @@ class View(GameObject):
         controller: ITowerDefenseController,
         title: str = "Tower Defense Ultra Mode",
         timestep: int = 50,
+        frame_interval: int = 16,
     ):
+        """
+        :param timestep: the interval between two refreshes of the boards and two
+            readings of the mouse, in milliseconds
+        :param frame_interval: the interval between two renderings of the entities,
+            in milliseconds
+        """
         self.root = tk.Tk()
         self.root.title(title)
         self.timestep = timestep
+        self.frame_interval = frame_interval
         self.frame = tk.Frame(master=self.root)
         self.frame.grid(row=0, column=0)
         self.controller = controller
         selection = Selection(controller)
-        self.info_board = InfoBoard(self.frame, selection)
+        # Every sprite is decoded before the first frame, and shared by all the boards
+        with STARTUP_TIMER.measure("asset_load"):
+            registry = AssetRegistry()
+            registry.preload(build_manifest())
+            map_generator = MapGenerator(
+                controller, default_cache_dir(), registry.get_image
+            )
+            image = ImageTk.PhotoImage(map_generator.get_background())
+        image_cache = ImageCache(registry)
+        self.info_board = InfoBoard(self.frame, selection, image_cache)
         self.tower_box = TowerBox(self.frame, selection)
-        map_generator = MapGenerator(controller)
-        image = ImageTk.PhotoImage(map_generator.get_background())
         self.map_object = Map(
             controller,
             self.frame,
             PositionConverter(map_generator.get_block_shape()),
             image,
             selection,
+            image_cache,
         )
         self.display_board = DisplayBoard(controller, self.frame)
         self.game_objects: List[GameObject] = [
@@ -54,8 +73,14 @@ class View(GameObject):
 
     def start(self) -> None:
         self._run()
+        self._render()
         self.root.mainloop()
 
     def _run(self) -> None:
         self.root.after(self.timestep, self._run)
         self.refresh()
+
+    def _render(self) -> None:
+        # Entities are interpolated between ticks: they can be drawn more often
+        self.root.after(self.frame_interval, self._render)
+        self.map_object.render()
@@ -1,27 +1,70 @@
-from typing import Dict, List
+import math
+from collections import OrderedDict
+from typing import Tuple, Callable, Optional
 
 from PIL import ImageTk, Image
 
+from tower_defense.view.assets import AssetRegistry
+
+# Key of a ready-made image: path of the sprite, and index of its rotation step
+_TkImageKey = Tuple[str, int]
+
 
 class ImageCache:
-    def __init__(self):
-        # The image_cache limits disk accesses at runtime
-        self._images_cache: Dict[str, Image.Image] = {}
-        # The next attribute's goal is to keep a reference to the images in the object,
-        # as the Python reference counter removes it before Tkinter has a chance to display it
-        # Must be emptied each turn to avoid memory leak
-        self._image_references: List[ImageTk.PhotoImage] = []
+    def __init__(
+        self,
+        registry: Optional[AssetRegistry] = None,
+        angle_step: float = 2.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        tk_image_factory: Callable[[Image.Image], ImageTk.PhotoImage] = (
+            ImageTk.PhotoImage
+        ),
+    ):
+        """
+        :param registry: the source images, a new registry if None
+        :param angle_step: the rotations of the sprites are rounded to multiples of
+            this angle, in degrees
+        :param max_bytes: the memory budget of the ready-made Tk images, in bytes
+        """
+        self.registry = AssetRegistry() if registry is None else registry
+        self._angle_step = angle_step
+        self._max_bytes = max_bytes
+        self._tk_image_factory = tk_image_factory
+        # Least recently used first
+        self._tk_images: OrderedDict[
+            _TkImageKey, Tuple[ImageTk.PhotoImage, int]
+        ] = OrderedDict()
+        self.tk_images_bytes = 0
 
     def get_image(self, path: str) -> Image.Image:
-        try:
-            return self._images_cache[path]
-        except KeyError:
-            image = Image.open(path)
-            self._images_cache[path] = image
-            return image
+        return self.registry.get_image(path)
 
-    def add_reference(self, image: ImageTk.PhotoImage) -> None:
-        self._image_references.append(image)
+    def get_tk_image(self, path: str, angle: float = 0.0) -> ImageTk.PhotoImage:
+        """Return the sprite at `path`, rotated by `angle` radians, ready for Tk
 
-    def clear_references(self) -> None:
-        self._image_references = []
+        The displayed images must be referenced elsewhere too: an image evicted from
+        the cache is deleted as soon as nothing references it anymore.
+        """
+        step = round(math.degrees(angle) / self._angle_step) % round(
+            360 / self._angle_step
+        )
+        key = (path, step)
+        try:
+            tk_image, _ = self._tk_images[key]
+        except KeyError:
+            pass
+        else:
+            self._tk_images.move_to_end(key)
+            return tk_image
+        image = self.get_image(path)
+        if step:
+            image = image.rotate(step * self._angle_step)
+        tk_image = self._tk_image_factory(image)
+        # Tk stores 4 bytes per pixel
+        size = 4 * image.width * image.height
+        self._tk_images[key] = tk_image, size
+        self.tk_images_bytes += size
+        while self.tk_images_bytes > self._max_bytes and len(self._tk_images) > 1:
+            _, (_, evicted_size) = self._tk_images.popitem(last=False)
+            self.tk_images_bytes -= evicted_size
+        return tk_image
@@ -1,4 +1,7 @@
-from typing import Tuple, Dict, Iterable, Iterator
+import hashlib
+import os
+from pathlib import Path
+from typing import Tuple, Dict, Iterable, Iterator, Optional, Callable
 
 from PIL import Image
 
@@ -41,24 +44,60 @@ def _paint_background(
     return drawn_map
 
 
-def _load_block_images() -> BlockImages:
+def _get_block_image_path(block_name: str) -> str:
+    return f"images/blockImages/{block_name}.png"
+
+
+def _load_block_images(load_image: Callable[[str], Image.Image]) -> BlockImages:
     return {
-        block: Image.open(f"images/blockImages/{block_name}.png")
+        block: load_image(_get_block_image_path(block_name))
         for block, block_name in MAPPING.items()
     }
 
 
+def default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "tower_defense" / "backgrounds"
+
+
+def _hash_background(block_manager: IBlockManager) -> str:
+    """Hash everything the background is painted from: the blocks and their images"""
+    digest = hashlib.sha256()
+    for block_name in MAPPING.values():
+        with open(_get_block_image_path(block_name), "rb") as image_file:
+            digest.update(hashlib.sha256(image_file.read()).digest())
+    digest.update(repr(block_manager.map_shape()).encode())
+    block_names = list(MAPPING.values())
+    digest.update(
+        bytes(
+            block_names.index(MAPPING[block])
+            for _, block in block_manager.iter_blocks()
+        )
+    )
+    return digest.hexdigest()
+
+
 class MapGenerator:
-    def __init__(self, block_manager: IBlockManager):
+    def __init__(
+        self,
+        block_manager: IBlockManager,
+        cache_dir: Optional[Path] = None,
+        load_image: Callable[[str], Image.Image] = Image.open,
+    ):
+        """
+        :param cache_dir: the folder where to keep the backgrounds once painted, not
+            cached if None
+        :param load_image: the source of the block images, given their path
+        """
         self.block_manager = block_manager
-        block_images = _load_block_images()
-        self.block_shape = _compute_block_size(iter(block_images.values()))
-        self.block_images = _load_block_images()
+        self.block_images = _load_block_images(load_image)
+        self.block_shape = _compute_block_size(iter(self.block_images.values()))
+        self.cache_dir = cache_dir
 
     def get_block_shape(self) -> Tuple[int, int]:
         return self.block_shape
 
-    def get_background(self) -> Image.Image:
+    def _paint_background(self) -> Image.Image:
         map_width, map_height = self.block_manager.map_shape()
         image_width, image_height = (
             map_width * self.block_shape[0],
@@ -69,3 +108,26 @@ class MapGenerator:
             self.block_images,
             (image_width, image_height),
         )
+
+    def get_background(self) -> Image.Image:
+        if self.cache_dir is None:
+            return self._paint_background()
+        # Named after what it is painted from: a stale background is never found
+        cache_path = self.cache_dir / f"{_hash_background(self.block_manager)}.png"
+        try:
+            with Image.open(cache_path) as cached_background:
+                cached_background.load()
+                return cached_background
+        except (OSError, SyntaxError):
+            # Missing, or corrupted: it is painted again
+            pass
+        background = self._paint_background()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Written aside then renamed, so that a partial file is never read
+            temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            background.save(temporary_path, format="PNG", compress_level=1)
+            os.replace(temporary_path, cache_path)
+        except OSError:
+            pass
+        return background
@@ -3,7 +3,8 @@ from typing import Tuple, Optional, List
 from tower_defense.interfaces.tower_defense_controller import (
     ITowerDefenseController,
 )
-from tower_defense.interfaces.tower import ITower
+from tower_defense.interfaces.targeting_strategies import TargetingStrategy
+from tower_defense.interfaces.snapshot import TowerSnapshot
 from tower_defense.interfaces.tower_view import ITowerView
 
 
@@ -30,7 +31,7 @@ class Selection:
         if self._tower_view_name is not None:
             return
         block_position, _ = self._controller.get_block(world_position)
-        if self._controller.get_tower(block_position) is None:
+        if self._controller.get_snapshot().get_tower(block_position) is None:
             return
         self._tower_position = block_position
         self._tower_view_name = None
@@ -41,9 +42,10 @@ class Selection:
         else:
             self._select_tower(world_position)
 
-    def get_selected_tower(self) -> Tuple[Tuple[int, int], ITower]:
+    def get_selected_tower(self) -> Tuple[Tuple[int, int], TowerSnapshot]:
         if self._tower_position is not None:
-            tower = self._controller.get_tower(self._tower_position)
+            # Read from the snapshot, as the towers are updated in another thread
+            tower = self._controller.get_snapshot().get_tower(self._tower_position)
             if tower is not None:
                 return self._tower_position, tower
         raise InvalidSelectedTowerException()
@@ -77,3 +79,15 @@ class Selection:
 
     def upgrade_selected_tower(self) -> None:
         self._controller.upgrade_tower(self.get_selected_tower_position())
+
+    def set_selected_tower_targeting_strategy(
+        self, targeting_strategy: TargetingStrategy
+    ) -> None:
+        self._controller.set_targeting_strategy(
+            self.get_selected_tower_position(), targeting_strategy
+        )
+
+    def set_selected_tower_sticky_target(self, sticky_target: bool) -> None:
+        self._controller.set_sticky_target(
+            self.get_selected_tower_position(), sticky_target
+        )
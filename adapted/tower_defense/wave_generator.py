@@ -1,7 +1,5 @@
 from typing import List, NamedTuple, Optional
 
-from tower_defense.core.count_down import CountDown
-
 TICK_DURATION_SECONDS = 0.05
 
 
@@ -15,7 +13,9 @@ class WaveGenerator:
         self.waves = waves
         self.current_wave_index = 0
         self.current_monster_index = 0
-        self.countdown = CountDown()
+        # Time spent spawning monsters, in milliseconds, and due time of the next spawn
+        self.spawning_time = 0
+        self.next_spawn_time = 0
         self.spawning = False
 
     @classmethod
@@ -30,6 +30,9 @@ class WaveGenerator:
     def can_start_spawning(self) -> bool:
         return not self.spawning and self.current_wave_index < len(self.waves)
 
+    def is_finished(self) -> bool:
+        return self.current_wave_index == len(self.waves)
+
     def start_spawning(self) -> bool:
         if not self.can_start_spawning():
             return False
@@ -45,11 +48,12 @@ class WaveGenerator:
             self.current_wave_index += 1
             self.current_monster_index = 0
             return None
-        self.countdown.update(timestep)
-        if not self.countdown.ended():
+        if self.spawning_time < self.next_spawn_time:
+            self.spawning_time += timestep
+        if self.spawning_time < self.next_spawn_time:
             return None
         duration: int = int(1000 * current_wave.max_ticks * TICK_DURATION_SECONDS)
-        self.countdown.start(duration)
+        self.next_spawn_time = self.spawning_time + duration
         monster_id = current_wave.monster_ids[self.current_monster_index]
         self.current_monster_index += 1
         return monster_id